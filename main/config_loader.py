@@ -5,6 +5,7 @@ Config Loader for Epic1_3 Pipeline
 
 import json
 import logging
+import functools
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 import os
@@ -37,6 +38,7 @@ class ConfigLoader:
         """
         self.config_path = Path(config_path)
         self.config = None
+        self._cache: Dict[str, Any] = {}
         self._load_config()
         self._apply_bulk_operations()
         self._validate_config()
@@ -119,6 +121,24 @@ class ConfigLoader:
 
         logger.info("[OK] Config validation passed")
 
+    def _memo(self, key: str, build):
+        """Build a derived config value once per load; cleared by reload()"""
+        if key not in self._cache:
+            self._cache[key] = build()
+        return self._cache[key]
+
+    def _build_llm_config(self) -> Dict[str, Any]:
+        provider = self.config['llm_provider']
+        llm_settings = self.config['llm_settings'][provider].copy()
+        llm_settings['provider'] = provider
+        return llm_settings
+
+    def _build_enabled_columns(self) -> List[Dict[str, Any]]:
+        schema = self.config['columns']['schema']
+        enabled = [col for col in schema if col.get('enabled', False)]
+        logger.info(f"[OK] Found {len(enabled)} enabled columns out of {len(schema)} total")
+        return enabled
+
     def get_llm_config(self) -> Dict[str, Any]:
         """
         Get LLM configuration for selected provider
@@ -126,10 +146,7 @@ class ConfigLoader:
         Returns:
             Dict containing LLM settings
         """
-        provider = self.config['llm_provider']
-        llm_settings = self.config['llm_settings'][provider].copy()
-        llm_settings['provider'] = provider
-        return llm_settings
+        return self._memo('llm_config', self._build_llm_config).copy()
 
     def get_data_paths(self) -> Dict[str, str]:
         """
@@ -156,10 +173,7 @@ class ConfigLoader:
         Returns:
             List of column definitions with enabled=True
         """
-        schema = self.config['columns']['schema']
-        enabled = [col for col in schema if col.get('enabled', False)]
-        logger.info(f"[OK] Found {len(enabled)} enabled columns out of {len(schema)} total")
-        return enabled
+        return list(self._memo('enabled_columns', self._build_enabled_columns))
 
     def get_all_columns(self) -> List[Dict[str, Any]]:
         """
@@ -238,6 +252,7 @@ class ConfigLoader:
     def reload(self):
         """Reload configuration from file"""
         logger.info("Reloading configuration...")
+        self._cache.clear()
         self._load_config()
         self._apply_bulk_operations()
         self._validate_config()
@@ -251,17 +266,32 @@ class ConfigLoader:
         return f"ConfigLoader(provider={provider}, mode={mode}, enabled_columns={enabled_cols})"
 
 
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(config_path: str, mtime_ns: Optional[int]) -> ConfigLoader:
+    """ConfigLoader per (path, mtime) - an edited file gets a new cache key"""
+    return ConfigLoader(config_path)
+
+
 def load_config(config_path: str = "config.json") -> ConfigLoader:
     """
     Convenience function to load config
 
+    Repeated calls for an unchanged file return the same ConfigLoader instance,
+    shared by every caller: treat it as read-only (mutating its config dicts or
+    calling reload() affects all holders until the file changes).
+
     Args:
         config_path: Path to config.json file
 
     Returns:
         ConfigLoader instance
     """
-    return ConfigLoader(config_path)
+    path = os.path.abspath(config_path)
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        mtime_ns = None  # ConfigLoader raises ConfigLoadError for a missing file
+    return _load_config_cached(path, mtime_ns)
 
 
 # Example usage
@@ -1,5 +1,7 @@
 # Cell 1: config + helpers
 import os, json, imaplib, email
+from email import policy
+from email.parser import BytesFeedParser
 from bs4 import BeautifulSoup
 import pandas as pd
 from urllib.parse import urlparse, parse_qs, urlunparse, urlencode, unquote
@@ -119,6 +121,14 @@ def extract_urls_from_html(html: str):
             urls.append(href)
     return urls
 
+def iter_html_parts(msg):
+    """Yield decoded text/html bodies; text/plain alternatives are never decoded."""
+    for part in msg.walk():
+        if part.is_multipart() or part.get_content_type() != "text/html":
+            continue
+        payload = part.get_payload(decode=True) or b""
+        yield payload.decode(part.get_content_charset() or "utf-8", errors="ignore")
+
 # Cell 4: fetch emails, build input_df, save CSV
 def fetch_alert_links():
     imap = imaplib.IMAP4_SSL(IMAP_HOST)
@@ -133,19 +143,12 @@ def fetch_alert_links():
     for msg_id in ids:
         typ, msg_data = imap.fetch(msg_id, "(RFC822)")
         raw = msg_data[0][1]
-        msg = email.message_from_bytes(raw)
-
-        # Prefer HTML parts
-        if msg.is_multipart():
-            for part in msg.walk():
-                ctype = part.get_content_type()
-                if ctype == "text/html":
-                    html = part.get_payload(decode=True).decode(part.get_content_charset() or "utf-8", errors="ignore")
-                    all_urls.extend(extract_urls_from_html(html))
-        else:
-            if msg.get_content_type() == "text/html":
-                html = msg.get_payload(decode=True).decode(msg.get_content_charset() or "utf-8", errors="ignore")
-                all_urls.extend(extract_urls_from_html(html))
+        parser = BytesFeedParser(policy=policy.default)
+        parser.feed(raw)
+        msg = parser.close()
+
+        for html in iter_html_parts(msg):
+            all_urls.extend(extract_urls_from_html(html))
 
     imap.close()
     imap.logout()
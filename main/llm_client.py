@@ -12,6 +12,22 @@ from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
+# msgspec/orjson are optional - fall back to the stdlib json parser
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# orjson.JSONDecodeError และ json.JSONDecodeError เป็น subclass ของ ValueError
+JSON_PARSE_ERRORS = (ValueError, msgspec.DecodeError) if MSGSPEC_AVAILABLE else (ValueError,)
+
 logger = logging.getLogger(__name__)
 
 
@@ -291,6 +307,7 @@ class LLMClient:
         """
         self.config = config
         self.provider = config['provider']
+        self._decoders: Dict[type, Any] = {}
 
         # Create appropriate client
         if self.provider == 'typhoon':
@@ -358,17 +375,34 @@ class LLMClient:
         logger.warning(f"Could not parse classification result: {content_clean}")
         return 0, response
 
-    def extract_json(self, system_message: str, content: str) -> Tuple[Optional[Dict], LLMResponse]:
+    def _get_decoder(self, schema: type):
+        """Return a cached msgspec decoder for schema (built once per schema type)"""
+        decoder = self._decoders.get(schema)
+        if decoder is None:
+            decoder = msgspec.json.Decoder(schema)
+            self._decoders[schema] = decoder
+        return decoder
+
+    def extract_json(
+        self,
+        system_message: str,
+        content: str,
+        schema: Optional[type] = None
+    ) -> Tuple[Optional[Any], LLMResponse]:
         """
         Extract structured data as JSON
 
         Args:
             system_message: System prompt for extraction
             content: Content to extract from
+            schema: Optional msgspec.Struct type to decode into (requires msgspec)
 
         Returns:
-            Tuple of (extracted_dict, LLMResponse)
+            Tuple of (extracted_dict or schema instance, LLMResponse)
         """
+        if schema is not None and not MSGSPEC_AVAILABLE:
+            raise LLMClientError("msgspec is required for typed extraction (pip install msgspec)")
+
         response = self.generate(system_message, content)
 
         if not response.success:
@@ -386,11 +420,16 @@ class LLMClient:
                 content_clean = '\n'.join(lines[1:-1])
 
             # Parse JSON
-            extracted_data = json.loads(content_clean)
+            if schema is not None:
+                extracted_data = self._get_decoder(schema).decode(content_clean.encode('utf-8'))
+            elif ORJSON_AVAILABLE:
+                extracted_data = orjson.loads(content_clean)
+            else:
+                extracted_data = json.loads(content_clean)
             logger.debug(f"Extraction successful ({response.response_time_ms}ms)")
             return extracted_data, response
 
-        except json.JSONDecodeError as e:
+        except JSON_PARSE_ERRORS as e:
             logger.error(f"Failed to parse JSON: {e}")
             logger.debug(f"Response content: {response.content[:200]}...")
             return None, response
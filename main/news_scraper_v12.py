@@ -0,0 +1,180 @@
+import os
+import asyncio
+import pandas as pd
+from typing import Optional
+from tqdm.auto import tqdm
+from playwright.async_api import async_playwright
+import trafilatura
+from bs4 import BeautifulSoup
+# httpx is optional - without it every URL goes through Playwright
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+# pyarrow is optional - used to run the URL domain filters in one Arrow pass
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120 Safari/537.36"
+
+# Only the HTML is needed for trafilatura - skip everything else the page pulls in
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet", "websocket"}
+CHROMIUM_ARGS = ["--disable-gpu", "--no-sandbox", "--disable-dev-shm-usage", "--blink-settings=imagesEnabled=false"]
+
+# Plain-HTTP results shorter than this are assumed to need JS rendering
+FAST_PATH_MIN_CHARS = 200
+FAST_PATH_TIMEOUT_S = 15
+
+DROP_URL_PATTERN = 'ebs-ddce\\.ddc\\.moph\\.go\\.th'
+SKIP_URL_PATTERN = 'youtube|facebook|docs\\.google'
+
+def url_filter_masks(urls: pd.Series):
+    """Return (drop_mask, skip_mask) as numpy bool arrays, one scan per pattern."""
+    urls = urls.astype(str)
+    if PYARROW_AVAILABLE:
+        arr = pa.array(urls.to_numpy(dtype=object), type=pa.string(), from_pandas=True)
+        drop = pc.fill_null(pc.match_substring_regex(arr, DROP_URL_PATTERN, ignore_case=True), False)
+        skip = pc.fill_null(pc.match_substring_regex(arr, SKIP_URL_PATTERN, ignore_case=True), False)
+        return drop.to_numpy(zero_copy_only=False), skip.to_numpy(zero_copy_only=False)
+    drop = urls.str.contains(DROP_URL_PATTERN, case=False, na=False).to_numpy()
+    skip = urls.str.contains(SKIP_URL_PATTERN, case=False, na=False).to_numpy()
+    return drop, skip
+
+def extract_article_text(html: str) -> str:
+    if not html:
+        return ""
+    try:
+        txt = trafilatura.extract(html, include_comments=False, include_tables=False, favor_precision=True)
+        if txt and txt.strip():
+            return txt.strip()
+    except Exception:
+        pass
+    try:
+        soup = BeautifulSoup(html, "lxml")
+        paras = [p.get_text(" ", strip=True) for p in soup.find_all("p")]
+        return "\n".join([t for t in paras if t])
+    except Exception:
+        return ""
+
+async def fetch_html_async(page, url: str, timeout_ms: int = 30000, wait_until: str = "domcontentloaded") -> Optional[str]:
+    try:
+        await page.goto(url, timeout=timeout_ms, wait_until=wait_until)
+        return await page.content()
+    except Exception as e:
+        print(f"[fetch_html] Failed for {url}: {e}")
+        return None
+
+async def fast_fetch_html_async(client, url: str) -> Optional[str]:
+    try:
+        r = await client.get(url)
+        if r.status_code != 200 or 'text/html' not in r.headers.get('content-type', ''):
+            return None
+        return r.text
+    except Exception:
+        return None
+
+async def block_heavy_resources(route):
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+async def fast_scrape_async(df: pd.DataFrame, indices: list) -> list:
+    """Try a bare HTTP GET for each row; return the indices that still need Playwright."""
+    pending = []
+    async with httpx.AsyncClient(headers={"User-Agent": USER_AGENT}, follow_redirects=True, timeout=FAST_PATH_TIMEOUT_S) as client:
+        for idx in tqdm(indices, desc="fast fetch"):
+            html = await fast_fetch_html_async(client, str(df.at[idx, 'url']))
+            text = extract_article_text(html)
+            if len(text) >= FAST_PATH_MIN_CHARS:
+                df.at[idx, 'content'] = text
+                df.at[idx, 'scrape_status'] = 'ok'
+            else:
+                pending.append(idx)
+    return pending
+
+async def browser_scrape_async(df: pd.DataFrame, indices: list) -> None:
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+        context = await browser.new_context(user_agent=USER_AGENT)
+        await context.route("**/*", block_heavy_resources)
+        page = await context.new_page()
+        try:
+            for idx in tqdm(indices, desc="browser fetch"):
+                url = str(df.at[idx, 'url'])
+                html = await fetch_html_async(page, url)
+                if not html:
+                    df.at[idx, 'scrape_status'] = 'error: fetch'
+                    continue
+                text = extract_article_text(html)
+                if text:
+                    df.at[idx, 'content'] = text
+                    df.at[idx, 'scrape_status'] = 'ok'
+                else:
+                    df.at[idx, 'scrape_status'] = 'error: extract'
+        finally:
+            await page.close()
+            await context.close()
+            await browser.close()
+
+async def scrape_all_async(df: pd.DataFrame) -> pd.DataFrame:
+    to_fetch = []
+    for idx, row in df.iterrows():
+        if row.get('skip', False):
+            df.at[idx, 'scrape_status'] = 'skipped: platform'
+        else:
+            to_fetch.append(idx)
+
+    # Most news sites render server-side, so only fall back to Chromium when needed
+    if HTTPX_AVAILABLE:
+        to_fetch = await fast_scrape_async(df, to_fetch)
+    if to_fetch:
+        await browser_scrape_async(df, to_fetch)
+    return df
+
+def main(input_csv: str = "/SS5ฝึกงาน/google_alert_new/input_df.csv", out_csv: str = "prepare_data.csv"):
+    if not os.path.exists(input_csv):
+        raise FileNotFoundError(f"Input CSV not found: {input_csv}")
+
+    df = pd.read_csv(input_csv)
+
+    # Normalize URL column
+    if "url" not in df.columns:
+        for cand in ["URL","Url","link","Link","href","Href"]:
+            if cand in df.columns:
+                df = df.rename(columns={cand: "url"})
+                break
+    if "url" not in df.columns:
+        raise KeyError("No URL-like column found (expected one of url/link/href)")
+
+    # Domain filtering
+    drop_mask, skip_mask = url_filter_masks(df['url'])
+    keep = ~drop_mask
+    df = df.loc[keep].copy()
+    df['skip'] = skip_mask[keep]
+
+    # Ensure columns
+    if 'scrape_status' not in df.columns:
+        df['scrape_status'] = ''
+    if 'content' not in df.columns:
+        df['content'] = ''
+
+    # Run scraping
+    asyncio.run(scrape_all_async(df))
+
+    # Save
+    df.to_csv(out_csv, index=False, encoding="utf-8")
+    print(f"Saved to {out_csv}. Rows: {len(df)} | OK: {(df['scrape_status']=='ok').sum()} | Skipped: {(df['scrape_status']=='skipped: platform').sum()}")
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--input_csv", default="input_df.csv")
+    parser.add_argument("--out_csv", default="prepare_data.csv")
+    args = parser.parse_args()
+    main(args.input_csv, args.out_csv)
\ No newline at end of file
@@ -10,10 +10,16 @@ Usage:
 """
 
 import logging
+import logging.handlers
 import argparse
+import atexit
+import functools
+import queue
 import sys
+import time
 from pathlib import Path
 from datetime import datetime
+from typing import Optional
 
 # Load environment variables from .env file
 from dotenv import load_dotenv
@@ -30,23 +36,91 @@ from extraction_engine import ExtractionEngine
 Path('logs').mkdir(parents=True, exist_ok=True)
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('logs/pipeline.log'),
-        logging.StreamHandler()
-    ]
+# Pipeline threads only enqueue records; a listener thread formats and writes them
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+LOG_BUFFER_SIZE = 64 * 1024
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler backed by a 64 KB write buffer that is not flushed after every record"""
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=LOG_BUFFER_SIZE,
+                    encoding=self.encoding, errors=self.errors)
+
+    def emit(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
+class BatchMemoryHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that flushes its target once after writing out each batch"""
+
+    def flush(self):
+        super().flush()
+        with self.lock:
+            if self.target:
+                self.target.flush()
+
+
+@functools.lru_cache(maxsize=4)
+def _format_second(epoch_second: int) -> str:
+    """Local timestamp for one whole second; records in the same second share it"""
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(epoch_second))
+
+
+class FastFormatter(logging.Formatter):
+    """LOG_FORMAT with the fields inlined and strftime cached per second"""
+
+    def format(self, record):
+        record.message = record.getMessage()
+        s = (f"{_format_second(int(record.created))},{int(record.msecs):03d}"
+             f" - {record.name} - {record.levelname} - {record.message}")
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            s = s + "\n" + record.exc_text
+        if record.stack_info:
+            s = s + "\n" + self.formatStack(record.stack_info)
+        return s
+
+
+log_queue = queue.SimpleQueue()
+_log_formatter = FastFormatter(LOG_FORMAT)
+_file_handler = BufferedFileHandler('logs/pipeline.log')
+_file_handler.setFormatter(_log_formatter)
+# Buffer file records and write them in batches; ERROR and above flush immediately
+_file_buffer = BatchMemoryHandler(
+    capacity=1024, flushLevel=logging.ERROR, target=_file_handler
+)
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(_log_formatter)
+
+log_listener = logging.handlers.QueueListener(
+    log_queue, _file_buffer, _stream_handler, respect_handler_level=True
 )
+_queue_handler = logging.handlers.QueueHandler(log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))  # final format is applied by the listener
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
+log_listener.start()
+# atexit runs in reverse order: stop the listener first, then flush the buffer
+atexit.register(_file_buffer.flush)
+atexit.register(log_listener.stop)
 logger = logging.getLogger(__name__)
 
 
-def setup_logging(config: ConfigLoader):
+def setup_logging(config: ConfigLoader, level_override: Optional[int] = None):
     """
     Setup logging based on config
 
     Args:
         config: ConfigLoader instance
+        level_override: Level from --verbose/--quiet; takes precedence over config
     """
     log_config = config.get_advanced_config('logging')
 
@@ -57,11 +131,14 @@ def setup_logging(config: ConfigLoader):
     # Set log level
     level_str = log_config.get('level', 'INFO')
     level = getattr(logging, level_str, logging.INFO)
+    if level_override is not None:
+        level = level_override
+        level_str = logging.getLevelName(level)
 
     # Update logging configuration
     logging.getLogger().setLevel(level)
 
-    logger.info(f"[OK] Logging configured: level={level_str}, file={log_file}")
+    logger.info("[OK] Logging configured: level=%s, file=%s", level_str, log_file)
 
 
 def print_banner():
@@ -84,48 +161,59 @@ def print_config_summary(config: ConfigLoader):
     Args:
         config: ConfigLoader instance
     """
-    logger.info("\n" + "="*60)
-    logger.info("CONFIGURATION SUMMARY")
-    logger.info("="*60)
+    # Skip building the summary entirely when INFO is filtered out (--quiet)
+    if not logger.isEnabledFor(logging.INFO):
+        return
 
-    # LLM config
     llm_config = config.get_llm_config()
-    logger.info(f"LLM Provider:")
-    logger.info(f"  Provider: {llm_config['provider']}")
-    logger.info(f"  Model: {llm_config['model']}")
-    logger.info(f"  Temperature: {llm_config['temperature']}")
-    logger.info(f"  Max Tokens: {llm_config['max_tokens']}")
-
-    # Data paths
     paths = config.get_data_paths()
-    logger.info(f"\nData Paths:")
-    logger.info(f"  Input: {paths['input_file']}")
-    logger.info(f"  Base: {paths['base_file']}")
-    logger.info(f"  Output (filled): {paths['output_filled_file']}")
-    logger.info(f"  Output (heat_data): {paths['output_heat_data_file']}")
-
-    # Processing config
     proc_config = config.get_processing_config()
-    logger.info(f"\nProcessing:")
-    logger.info(f"  Mode: {proc_config['mode']}")
-    logger.info(f"  Batch size: {proc_config['batch_size']}")
-    logger.info(f"  Skip processed: {proc_config['skip_processed_records']}")
-
-    # Enabled columns
     enabled_cols = config.get_enabled_columns()
-    logger.info(f"\nEnabled Columns: {len(enabled_cols)}")
 
-    logger.info("="*60 + "\n")
+    # Build the whole summary and emit it as a single log record
+    lines = [
+        "\n" + "="*60,
+        "CONFIGURATION SUMMARY",
+        "="*60,
+
+        # LLM config
+        "LLM Provider:",
+        f"  Provider: {llm_config['provider']}",
+        f"  Model: {llm_config['model']}",
+        f"  Temperature: {llm_config['temperature']}",
+        f"  Max Tokens: {llm_config['max_tokens']}",
+
+        # Data paths
+        "\nData Paths:",
+        f"  Input: {paths['input_file']}",
+        f"  Base: {paths['base_file']}",
+        f"  Output (filled): {paths['output_filled_file']}",
+        f"  Output (heat_data): {paths['output_heat_data_file']}",
+
+        # Processing config
+        "\nProcessing:",
+        f"  Mode: {proc_config['mode']}",
+        f"  Batch size: {proc_config['batch_size']}",
+        f"  Skip processed: {proc_config['skip_processed_records']}",
+
+        # Enabled columns
+        f"\nEnabled Columns: {len(enabled_cols)}",
+
+        "="*60 + "\n",
+    ]
+    logger.info("%s", "\n".join(lines))
 
 
-def run_pipeline(config_path: str = "config.json"):
+def run_pipeline(config_path: str = "config.json", log_level: Optional[int] = None):
     """
     Run the complete extraction pipeline
 
     Args:
         config_path: Path to config.json file
+        log_level: Optional log level override (from --verbose/--quiet)
     """
     start_time = datetime.now()
+    start_ns = time.perf_counter_ns()
 
     try:
         # Print banner
@@ -139,7 +227,7 @@ def run_pipeline(config_path: str = "config.json"):
         logger.info(f"[OK] Configuration loaded: {config}")
 
         # Setup logging
-        setup_logging(config)
+        setup_logging(config, log_level)
 
         # Print configuration summary
         print_config_summary(config)
@@ -157,9 +245,8 @@ def run_pipeline(config_path: str = "config.json"):
         engine.run()
 
         # Calculate total time
+        total_seconds = (time.perf_counter_ns() - start_ns) / 1e9
         end_time = datetime.now()
-        duration = end_time - start_time
-        total_seconds = duration.total_seconds()
 
         # Print final summary
         logger.info("\n" + "="*60)
@@ -232,11 +319,23 @@ For more information, see README.md
         help='Enable verbose (DEBUG) logging'
     )
 
+    parser.add_argument(
+        '--quiet', '-q',
+        action='store_true',
+        help='Only log warnings and errors'
+    )
+
     args = parser.parse_args()
 
-    # Set verbose logging if requested
+    # Set verbose/quiet logging if requested
+    log_level = None
     if args.verbose:
-        logging.getLogger().setLevel(logging.DEBUG)
+        log_level = logging.DEBUG
+    elif args.quiet:
+        log_level = logging.WARNING
+
+    if log_level is not None:
+        logging.getLogger().setLevel(log_level)
         logger.debug("Verbose logging enabled")
 
     # Dry run - just validate config
@@ -258,7 +357,7 @@ For more information, see README.md
             return 1
 
     # Run full pipeline
-    exit_code = run_pipeline(args.config)
+    exit_code = run_pipeline(args.config, log_level)
     sys.exit(exit_code)
 
 
@@ -4,7 +4,9 @@ Scraper ที่ฉลาดขึ้น - จะ scrape เฉพาะ URL 
 """
 
 import pandas as pd
+import numpy as np
 import asyncio
+import csv
 import logging
 from pathlib import Path
 from typing import List, Dict, Tuple
@@ -14,16 +16,87 @@ import os
 # เพิ่ม path สำหรับ import modules
 sys.path.append(str(Path(__file__).parent))
 
-# Import scraper module
-import importlib.util
-spec = importlib.util.spec_from_file_location("news_scraper", "news_scraper_1.2.py")
-news_scraper_module = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(news_scraper_module)
+# Import scraper module (ปกติผ่าน sys.path - ใช้ .pyc cache และไม่ขึ้นกับ CWD)
+import news_scraper_v12 as news_scraper_module
+
+# pyarrow is optional - multithreaded native CSV parsing for prepare_data.csv
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pac
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# content ที่สั้นกว่านี้ถือว่ายังไม่ได้ scrape
+MIN_CONTENT_CHARS = 10
+
+# จำนวนแถวต่อ chunk ตอนอ่าน prepare_data.csv (คุม peak memory)
+READ_CHUNK_ROWS = 50_000
+CSV_DTYPES = {'url': 'string', 'content': 'string', 'scrape_status': 'string'}
+ARROW_BLOCK_SIZE = 8 << 20
+
+# dtype ของ string column ที่สร้างใหม่ - Arrow ถ้ามี เพื่อให้ .str.len() ใช้ utf8_length kernel
+STRING_DTYPE = pd.ArrowDtype(pa.string()) if PYARROW_AVAILABLE else 'string'
+
+def content_valid_mask(content: pd.Series) -> np.ndarray:
+    """
+    Boolean mask ของแถวที่มี content แล้ว (string ยาวกว่า MIN_CONTENT_CHARS)
+
+    NaN/ค่าที่ไม่ใช่ string นับความยาวเป็น 0 ส่วน '' และ 'None' ตกไปเองเพราะสั้นกว่าเกณฑ์
+    """
+    if content.dtype == object and PYARROW_AVAILABLE:
+        # object column ที่มีแต่ string/NaN -> แปลงเป็น Arrow ก่อน (ค่าชนิดอื่นปนอยู่ก็ใช้ทางเดิม)
+        try:
+            content = content.astype(STRING_DTYPE)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass
+
+    if pd.api.types.is_string_dtype(content.dtype):
+        # string/Arrow dtype -> .str.len() ทำงานใน native kernel
+        lens = content.str.len().fillna(0).to_numpy(dtype=np.int64)
+    else:
+        values = content.to_numpy(dtype=object)
+        lens = np.fromiter(
+            (len(x) if isinstance(x, str) else 0 for x in values),
+            dtype=np.int64,
+            count=len(values)
+        )
+    return lens > MIN_CONTENT_CHARS
+
+def iter_csv_chunks(input_file: str):
+    """
+    อ่าน CSV ทีละ chunk - ใช้ pyarrow streaming reader ถ้ามี ไม่งั้นใช้ pandas
+
+    index ของแต่ละ chunk คือเลขแถวในไฟล์ (นับต่อเนื่องข้าม chunk)
+    """
+    if PYARROW_AVAILABLE:
+        # ทุก column เป็น string - Arrow อนุมาน type จาก block แรกเท่านั้น
+        # (column ตัวเลขที่มี 'abc' ใน block หลังจะ ArrowInvalid กลางไฟล์)
+        # และค่าถูกเขียนกลับแบบเดิมทุกตัวอักษร; ช่องว่างเป็น null เหมือน pandas
+        with open(input_file, 'r', encoding='utf-8-sig', newline='') as f:
+            header = next(csv.reader(f), [])
+        reader = pac.open_csv(
+            input_file,
+            read_options=pac.ReadOptions(use_threads=True, block_size=ARROW_BLOCK_SIZE),
+            convert_options=pac.ConvertOptions(
+                column_types={col: pa.string() for col in header},
+                strings_can_be_null=True
+            )
+        )
+        offset = 0
+        for batch in reader:
+            chunk = batch.to_pandas(types_mapper=pd.ArrowDtype)
+            # index ต่อเนื่องทั้งไฟล์ (เหมือน pandas chunksize) เพื่อ map ผล scrape กลับได้
+            chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+            offset += len(chunk)
+            yield chunk
+    else:
+        yield from pd.read_csv(input_file, chunksize=READ_CHUNK_ROWS, dtype=CSV_DTYPES)
+
 class SmartIncrementalScraper:
     """
     Smart Scraper ที่จะ scrape เฉพาะ URL ที่ยังไม่มี content
@@ -40,24 +113,16 @@ class SmartIncrementalScraper:
         Returns:
             tuple: (urls_with_content, urls_need_scraping)
         """
-        # URLs ที่มี content แล้ว (ไม่ว่าง และไม่ใช่ NaN)
-        has_content = df[
-            df['content'].notna() &
-            (df['content'] != '') &
-            (df['content'] != 'None') &
-            (df['content'].str.len() > 10)  # มีเนื้อหาอย่างน้อย 10 ตัวอักษร
-        ].copy()
-
-        # URLs ที่ต้อง scrape ใหม่
-        need_scraping = df[
-            df['content'].isna() |
-            (df['content'] == '') |
-            (df['content'] == 'None') |
-            (df['content'].str.len() <= 10)
-        ].copy()
-
-        logger.info(f"URLs ที่มี content แล้ว: {len(has_content)}")
-        logger.info(f"URLs ที่ต้อง scrape: {len(need_scraping)}")
+        has_mask = content_valid_mask(df['content'])
+
+        # ไม่ต้อง copy - process_prepare_data รวม need_scraping ด้วย pd.concat
+        # ได้ frame ใหม่ก่อนส่งให้ scraper เขียนค่าลงไป
+        has_content = df[has_mask]
+        need_scraping = df[~has_mask]
+
+        # เรียกทุก chunk - ยอดรวมอยู่ใน summary ของ process_prepare_data
+        logger.debug("URLs ที่มี content แล้ว: %d", len(has_content))
+        logger.debug("URLs ที่ต้อง scrape: %d", len(need_scraping))
 
         return has_content, need_scraping
 
@@ -84,69 +149,122 @@ class SmartIncrementalScraper:
             # ถ้า scrape ล้มเหลว ให้ส่งคืนข้อมูลเดิม
             return df_to_scrape
 
-    async def process_prepare_data(self, input_file: str, output_file: str = None) -> pd.DataFrame:
+    async def process_prepare_data(self, input_file: str, output_file: str = None) -> Dict:
         """
         ประมวลผล prepare_data.csv แบบ incremental
 
+        อ่านไฟล์ทีละ chunk สองรอบ: รอบแรกเก็บเฉพาะแถวที่ต้อง scrape ไว้ในหน่วยความจำ
+        รอบสองเขียนทุกแถวตามลำดับเดิม โดยแทนค่า content/scrape_status ของแถวที่ scrape ใหม่
+        ถ้าไม่มีแถวที่ต้อง scrape และเขียนทับไฟล์เดิม จะข้ามรอบสอง (ไม่เขียนไฟล์เลย)
+
         Args:
             input_file: path ไปยัง prepare_data.csv
             output_file: path สำหรับบันทึกผลลัพธ์ (ถ้าไม่ระบุจะใช้ชื่อเดิม)
+
+        Returns:
+            dict สรุปผลการ scraping
         """
         logger.info(f"อ่านข้อมูลจาก: {input_file}")
 
-        # อ่านข้อมูล
-        df = pd.read_csv(input_file)
-        logger.info(f"พบข้อมูล {len(df)} รายการ")
-
-        # ตรวจสอบ columns ที่จำเป็น
+        # ตรวจสอบ columns ที่จำเป็น (อ่านเฉพาะ header)
         required_columns = ['url']
-        missing_columns = [col for col in required_columns if col not in df.columns]
+        header = pd.read_csv(input_file, nrows=0).columns
+        missing_columns = [col for col in required_columns if col not in header]
 
         if missing_columns:
             raise ValueError(f"ไม่พบ columns ที่จำเป็น: {missing_columns}")
 
-        # เพิ่ม columns ที่ขาดหาย
-        if 'content' not in df.columns:
-            df['content'] = ''
-        if 'scrape_status' not in df.columns:
-            df['scrape_status'] = ''
+        if output_file is None:
+            output_file = input_file  # เขียนทับไฟล์เดิม
 
-        # แยก URLs ที่มี content แล้วกับที่ยังไม่มี
-        has_content_df, need_scraping_df = self.check_content_status(df)
+        # รอบแรก: แยก URLs ที่ยังไม่มี content (index = เลขแถวในไฟล์)
+        total_rows = 0
+        status_counts: Dict[str, int] = {}
+        need_scraping_parts: List[pd.DataFrame] = []
 
-        # Scrape เฉพาะที่ยังไม่มี content
-        if len(need_scraping_df) > 0:
-            newly_scraped_df = await self.scrape_missing_content(need_scraping_df)
+        for chunk in iter_csv_chunks(input_file):
+            self._ensure_columns(chunk)
+            has_content_df, need_scraping_df = self.check_content_status(chunk)
 
-            # รวมข้อมูลที่มี content แล้วกับที่ scrape ใหม่
-            final_df = pd.concat([has_content_df, newly_scraped_df], ignore_index=True)
-        else:
-            final_df = has_content_df.copy()
-
-        # เรียงลำดับตาม URL เพื่อให้ผลลัพธ์สม่ำเสมอ
-        final_df = final_df.sort_values('url').reset_index(drop=True)
+            total_rows += len(chunk)
+            self._count_statuses(has_content_df, status_counts)
+            if len(need_scraping_df) > 0:
+                need_scraping_parts.append(need_scraping_df)
 
-        # บันทึกผลลัพธ์
-        if output_file is None:
-            output_file = input_file  # เขียนทับไฟล์เดิม
+        logger.info(f"พบข้อมูล {total_rows} รายการ")
 
-        final_df.to_csv(output_file, index=False, encoding='utf-8')
-        logger.info(f"บันทึกผลลัพธ์ไปที่: {output_file}")
+        # Scrape เฉพาะที่ยังไม่มี content
+        scraped_df = None
+        newly_scraped = 0
+        if need_scraping_parts:
+            need_scraping_df = pd.concat(need_scraping_parts)
+            need_scraping_parts.clear()
+            newly_scraped = len(need_scraping_df)
+
+            scraped_df = await self.scrape_missing_content(need_scraping_df)
+            scraped_df = scraped_df[['content', 'scrape_status']]
+            self._count_statuses(scraped_df, status_counts)
+
+        if scraped_df is None and Path(output_file).resolve() == Path(input_file).resolve():
+            # ทุกแถวมี content แล้ว และเขียนทับไฟล์เดิม -> ไม่มีอะไรเปลี่ยน ไม่ต้องเขียนใหม่
+            logger.info(f"ไม่มีแถวที่เปลี่ยนแปลง - ไม่เขียนทับ {output_file}")
+        else:
+            self._write_merged(input_file, output_file, scraped_df)
+            logger.info(f"บันทึกผลลัพธ์ไปที่: {output_file}")
 
         # สรุปผลลัพธ์
         summary = {
-            'total_urls': len(final_df),
-            'already_had_content': len(has_content_df),
-            'newly_scraped': len(need_scraping_df),
-            'successful_scrapes': len(final_df[final_df['scrape_status'] == 'success']),
-            'failed_scrapes': len(final_df[final_df['scrape_status'] == 'failed'])
+            'total_urls': total_rows,
+            'already_had_content': total_rows - newly_scraped,
+            'newly_scraped': newly_scraped,
+            'successful_scrapes': status_counts.get('success', 0),
+            'failed_scrapes': status_counts.get('failed', 0)
         }
 
         logger.info("=== สรุปผลการ Scraping ===")
         for key, value in summary.items():
             logger.info(f"{key}: {value}")
 
-        return final_df
+        return summary
+
+    def _write_merged(self, input_file: str, output_file: str, scraped_df: pd.DataFrame = None):
+        """
+        รอบสอง: เขียนทุกแถวตามลำดับเดิม แทนค่าแถวที่ scrape ใหม่จาก scraped_df
+
+        เขียนลงไฟล์ชั่วคราวก่อน เพราะ output อาจเป็นไฟล์เดียวกับ input ที่กำลังอ่านอยู่
+        """
+        tmp_file = f"{output_file}.tmp"
+        first = True
+
+        with open(tmp_file, 'w', encoding='utf-8', newline='') as out:
+            for chunk in iter_csv_chunks(input_file):
+                self._ensure_columns(chunk)
+
+                if scraped_df is not None and len(chunk) > 0:
+                    # index ของ scraped_df เรียงอยู่แล้ว -> slice ตามช่วงแถวของ chunk
+                    updates = scraped_df.loc[chunk.index[0]:chunk.index[-1]]
+                    if len(updates) > 0:
+                        chunk.update(updates)
+
+                chunk.to_csv(out, header=first, index=False)
+                first = False
+
+        os.replace(tmp_file, output_file)
+
+    @staticmethod
+    def _ensure_columns(chunk: pd.DataFrame):
+        """เพิ่ม columns content/scrape_status ที่ขาดหาย"""
+        for col in ('content', 'scrape_status'):
+            if col not in chunk.columns:
+                chunk[col] = pd.Series('', index=chunk.index, dtype=STRING_DTYPE)
+
+    @staticmethod
+    def _count_statuses(df: pd.DataFrame, counts: Dict[str, int]):
+        """สะสมจำนวนแถวต่อ scrape_status ลงใน counts"""
+        if 'scrape_status' not in df.columns:
+            return
+        for status, n in df['scrape_status'].value_counts().items():
+            counts[status] = counts.get(status, 0) + int(n)
 
 def create_sample_prepare_data(output_file: str = "prepare_data.csv"):
     """
@@ -217,7 +335,7 @@ async def main():
     scraper = SmartIncrementalScraper()
 
     try:
-        result_df = await scraper.process_prepare_data(args.input, args.output)
+        await scraper.process_prepare_data(args.input, args.output)
         logger.info("Smart Scraping เสร็จสิ้น!")
 
     except Exception as e:
@@ -225,4 +343,10 @@ async def main():
         sys.exit(1)
 
 if __name__ == "__main__":
+    # uvloop ลด overhead ของ event loop (Linux/macOS) - ถ้าไม่มีใช้ loop ปกติ
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
\ No newline at end of file
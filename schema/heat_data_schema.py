@@ -6,48 +6,128 @@ including all 40+ columns with their data types, validation rules, and
 business logic constraints.
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Union, Any, Tuple
-from enum import Enum
+from typing import Dict, FrozenSet, List, Mapping, Optional, Pattern, Union, Any, Tuple
+from enum import IntEnum
+import functools
 import re
+import sys
+import types
 
+import numpy as np
+import pandas as pd
 
-class ColumnType(Enum):
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep __dict__
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+# Validation patterns, compiled once at import time
+_DATE_RE = re.compile(r'\d{1,2}/\d{1,2}/\d{4}')
+_TIME_RE = re.compile(r'^([0-1]?[0-9]|2[0-3]):[0-5][0-9](:[0-5][0-9])?$')
+_ICD10_RE = re.compile(r'^[A-Z]\d{2}(\.\d{1,2})?$')
+_SCR_RE = re.compile(r'^สคร\.\s*\d{1,2}$')
+
+
+class _NamedIntEnum(IntEnum):
+    """IntEnum that still accepts the legacy lowercase string values, e.g. ColumnType('integer')"""
+    
+    @classmethod
+    def _missing_(cls, value):
+        if isinstance(value, str):
+            return cls.__members__.get(value.upper())
+        return None
+
+
+class ColumnType(_NamedIntEnum):
     """Enumeration of supported column data types"""
-    INTEGER = "integer"
-    FLOAT = "float"
-    DATE = "date"
-    TIME = "time"
-    BOOLEAN = "boolean"
-    MULTICLASS = "multiclass"
-    TEXT = "text"
+    INTEGER = 1
+    FLOAT = 2
+    DATE = 3
+    TIME = 4
+    BOOLEAN = 5
+    MULTICLASS = 6
+    TEXT = 7
 
 
-class ValidationRule(Enum):
+class ValidationRule(_NamedIntEnum):
     """Enumeration of validation rules"""
-    REQUIRED = "required"
-    RANGE = "range"
-    PATTERN = "pattern"
-    VOCABULARY = "vocabulary"
-    LENGTH = "length"
-    ENCODING = "encoding"
+    REQUIRED = 1
+    RANGE = 2
+    PATTERN = 3
+    VOCABULARY = 4
+    LENGTH = 5
+    ENCODING = 6
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ColumnSpec:
-    """Specification for a single column in the heat data schema"""
+    """
+    Specification for a single column in the heat data schema (immutable)
+    
+    Each validation rule is its own typed field (None = rule not applied),
+    so validators read attributes instead of hashing into a rules dict.
+    """
     name: str
     display_name: str
     data_type: ColumnType
     required: bool = False
     default_value: Optional[str] = None
-    validation_rules: Dict[ValidationRule, Any] = None
     description: str = ""
+    # ValidationRule.RANGE
+    range_min: Optional[float] = None
+    range_max: Optional[float] = None
+    # ValidationRule.PATTERN
+    pattern: Optional[Pattern[str]] = None
+    # ValidationRule.VOCABULARY
+    vocabulary: Optional[FrozenSet[str]] = None
+    # ValidationRule.LENGTH (min_length only applies when max_length is set)
+    min_length: int = 0
+    max_length: Optional[int] = None
+    # ValidationRule.ENCODING
+    encoding: Optional[str] = None
+    
+    @property
+    def validation_rules(self) -> Dict[ValidationRule, Any]:
+        """Rules as a ValidationRule-keyed dict (legacy view, built on demand)"""
+        rules: Dict[ValidationRule, Any] = {}
+        if self.range_min is not None or self.range_max is not None:
+            rules[ValidationRule.RANGE] = (self.range_min, self.range_max)
+        if self.pattern is not None:
+            rules[ValidationRule.PATTERN] = self.pattern
+        if self.vocabulary is not None:
+            rules[ValidationRule.VOCABULARY] = self.vocabulary
+        if self.max_length is not None:
+            rules[ValidationRule.LENGTH] = (self.min_length, self.max_length)
+        if self.encoding is not None:
+            rules[ValidationRule.ENCODING] = self.encoding
+        return rules
+
+
+# Batch validator class (in the validators package) for each column type
+_VALIDATOR_CLASS_NAMES = {
+    ColumnType.INTEGER: 'IntegerValidator',
+    ColumnType.FLOAT: 'FloatValidator',
+    ColumnType.DATE: 'DateProcessor',
+    ColumnType.TIME: 'TimeProcessor',
+    ColumnType.BOOLEAN: 'BooleanMapper',
+    ColumnType.MULTICLASS: 'MulticlassValidator',
+    ColumnType.TEXT: 'TextProcessor',
+}
+
+
+def _validate_column(data_type: ColumnType, col_name: str, values: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Validate one column with a fresh validator for its type
     
-    def __post_init__(self):
-        """Initialize validation rules if None"""
-        if self.validation_rules is None:
-            self.validation_rules = {}
+    Module level (not a method) so a process pool can pickle it; the
+    validator is built inside the worker rather than shipped to it.
+    """
+    import validators  # lazy: validators are only needed for whole-frame validation
+    
+    validator = getattr(validators, _VALIDATOR_CLASS_NAMES[data_type])(col_name)
+    return validator.process_batch(values)
 
 
 class HeatDataSchema:
@@ -60,7 +140,8 @@ class HeatDataSchema:
     """
     
     # Exact column order from heat_data_sample.csv
-    COLUMN_ORDER = [
+    # (immutable tuple; names are interned so dict lookups keyed by them hit the identity fast path)
+    COLUMN_ORDER = tuple(sys.intern(name) for name in (
         'ที่', 'จังหวัดที่เกิดเหตุ', 'อำเภอ', 'ตำบล', 'ภาค', 'สคร.', 'ปี', 'สถานะ',
         'ว/ด/ป เสียชีวิต', 'เดือน ที่เสียชีวิต', 'เวลาที่เสียชีวิต', 'เพศ', 'อายุ(ปี)',
         'เชื้อชาติ', 'สัญชาติ', 'อาชีพ', 'ลักษณะงาน', 'โรคประจำตัว', 'โรคประจำตัว(รายละเอียด)',
@@ -69,10 +150,13 @@ class HeatDataSchema:
         'ลักษณะอาการ', 'กิจกรรม/พฤติกรรมเสี่ยงก่อนเกิดเหตุ', 'อุณหภูมิร่างกาย(C°)',
         'ประวัติการสัมผัสความร้อนก่อนเสียชีวิต', 'ICD 10', 'ผลการวินิจฉัย', 'Unnamed: 35',
         'ข้อมูลอื่นๆ', 'หมายเหตุ', 'ที่มาสื่อออนไลน์'
-    ]
+    ))
+    
+    # Expected position of each column, built once for validate_column_order
+    _COLUMN_INDEX: Dict[str, int] = {name: i for i, name in enumerate(COLUMN_ORDER)}
     
-    # Thai province vocabulary
-    THAI_PROVINCES = [
+    # Thai province vocabulary (ordered for display; lookups use the frozenset below)
+    THAI_PROVINCES_ORDER = (
         'กรุงเทพฯ', 'กรุงเทพมหานคร', 'กระบี่', 'กาญจนบุรี', 'กาฬสินธุ์', 'กำแพงเพชร',
         'ขอนแก่น', 'จันทบุรี', 'ฉะเชิงเทรา', 'ชลบุรี', 'ชัยนาท', 'ชัยภูมิ', 'ชุมพร',
         'เชียงราย', 'เชียงใหม่', 'ตรัง', 'ตราด', 'ตาก', 'นครนายก', 'นครปฐม', 'นครพนม',
@@ -85,28 +169,96 @@ class HeatDataSchema:
         'สมุทรสาคร', 'สระแก้ว', 'สระบุรี', 'สิงห์บุรี', 'สุโขทัย', 'สุพรรณบุรี', 'สุราษฎร์ธานี',
         'สุรินทร์', 'หนองคาย', 'หนองบัวลำภู', 'อ่างทอง', 'อำนาจเจริญ', 'อุดรธานี',
         'อุตรดิตถ์', 'อุทัยธานี', 'อุบลราชธานี'
-    ]
+    )
+    THAI_PROVINCES = frozenset(map(sys.intern, THAI_PROVINCES_ORDER))
     
     # Thai regions
-    THAI_REGIONS = [
+    THAI_REGIONS_ORDER = (
         'ภาคเหนือ', 'ภาคกลางและตะวันตก', 'ภาคตะวันออกเฉียงเหนือ', 'ภาคตะวันออก', 'ภาคใต้'
-    ]
+    )
+    THAI_REGIONS = frozenset(THAI_REGIONS_ORDER)
+    
+    # Region -> provinces (6-region geography; central and western provinces share one region here)
+    PROVINCES_BY_REGION: Dict[str, FrozenSet[str]] = {
+        'ภาคเหนือ': frozenset([
+            'เชียงราย', 'เชียงใหม่', 'น่าน', 'พะเยา', 'แพร่', 'แม่ฮ่องสอน', 'ลำปาง', 'ลำพูน', 'อุตรดิตถ์'
+        ]),
+        'ภาคกลางและตะวันตก': frozenset([
+            'กรุงเทพฯ', 'กรุงเทพมหานคร', 'กำแพงเพชร', 'ชัยนาท', 'นครนายก', 'นครปฐม', 'นครสวรรค์',
+            'นนทบุรี', 'ปทุมธานี', 'พระนครศรีอยุธยา', 'พิจิตร', 'พิษณุโลก', 'เพชรบูรณ์', 'ลพบุรี',
+            'สมุทรปราการ', 'สมุทรสงคราม', 'สมุทรสาคร', 'สิงห์บุรี', 'สุโขทัย', 'สุพรรณบุรี', 'สระบุรี',
+            'อ่างทอง', 'อุทัยธานี',
+            'กาญจนบุรี', 'ตาก', 'ประจวบคีรีขันธ์', 'เพชรบุรี', 'ราชบุรี'
+        ]),
+        'ภาคตะวันออกเฉียงเหนือ': frozenset([
+            'กาฬสินธุ์', 'ขอนแก่น', 'ชัยภูมิ', 'นครพนม', 'นครราชสีมา', 'บึงกาฬ', 'บุรีรัมย์',
+            'มหาสารคาม', 'มุกดาหาร', 'ยโสธร', 'ร้อยเอ็ด', 'เลย', 'ศรีสะเกษ', 'สกลนคร', 'สุรินทร์',
+            'หนองคาย', 'หนองบัวลำภู', 'อำนาจเจริญ', 'อุดรธานี', 'อุบลราชธานี'
+        ]),
+        'ภาคตะวันออก': frozenset([
+            'จันทบุรี', 'ฉะเชิงเทรา', 'ชลบุรี', 'ตราด', 'ปราจีนบุรี', 'ระยอง', 'สระแก้ว'
+        ]),
+        'ภาคใต้': frozenset([
+            'กระบี่', 'ชุมพร', 'ตรัง', 'นครศรีธรรมราช', 'นราธิวาส', 'ปัตตานี', 'พังงา', 'พัทลุง',
+            'ภูเก็ต', 'ยะลา', 'ระนอง', 'สงขลา', 'สตูล', 'สุราษฎร์ธานี'
+        ]),
+    }
+    
+    # Province -> region, built once at import for O(1) lookups
+    PROVINCE_TO_REGION: Dict[str, str] = {
+        province: region
+        for region, provinces in PROVINCES_BY_REGION.items()
+        for province in provinces
+    }
     
     # Gender vocabulary
-    GENDER_VOCABULARY = ['ชาย', 'หญิง', 'ไม่ระบุ']
+    GENDER_ORDER = ('ชาย', 'หญิง', 'ไม่ระบุ')
+    GENDER_VOCABULARY = frozenset(GENDER_ORDER)
     
     # Boolean values mapping
-    BOOLEAN_TRUE_VALUES = ['มี', '1', 'True', 'true', 'YES', 'Yes', 'yes', 'ใช่', 'มีการสัมผัส']
-    BOOLEAN_FALSE_VALUES = ['ไม่มี', '0', 'False', 'false', 'NO', 'No', 'no', 'ไม่ใช่', 'ไม่มีการสัมผัส']
+    BOOLEAN_TRUE_VALUES = frozenset(['มี', '1', 'True', 'true', 'YES', 'Yes', 'yes', 'ใช่', 'มีการสัมผัส'])
+    BOOLEAN_FALSE_VALUES = frozenset(['ไม่มี', '0', 'False', 'false', 'NO', 'No', 'no', 'ไม่ใช่', 'ไม่มีการสัมผัส'])
     
     # Status vocabulary
-    STATUS_VOCABULARY = ['เสียชีวิต', 'รอดชีวิต', 'ไม่ระบุ']
+    STATUS_ORDER = ('เสียชีวิต', 'รอดชีวิต', 'ไม่ระบุ')
+    STATUS_VOCABULARY = frozenset(STATUS_ORDER)
+    
+    # Thai month names (ordered January..December)
+    THAI_MONTHS_ORDER = (
+        'มกราคม', 'กุมภาพันธ์', 'มีนาคม', 'เมษายน', 'พฤษภาคม', 'มิถุนายน',
+        'กรกฎาคม', 'สิงหาคม', 'กันยายน', 'ตุลาคม', 'พฤศจิกายน', 'ธันวาคม'
+    )
+    THAI_MONTHS = frozenset(THAI_MONTHS_ORDER)
+    
+    # Combined boolean vocabulary shared by all boolean column specs
+    _BOOLEAN_VOCAB = BOOLEAN_TRUE_VALUES | BOOLEAN_FALSE_VALUES
+    
+    # Low-cardinality columns stored as int8 codes: code = index into the tuple, -1 = missing/unknown
+    # (boolean columns use BOOLEAN_CODES: 0 = false, 1 = true)
+    CATEGORY_CODES: Dict[str, Tuple[str, ...]] = {
+        'จังหวัดที่เกิดเหตุ': THAI_PROVINCES_ORDER,
+        'ภาค': THAI_REGIONS_ORDER,
+        'เพศ': GENDER_ORDER,
+        'สถานะ': STATUS_ORDER,
+        'เดือน ที่เสียชีวิต': THAI_MONTHS_ORDER,
+    }
+    BOOLEAN_CODES = ('0', '1')
+    
+    # Single value -> bool lookup (exact and lowercased spellings) for parse_boolean / Series.map
+    _BOOL_MAP: Dict[str, bool] = {
+        **{v: False for v in BOOLEAN_FALSE_VALUES}, **{v.lower(): False for v in BOOLEAN_FALSE_VALUES},
+        **{v: True for v in BOOLEAN_TRUE_VALUES}, **{v.lower(): True for v in BOOLEAN_TRUE_VALUES},
+    }
     
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def get_schema_definition(cls) -> Dict[str, ColumnSpec]:
         """
         Get complete schema definition with all column specifications
         
+        The schema is built once per class and the same dictionary is
+        returned on every call, so callers must not modify it.
+        
         Returns:
             Dictionary mapping column names to their specifications
         """
@@ -118,9 +270,8 @@ class HeatDataSchema:
                 data_type=ColumnType.FLOAT,
                 required=False,
                 default_value=None,
-                validation_rules={
-                    ValidationRule.RANGE: (1, 99999)
-                },
+                range_min=1,
+                range_max=99999,
                 description='Auto-increment ID number'
             ),
             
@@ -130,9 +281,8 @@ class HeatDataSchema:
                 data_type=ColumnType.INTEGER,
                 required=False,
                 default_value=None,
-                validation_rules={
-                    ValidationRule.RANGE: (2020, 2030)
-                },
+                range_min=2020,
+                range_max=2030,
                 description='Year of incident (Buddhist or Gregorian)'
             ),
             
@@ -142,9 +292,8 @@ class HeatDataSchema:
                 data_type=ColumnType.INTEGER,
                 required=False,
                 default_value=None,
-                validation_rules={
-                    ValidationRule.RANGE: (0, 120)
-                },
+                range_min=0,
+                range_max=120,
                 description='Age in years with clamping 0-120'
             ),
             
@@ -154,9 +303,8 @@ class HeatDataSchema:
                 data_type=ColumnType.FLOAT,
                 required=False,
                 default_value=None,
-                validation_rules={
-                    ValidationRule.RANGE: (-10.0, 60.0)
-                },
+                range_min=-10.0,
+                range_max=60.0,
                 description='Environmental temperature in Celsius'
             ),
             
@@ -166,9 +314,8 @@ class HeatDataSchema:
                 data_type=ColumnType.FLOAT,
                 required=False,
                 default_value=None,
-                validation_rules={
-                    ValidationRule.RANGE: (30.0, 45.0)
-                },
+                range_min=30.0,
+                range_max=45.0,
                 description='Body temperature in Celsius'
             ),
             
@@ -179,9 +326,7 @@ class HeatDataSchema:
                 data_type=ColumnType.DATE,
                 required=False,
                 default_value=None,
-                validation_rules={
-                    ValidationRule.PATTERN: r'\d{1,2}/\d{1,2}/\d{4}'
-                },
+                pattern=_DATE_RE,
                 description='Date of death in M/D/YYYY format, converts to ISO'
             ),
             
@@ -192,9 +337,7 @@ class HeatDataSchema:
                 data_type=ColumnType.TIME,
                 required=False,
                 default_value=None,
-                validation_rules={
-                    ValidationRule.PATTERN: r'^([0-1]?[0-9]|2[0-3]):[0-5][0-9](:[0-5][0-9])?$'
-                },
+                pattern=_TIME_RE,
                 description='Time of death in HH:MM:SS format'
             ),
             
@@ -205,9 +348,7 @@ class HeatDataSchema:
                 data_type=ColumnType.BOOLEAN,
                 required=False,
                 default_value=None,
-                validation_rules={
-                    ValidationRule.VOCABULARY: cls.BOOLEAN_TRUE_VALUES + cls.BOOLEAN_FALSE_VALUES
-                },
+                vocabulary=cls._BOOLEAN_VOCAB,
                 description='Hypertension condition (1/0/NULL)'
             ),
             
@@ -217,9 +358,7 @@ class HeatDataSchema:
                 data_type=ColumnType.BOOLEAN,
                 required=False,
                 default_value=None,
-                validation_rules={
-                    ValidationRule.VOCABULARY: cls.BOOLEAN_TRUE_VALUES + cls.BOOLEAN_FALSE_VALUES
-                },
+                vocabulary=cls._BOOLEAN_VOCAB,
                 description='Diabetes condition (1/0/NULL)'
             ),
             
@@ -229,9 +368,7 @@ class HeatDataSchema:
                 data_type=ColumnType.BOOLEAN,
                 required=False,
                 default_value=None,
-                validation_rules={
-                    ValidationRule.VOCABULARY: cls.BOOLEAN_TRUE_VALUES + cls.BOOLEAN_FALSE_VALUES
-                },
+                vocabulary=cls._BOOLEAN_VOCAB,
                 description='Cardiovascular disease condition (1/0/NULL)'
             ),
             
@@ -241,9 +378,7 @@ class HeatDataSchema:
                 data_type=ColumnType.BOOLEAN,
                 required=False,
                 default_value=None,
-                validation_rules={
-                    ValidationRule.VOCABULARY: cls.BOOLEAN_TRUE_VALUES + cls.BOOLEAN_FALSE_VALUES
-                },
+                vocabulary=cls._BOOLEAN_VOCAB,
                 description='Asthma condition (1/0/NULL)'
             ),
             
@@ -253,9 +388,7 @@ class HeatDataSchema:
                 data_type=ColumnType.BOOLEAN,
                 required=False,
                 default_value=None,
-                validation_rules={
-                    ValidationRule.VOCABULARY: cls.BOOLEAN_TRUE_VALUES + cls.BOOLEAN_FALSE_VALUES
-                },
+                vocabulary=cls._BOOLEAN_VOCAB,
                 description='Liver disease condition (1/0/NULL)'
             ),
             
@@ -265,9 +398,7 @@ class HeatDataSchema:
                 data_type=ColumnType.BOOLEAN,
                 required=False,
                 default_value=None,
-                validation_rules={
-                    ValidationRule.VOCABULARY: cls.BOOLEAN_TRUE_VALUES + cls.BOOLEAN_FALSE_VALUES
-                },
+                vocabulary=cls._BOOLEAN_VOCAB,
                 description='History of heat exposure before death (1/0/NULL)'
             ),
             
@@ -278,9 +409,7 @@ class HeatDataSchema:
                 data_type=ColumnType.MULTICLASS,
                 required=False,
                 default_value=None,
-                validation_rules={
-                    ValidationRule.VOCABULARY: cls.THAI_PROVINCES
-                },
+                vocabulary=cls.THAI_PROVINCES,
                 description='Thai province where incident occurred'
             ),
             
@@ -290,9 +419,7 @@ class HeatDataSchema:
                 data_type=ColumnType.MULTICLASS,
                 required=False,
                 default_value=None,
-                validation_rules={
-                    ValidationRule.VOCABULARY: cls.THAI_REGIONS
-                },
+                vocabulary=cls.THAI_REGIONS,
                 description='Thai geographical region'
             ),
             
@@ -302,9 +429,7 @@ class HeatDataSchema:
                 data_type=ColumnType.MULTICLASS,
                 required=False,
                 default_value=None,
-                validation_rules={
-                    ValidationRule.VOCABULARY: cls.GENDER_VOCABULARY
-                },
+                vocabulary=cls.GENDER_VOCABULARY,
                 description='Gender (Male/Female/Not specified)'
             ),
             
@@ -314,9 +439,7 @@ class HeatDataSchema:
                 data_type=ColumnType.MULTICLASS,
                 required=False,
                 default_value='เสียชีวิต',
-                validation_rules={
-                    ValidationRule.VOCABULARY: cls.STATUS_VOCABULARY
-                },
+                vocabulary=cls.STATUS_VOCABULARY,
                 description='Life status (deceased/survived/unspecified)'
             ),
             
@@ -326,12 +449,7 @@ class HeatDataSchema:
                 data_type=ColumnType.MULTICLASS,
                 required=False,
                 default_value=None,
-                validation_rules={
-                    ValidationRule.VOCABULARY: [
-                        'มกราคม', 'กุมภาพันธ์', 'มีนาคม', 'เมษายน', 'พฤษภาคม', 'มิถุนายน',
-                        'กรกฎาคม', 'สิงหาคม', 'กันยายน', 'ตุลาคม', 'พฤศจิกายน', 'ธันวาคม'
-                    ]
-                },
+                vocabulary=cls.THAI_MONTHS,
                 description='Month of death (derived from date)'
             ),
             
@@ -342,10 +460,8 @@ class HeatDataSchema:
                 data_type=ColumnType.TEXT,
                 required=False,
                 default_value=None,
-                validation_rules={
-                    ValidationRule.LENGTH: (0, 100),
-                    ValidationRule.ENCODING: 'utf-8'
-                },
+                max_length=100,
+                encoding='utf-8',
                 description='District name (amphoe)'
             ),
             
@@ -355,10 +471,8 @@ class HeatDataSchema:
                 data_type=ColumnType.TEXT,
                 required=False,
                 default_value=None,
-                validation_rules={
-                    ValidationRule.LENGTH: (0, 100),
-                    ValidationRule.ENCODING: 'utf-8'
-                },
+                max_length=100,
+                encoding='utf-8',
                 description='Subdistrict name (tambon)'
             ),
             
@@ -368,10 +482,8 @@ class HeatDataSchema:
                 data_type=ColumnType.TEXT,
                 required=False,
                 default_value=None,
-                validation_rules={
-                    ValidationRule.LENGTH: (0, 50),
-                    ValidationRule.PATTERN: r'^สคร\.\s*\d{1,2}$'
-                },
+                max_length=50,
+                pattern=_SCR_RE,
                 description='Health service region (สคร. X)'
             ),
             
@@ -381,10 +493,8 @@ class HeatDataSchema:
                 data_type=ColumnType.TEXT,
                 required=False,
                 default_value=None,
-                validation_rules={
-                    ValidationRule.LENGTH: (0, 50),
-                    ValidationRule.ENCODING: 'utf-8'
-                },
+                max_length=50,
+                encoding='utf-8',
                 description='Ethnicity'
             ),
             
@@ -394,10 +504,8 @@ class HeatDataSchema:
                 data_type=ColumnType.TEXT,
                 required=False,
                 default_value=None,
-                validation_rules={
-                    ValidationRule.LENGTH: (0, 50),
-                    ValidationRule.ENCODING: 'utf-8'
-                },
+                max_length=50,
+                encoding='utf-8',
                 description='Nationality'
             ),
             
@@ -407,10 +515,8 @@ class HeatDataSchema:
                 data_type=ColumnType.TEXT,
                 required=False,
                 default_value=None,
-                validation_rules={
-                    ValidationRule.LENGTH: (0, 100),
-                    ValidationRule.ENCODING: 'utf-8'
-                },
+                max_length=100,
+                encoding='utf-8',
                 description='Occupation'
             ),
             
@@ -420,10 +526,8 @@ class HeatDataSchema:
                 data_type=ColumnType.TEXT,
                 required=False,
                 default_value=None,
-                validation_rules={
-                    ValidationRule.LENGTH: (0, 200),
-                    ValidationRule.ENCODING: 'utf-8'
-                },
+                max_length=200,
+                encoding='utf-8',
                 description='Type of work/job description'
             ),
             
@@ -433,10 +537,8 @@ class HeatDataSchema:
                 data_type=ColumnType.TEXT,
                 required=False,
                 default_value=None,
-                validation_rules={
-                    ValidationRule.LENGTH: (0, 200),
-                    ValidationRule.ENCODING: 'utf-8'
-                },
+                max_length=200,
+                encoding='utf-8',
                 description='Chronic diseases (summary)'
             ),
             
@@ -446,10 +548,8 @@ class HeatDataSchema:
                 data_type=ColumnType.TEXT,
                 required=False,
                 default_value=None,
-                validation_rules={
-                    ValidationRule.LENGTH: (0, 500),
-                    ValidationRule.ENCODING: 'utf-8'
-                },
+                max_length=500,
+                encoding='utf-8',
                 description='Detailed chronic disease information'
             ),
             
@@ -459,10 +559,8 @@ class HeatDataSchema:
                 data_type=ColumnType.TEXT,
                 required=False,
                 default_value=None,
-                validation_rules={
-                    ValidationRule.LENGTH: (0, 200),
-                    ValidationRule.ENCODING: 'utf-8'
-                },
+                max_length=200,
+                encoding='utf-8',
                 description='Other diseases or conditions'
             ),
             
@@ -472,10 +570,8 @@ class HeatDataSchema:
                 data_type=ColumnType.TEXT,
                 required=False,
                 default_value=None,
-                validation_rules={
-                    ValidationRule.LENGTH: (0, 300),
-                    ValidationRule.ENCODING: 'utf-8'
-                },
+                max_length=300,
+                encoding='utf-8',
                 description='Risk behaviors'
             ),
             
@@ -485,10 +581,8 @@ class HeatDataSchema:
                 data_type=ColumnType.TEXT,
                 required=False,
                 default_value=None,
-                validation_rules={
-                    ValidationRule.LENGTH: (0, 200),
-                    ValidationRule.ENCODING: 'utf-8'
-                },
+                max_length=200,
+                encoding='utf-8',
                 description='Location where illness occurred or death happened'
             ),
             
@@ -498,10 +592,8 @@ class HeatDataSchema:
                 data_type=ColumnType.TEXT,
                 required=False,
                 default_value=None,
-                validation_rules={
-                    ValidationRule.LENGTH: (0, 300),
-                    ValidationRule.ENCODING: 'utf-8'
-                },
+                max_length=300,
+                encoding='utf-8',
                 description='Characteristics of the area/environment'
             ),
             
@@ -511,10 +603,8 @@ class HeatDataSchema:
                 data_type=ColumnType.TEXT,
                 required=False,
                 default_value=None,
-                validation_rules={
-                    ValidationRule.LENGTH: (0, 300),
-                    ValidationRule.ENCODING: 'utf-8'
-                },
+                max_length=300,
+                encoding='utf-8',
                 description='Symptoms and clinical presentation'
             ),
             
@@ -524,10 +614,8 @@ class HeatDataSchema:
                 data_type=ColumnType.TEXT,
                 required=False,
                 default_value=None,
-                validation_rules={
-                    ValidationRule.LENGTH: (0, 400),
-                    ValidationRule.ENCODING: 'utf-8'
-                },
+                max_length=400,
+                encoding='utf-8',
                 description='Activities or risk behaviors before the incident'
             ),
             
@@ -537,10 +625,8 @@ class HeatDataSchema:
                 data_type=ColumnType.TEXT,
                 required=False,
                 default_value=None,
-                validation_rules={
-                    ValidationRule.LENGTH: (0, 20),
-                    ValidationRule.PATTERN: r'^[A-Z]\d{2}(\.\d{1,2})?$'
-                },
+                max_length=20,
+                pattern=_ICD10_RE,
                 description='ICD-10 diagnosis code'
             ),
             
@@ -550,10 +636,8 @@ class HeatDataSchema:
                 data_type=ColumnType.TEXT,
                 required=False,
                 default_value=None,
-                validation_rules={
-                    ValidationRule.LENGTH: (0, 300),
-                    ValidationRule.ENCODING: 'utf-8'
-                },
+                max_length=300,
+                encoding='utf-8',
                 description='Diagnosis result or conclusion'
             ),
             
@@ -563,10 +647,8 @@ class HeatDataSchema:
                 data_type=ColumnType.TEXT,
                 required=False,
                 default_value=None,
-                validation_rules={
-                    ValidationRule.LENGTH: (0, 200),
-                    ValidationRule.ENCODING: 'utf-8'
-                },
+                max_length=200,
+                encoding='utf-8',
                 description='Additional information column'
             ),
             
@@ -576,10 +658,8 @@ class HeatDataSchema:
                 data_type=ColumnType.TEXT,
                 required=False,
                 default_value=None,
-                validation_rules={
-                    ValidationRule.LENGTH: (0, 500),
-                    ValidationRule.ENCODING: 'utf-8'
-                },
+                max_length=500,
+                encoding='utf-8',
                 description='Other relevant information'
             ),
             
@@ -589,10 +669,8 @@ class HeatDataSchema:
                 data_type=ColumnType.TEXT,
                 required=False,
                 default_value=None,
-                validation_rules={
-                    ValidationRule.LENGTH: (0, 500),
-                    ValidationRule.ENCODING: 'utf-8'
-                },
+                max_length=500,
+                encoding='utf-8',
                 description='Remarks or additional notes'
             ),
             
@@ -602,10 +680,8 @@ class HeatDataSchema:
                 data_type=ColumnType.TEXT,
                 required=False,
                 default_value=None,
-                validation_rules={
-                    ValidationRule.LENGTH: (0, 300),
-                    ValidationRule.ENCODING: 'utf-8'
-                },
+                max_length=300,
+                encoding='utf-8',
                 description='Online media source or URL'
             )
         }
@@ -622,16 +698,36 @@ class HeatDataSchema:
             Tuple of (is_valid, list_of_errors)
         """
         errors = []
+        expected_index = cls._COLUMN_INDEX
         
         if len(columns) != len(cls.COLUMN_ORDER):
             errors.append(f"Expected {len(cls.COLUMN_ORDER)} columns, got {len(columns)}")
         
-        for i, expected in enumerate(cls.COLUMN_ORDER):
-            if i < len(columns):
-                if columns[i] != expected:
-                    errors.append(f"Column {i}: expected '{expected}', got '{columns[i]}'")
-            else:
-                errors.append(f"Missing column {i}: '{expected}'")
+        # Fast path: exact match needs no per-column diagnostics
+        if not errors and all(columns[i] == name for i, name in enumerate(cls.COLUMN_ORDER)):
+            return True, errors
+        
+        actual_index = {}
+        for i, col in enumerate(columns):
+            actual_index.setdefault(col, i)
+        
+        # Missing / extra columns are reported by name so they don't shift every later check
+        for name in cls.COLUMN_ORDER:
+            if name not in actual_index:
+                errors.append(f"Missing column {expected_index[name]}: '{name}'")
+        for col, i in actual_index.items():
+            if col not in expected_index:
+                errors.append(f"Unexpected column {i}: '{col}'")
+        
+        # Misplaced columns (relative order among the expected columns that are present)
+        present = [col for col in actual_index if col in expected_index]
+        ordered = sorted(present, key=expected_index.__getitem__)
+        for got, expected in zip(present, ordered):
+            if got != expected:
+                errors.append(
+                    f"Column {actual_index[got]}: expected '{expected}', got '{got}' "
+                    f"(belongs at position {expected_index[got]})"
+                )
         
         return len(errors) == 0, errors
     
@@ -643,6 +739,11 @@ class HeatDataSchema:
         Returns:
             Dictionary mapping column names to ColumnType
         """
+        return dict(cls._column_types_mapping())
+    
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _column_types_mapping(cls) -> Dict[str, ColumnType]:
         schema = cls.get_schema_definition()
         return {name: spec.data_type for name, spec in schema.items()}
     
@@ -654,15 +755,28 @@ class HeatDataSchema:
         Returns:
             Dictionary with all column names and default/None values
         """
+        return cls._empty_row_template().copy()
+    
+    @classmethod
+    def get_empty_row_view(cls) -> Mapping[str, Optional[str]]:
+        """
+        Read-only view of the empty row template (no copy, for callers that don't mutate)
+        
+        Returns:
+            Mapping of all column names to default/None values
+        """
+        return types.MappingProxyType(cls._empty_row_template())
+    
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _empty_row_template(cls) -> Dict[str, Optional[str]]:
         schema = cls.get_schema_definition()
-        empty_row = {}
+        empty_row = dict.fromkeys(cls.COLUMN_ORDER)
         
-        for col_name in cls.COLUMN_ORDER:
-            if col_name in schema:
-                spec = schema[col_name]
+        # Only a few columns (e.g. 'สถานะ') carry a non-None default
+        for col_name, spec in schema.items():
+            if spec.default_value is not None and col_name in empty_row:
                 empty_row[col_name] = spec.default_value
-            else:
-                empty_row[col_name] = None
         
         return empty_row
     
@@ -677,8 +791,16 @@ class HeatDataSchema:
         Returns:
             List of column names matching the data type
         """
+        return list(cls._columns_by_type().get(data_type, ()))
+    
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _columns_by_type(cls) -> Dict[ColumnType, Tuple[str, ...]]:
         schema = cls.get_schema_definition()
-        return [name for name, spec in schema.items() if spec.data_type == data_type]
+        grouped: Dict[ColumnType, List[str]] = {}
+        for name, spec in schema.items():
+            grouped.setdefault(spec.data_type, []).append(name)
+        return {data_type: tuple(names) for data_type, names in grouped.items()}
     
     @classmethod
     def is_required_column(cls, column_name: str) -> bool:
@@ -694,4 +816,116 @@ class HeatDataSchema:
         schema = cls.get_schema_definition()
         if column_name in schema:
             return schema[column_name].required
-        return False
\ No newline at end of file
+        return False
+    
+    @classmethod
+    def is_valid_province(cls, value: Any) -> bool:
+        """Check if value is a known Thai province name (O(1) set lookup)"""
+        return isinstance(value, str) and value.strip() in cls.THAI_PROVINCES
+    
+    @classmethod
+    def _code_categories(cls, col_name: str) -> Tuple[str, ...]:
+        if col_name in cls.CATEGORY_CODES:
+            return cls.CATEGORY_CODES[col_name]
+        spec = cls.get_schema_definition().get(col_name)
+        if spec is not None and spec.data_type == ColumnType.BOOLEAN:
+            return cls.BOOLEAN_CODES
+        raise KeyError(f"Column '{col_name}' has no categorical encoding")
+    
+    @classmethod
+    def to_codes(cls, col_name: str, values: Any) -> np.ndarray:
+        """
+        Encode a low-cardinality column as int8 category codes
+        
+        Args:
+            col_name: Column in CATEGORY_CODES, or any boolean column
+            values: Array-like of raw cell values
+            
+        Returns:
+            int8 array of codes; -1 marks missing or out-of-vocabulary values,
+            so vocabulary validation is a single ``codes >= 0`` comparison
+        """
+        categories = cls._code_categories(col_name)
+        text = pd.Series(values, copy=False).astype('string').str.strip()
+        
+        if categories is cls.BOOLEAN_CODES:
+            flags = text.map(cls._BOOL_MAP)
+            flags = flags.where(flags.notna(), text.str.lower().map(cls._BOOL_MAP))
+            return flags.map({False: 0, True: 1}).fillna(-1).to_numpy(dtype=np.int8)
+        
+        return pd.Categorical(text, categories=categories).codes.astype(np.int8, copy=False)
+    
+    @classmethod
+    def from_codes(cls, col_name: str, codes: np.ndarray) -> pd.Categorical:
+        """Decode int8 codes from to_codes back to the column's labels (-1 becomes NaN)"""
+        return pd.Categorical.from_codes(codes, categories=cls._code_categories(col_name))
+    
+    @classmethod
+    def validate_dataframe(cls, df: pd.DataFrame,
+                           workers: Optional[int] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Validate every schema column of a DataFrame with the batch validator APIs
+        
+        Args:
+            df: DataFrame with (a subset of) the schema columns
+            workers: Validate columns in parallel in this many processes
+                (validators share no state, so columns are independent);
+                None or 1 validates them one after another in this process
+            
+        Returns:
+            Tuple of (processed_df, valid_mask_df). Columns not in the schema
+            are copied through unchanged and have no mask column.
+        """
+        schema = cls.get_schema_definition()
+        jobs = []
+        for col_name in df.columns:
+            spec = schema.get(col_name)
+            if spec is not None:
+                jobs.append((spec.data_type, col_name, df[col_name]))
+        
+        if workers is not None and workers > 1 and len(jobs) > 1:
+            # Process start-up and pickling the columns cost more than validating
+            # a small frame, so this pays off on large multi-column files only
+            with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as executor:
+                results = list(executor.map(_validate_column, *zip(*jobs)))
+        else:
+            results = [_validate_column(*job) for job in jobs]
+        
+        processed = df.copy()
+        masks = {}
+        for (_, col_name, _), (valid, values) in zip(jobs, results):
+            processed[col_name] = values
+            masks[col_name] = valid
+        
+        return processed, pd.DataFrame(masks, index=df.index)
+    
+    @classmethod
+    def get_region(cls, province: Any) -> Optional[str]:
+        """Region of a province name, or None if the province is unknown"""
+        if not isinstance(province, str):
+            return None
+        return cls.PROVINCE_TO_REGION.get(province.strip())
+    
+    @classmethod
+    def is_true_boolean(cls, value: Any) -> bool:
+        """Check if value is one of the accepted true values"""
+        return str(value).strip() in cls.BOOLEAN_TRUE_VALUES
+    
+    @classmethod
+    def is_false_boolean(cls, value: Any) -> bool:
+        """Check if value is one of the accepted false values"""
+        return str(value).strip() in cls.BOOLEAN_FALSE_VALUES
+    
+    @classmethod
+    def parse_boolean(cls, value: Any) -> Optional[bool]:
+        """
+        Parse a boolean cell with one dict lookup
+        
+        Returns:
+            True/False for known values, None for unknown or missing values
+        """
+        if value is None:
+            return None
+        text = str(value).strip()
+        result = cls._BOOL_MAP.get(text)
+        return result if result is not None else cls._BOOL_MAP.get(text.lower())
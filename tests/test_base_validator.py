@@ -0,0 +1,21 @@
+"""
+Tests for the default BaseValidator.process_batch
+"""
+
+import numpy as np
+import pandas as pd
+
+from validators.text_processor import TextProcessor
+
+
+def test_default_batch_keeps_hash_equal_values_of_different_types_apart():
+    processor = TextProcessor('ข้อความ')
+    values = [1, True, 45, 45.0, 'a', 'a', None, np.nan, pd.NA]
+
+    valid, processed = processor.process_batch(values)
+
+    expected = [processor.process(value) for value in values]
+    assert valid.tolist() == [result.is_valid for result in expected]
+    assert processed.tolist() == [result.processed_value for result in expected]
+    assert processed[1] == 'True'
+    assert processed[3] == '45.0'
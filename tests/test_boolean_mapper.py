@@ -0,0 +1,53 @@
+"""
+Tests for BooleanMapper value resolution
+"""
+
+import pandas as pd
+import pytest
+
+from validators.boolean_mapper import BooleanMapper
+
+
+@pytest.mark.parametrize('value, expected', [
+    # Exact tokens win over partial matching: 'มี', 'ไม่มี' and 'no' used to
+    # hit a partial null term and 'not found' the partial true term 'found'
+    ('มี', True),
+    ('ไม่มี', False),
+    ('no', False),
+    ('not found', False),
+])
+def test_exact_tokens_take_precedence(value, expected):
+    mapper = BooleanMapper('ความดันโลหิตสูง')
+
+    assert mapper.process_series(pd.Series([value])).tolist() == [expected]
+
+
+@pytest.mark.parametrize('value, expected', [
+    # Exact tokens resolve the same way on the scalar path
+    ('มี', '1'),
+    ('ไม่มี', '0'),
+    ('no', '0'),
+    ('not found', '0'),
+    # Previously all mapped to '' (null): the '' null term matched every value
+    ('มีอาการไข้', '1'),
+    ('เป็นโรคความดัน', '1'),
+    # Unchanged
+    ('ไม่ระบุข้อมูล', ''),
+    ('ไม่ทราบ', ''),
+    ('ใช่', '1'),
+    ('ไม่เป็น', '0'),
+])
+def test_exact_tokens_and_free_text(value, expected):
+    mapper = BooleanMapper('ความดันโลหิตสูง')
+
+    result = mapper.validate_and_process(value)
+
+    assert result.is_valid
+    assert result.processed_value == expected
+
+
+def test_empty_null_term_still_matches_exactly():
+    mapper = BooleanMapper('ความดันโลหิตสูง')
+
+    assert mapper._is_null_value('')
+    assert not mapper._is_null_value('มีอาการไข้')
@@ -0,0 +1,69 @@
+"""
+Tests for ConfigLoader derived-value caching
+"""
+
+import json
+import logging
+import os
+
+from main.config_loader import ConfigLoader, load_config
+
+
+def _write_config(tmp_path):
+    input_file = tmp_path / 'input.csv'
+    input_file.write_text('', encoding='utf-8')
+    config = {
+        'llm_provider': 'local',
+        'llm_settings': {'local': {'model': 'test'}},
+        'data_paths': {
+            'input_file': str(input_file),
+            'base_file': str(tmp_path / 'base.csv'),
+            'output_filled_file': str(tmp_path / 'filled.csv'),
+            'output_heat_data_file': str(tmp_path / 'heat.csv'),
+        },
+        'columns': {
+            'schema': [
+                {'name': 'จังหวัด', 'data_type': 'text', 'enabled': True},
+                {'name': 'อายุ', 'data_type': 'integer', 'enabled': False},
+                {'name': 'เพศ', 'data_type': 'multiclass', 'enabled': True},
+            ],
+        },
+        'prompts': {},
+    }
+    path = tmp_path / 'config.json'
+    path.write_text(json.dumps(config, ensure_ascii=False), encoding='utf-8')
+    return path
+
+
+def test_enabled_columns_are_built_once_per_load(tmp_path, caplog):
+    config = ConfigLoader(str(_write_config(tmp_path)))
+
+    with caplog.at_level(logging.INFO, logger='main.config_loader'):
+        first = config.get_enabled_columns()
+        second = config.get_enabled_columns()
+
+    assert [col['name'] for col in first] == ['จังหวัด', 'เพศ']
+    assert first == second and first is not second
+    assert sum('enabled columns' in message for message in caplog.messages) == 1
+
+    config.reload()
+    with caplog.at_level(logging.INFO, logger='main.config_loader'):
+        config.get_enabled_columns()
+    assert sum('enabled columns' in message for message in caplog.messages) == 2
+
+
+def test_load_config_reuses_instance_until_file_changes(tmp_path):
+    path = _write_config(tmp_path)
+
+    config = load_config(str(path))
+    assert load_config(str(path)) is config
+
+    data = json.loads(path.read_text(encoding='utf-8'))
+    data['columns']['schema'][1]['enabled'] = True
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    reloaded = load_config(str(path))
+    assert reloaded is not config
+    assert len(reloaded.get_enabled_columns()) == 3
@@ -0,0 +1,26 @@
+"""
+Tests for DateProcessor column (batch) processing
+"""
+
+import pandas as pd
+
+from validators.date_processor import DateProcessor
+
+
+def test_batch_thai_digit_dates_match_scalar_path():
+    processor = DateProcessor('ว/ด/ป เสียชีวิต')
+    values = pd.Series(['๕/๓/๒๕๖๗', '5/3/2567', '', None, 'xx'], dtype=object)
+
+    valid, processed = processor.process_batch(values)
+
+    expected = [processor.process(value) for value in values]
+    assert valid.tolist() == [result.is_valid for result in expected]
+    assert processed.tolist() == [result.processed_value for result in expected]
+    assert processed[0] == '2024-05-03'
+
+
+def test_series_thai_digit_dates_are_parsed():
+    processor = DateProcessor('ว/ด/ป เสียชีวิต')
+    values = pd.Series(['๕/๓/๒๕๖๗', '5/3/2567'], dtype=object)
+
+    assert processor.process_series(values).tolist() == ['2024-05-03', '2024-05-03']
@@ -0,0 +1,30 @@
+"""
+Tests for MulticlassValidator column (series) processing
+"""
+
+import pandas as pd
+
+from validators.multiclass_validator import MulticlassValidator
+
+
+def test_none_default_value_is_not_a_category():
+    validator = MulticlassValidator('เพศ', {'default_value': None, 'allow_fuzzy_matching': False})
+    values = pd.Series(['ชาย', 'xyzzy', None, 'หญิง'])
+
+    codes = validator.process_series(values, return_codes=True)
+    result = validator.process_series(values)
+
+    assert None not in validator._categories
+    assert codes.tolist()[1:3] == [-1, -1]
+    assert result.isna().tolist() == [False, True, True, False]
+    assert result.iloc[0] == 'ชาย'
+
+
+def test_series_keeps_hash_equal_values_of_different_types_apart():
+    validator = MulticlassValidator('รหัส', {'vocabulary': ['1', 'True', '1.0'], 'allow_fuzzy_matching': False})
+    values = pd.Series([1, True, 1.0, 'True', None], dtype=object)
+
+    result = validator.process_series(values)
+
+    assert result.tolist() == [validator.process(value).processed_value for value in values]
+    assert result.tolist()[:3] == ['1', 'True', '1.0']
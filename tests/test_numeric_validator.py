@@ -0,0 +1,23 @@
+"""
+Tests for numeric validator column (batch) processing
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from validators.numeric_validator import FloatValidator, IntegerValidator
+
+
+@pytest.mark.parametrize('validator_class', [IntegerValidator, FloatValidator])
+@pytest.mark.parametrize('values', [
+    pd.Series([True, False, np.True_, 5, '7', None], dtype=object),
+    pd.Series([True, False]),
+    pd.Series([True, None], dtype='boolean'),
+])
+def test_batch_rejects_bools_like_process(validator_class, values):
+    validator = validator_class('อายุ')
+
+    valid, _ = validator.process_batch(values)
+
+    assert valid.tolist() == [validator.process(value).is_valid for value in values]
@@ -0,0 +1,27 @@
+"""
+Tests for smart_scraper CSV chunk reading
+"""
+
+import pandas as pd
+import pytest
+
+pytest.importorskip('pyarrow')
+from main import smart_scraper
+
+
+def test_arrow_chunks_keep_late_non_numeric_values(tmp_path, monkeypatch):
+    rows = ['url,content,scrape_status,count']
+    rows += [f'https://example.com/{i},ข่าว {i},success,{i}' for i in range(50)]
+    rows.append('https://example.com/late,,failed,abc')
+    path = tmp_path / 'prepare_data.csv'
+    path.write_text('\n'.join(rows) + '\n', encoding='utf-8')
+    # block เล็ก ๆ -> Arrow เห็นแต่ตัวเลขใน block แรกของ column count
+    monkeypatch.setattr(smart_scraper, 'ARROW_BLOCK_SIZE', 64)
+
+    chunks = list(smart_scraper.iter_csv_chunks(str(path)))
+    df = pd.concat(chunks, ignore_index=True)
+
+    assert len(chunks) > 1
+    assert df['count'].tolist() == [str(i) for i in range(50)] + ['abc']
+    assert df['content'].iloc[0] == 'ข่าว 0'
+    assert pd.isna(df['content'].iloc[-1])
@@ -6,13 +6,43 @@ data types in the heat data schema including numeric, date, time,
 boolean, multiclass, and text columns.
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
 from .base_validator import ValidationResult
-from .numeric_validator import IntegerValidator, FloatValidator
-from .date_processor import DateProcessor
-from .time_processor import TimeProcessor
-from .boolean_mapper import BooleanMapper
-from .multiclass_validator import MulticlassValidator
-from .text_processor import TextProcessor
+
+# Validator classes are imported on first access (PEP 562), so using one
+# validator doesn't load the vocabularies and regexes of all the others
+_LAZY_IMPORTS = {
+    'IntegerValidator': 'numeric_validator',
+    'FloatValidator': 'numeric_validator',
+    'DateProcessor': 'date_processor',
+    'TimeProcessor': 'time_processor',
+    'BooleanMapper': 'boolean_mapper',
+    'MulticlassValidator': 'multiclass_validator',
+    'TextProcessor': 'text_processor',
+}
+
+if TYPE_CHECKING:
+    from .numeric_validator import IntegerValidator, FloatValidator
+    from .date_processor import DateProcessor
+    from .time_processor import TimeProcessor
+    from .boolean_mapper import BooleanMapper
+    from .multiclass_validator import MulticlassValidator
+    from .text_processor import TextProcessor
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value  # cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 __all__ = [
     'ValidationResult',
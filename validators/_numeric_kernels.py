@@ -0,0 +1,32 @@
+"""
+Vectorized numeric kernels for batch range validation
+
+Whole-column versions of the per-value range check and clamp used by
+NumericBaseValidator. They operate on NumPy arrays so a pandas column can
+be validated in one call instead of one Python call per cell.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+
+def _bounds(lo: Optional[float], hi: Optional[float]):
+    """Open-ended bounds become -inf/+inf so the kernels need no branches"""
+    return (-np.inf if lo is None else lo), (np.inf if hi is None else hi)
+
+
+def range_check_float(arr: np.ndarray, lo: Optional[float], hi: Optional[float]) -> np.ndarray:
+    """
+    Boolean mask of values inside [lo, hi]
+    
+    NaN compares False on both sides, so missing values are never in range.
+    """
+    lo, hi = _bounds(lo, hi)
+    return (arr >= lo) & (arr <= hi)
+
+
+def clamp(arr: np.ndarray, lo: Optional[float], hi: Optional[float]) -> np.ndarray:
+    """Clamp values into [lo, hi] (NaN is left as NaN); returns a new array"""
+    lo, hi = _bounds(lo, hi)
+    return np.clip(arr, lo, hi)
@@ -2,37 +2,261 @@
 Base validator module for type-specific column validation
 """
 
-from dataclasses import dataclass
-from typing import Any, Optional
-from abc import ABC, abstractmethod
+import math
+from typing import Any, Iterable, NamedTuple, Optional, Tuple
 
+import numpy as np
+import pandas as pd
 
-@dataclass
-class ValidationResult:
-    """Result of column validation"""
+from ._numeric_kernels import range_check_float, clamp
+
+
+class ValidationResult(NamedTuple):
+    """
+    Result of column validation
+    
+    A NamedTuple (C-level construction, immutable) since one is created per
+    cell; immutability also lets common results be shared singletons.
+    """
     is_valid: bool
     processed_value: Any
     error_message: Optional[str] = None
     confidence_score: Optional[float] = None
+    notes: Tuple[str, ...] = ()
+
+
+# Shared result for the most common case: a null cell passed through as None
+VALID_NULL_RESULT = ValidationResult(True, None)
 
 
-class BaseValidator(ABC):
-    """Base class for all validators"""
+class BaseValidator:
+    """
+    Base class for all validators
+    
+    A plain class rather than an ABC: isinstance checks and instantiation
+    skip ABCMeta's subclass-hook machinery. Subclasses must override process().
+    """
+    
+    __slots__ = ()
     
-    @abstractmethod
     def process(self, value: Any) -> ValidationResult:
         """Process and validate value"""
-        pass
+        raise NotImplementedError(f"{type(self).__name__} must implement process()")
+    
+    def process_batch(self, values: Any) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Validate a whole column
+        
+        Default implementation factorizes text columns, calls process() once
+        per distinct value and scatters the results back with the codes
+        (categorical-like columns repeat a lot); subclasses override with
+        vectorized versions where possible.
+        
+        Only all-text columns are factorized: factorize merges hash-equal
+        values of different types (1/True, 45/45.0, None/NaN), which
+        process() may treat differently. Other columns and the null cells
+        go through _process_each, memoized per (type, value).
+        
+        Args:
+            values: Array-like column (pandas Series, NumPy array, list)
+            
+        Returns:
+            Tuple of (valid_mask bool array, processed values object array)
+        """
+        series = pd.Series(values, dtype=object, copy=False)
+        if pd.api.types.infer_dtype(series, skipna=True) not in ('string', 'empty'):
+            return self._process_each(series)
+        
+        codes, uniques = pd.factorize(series)
+        
+        # One slot per distinct text plus a trailing slot for nulls (code -1)
+        unique_valid = np.empty(len(uniques) + 1, dtype=bool)
+        unique_processed = np.empty(len(uniques) + 1, dtype=object)
+        for i, value in enumerate(uniques):
+            result = self.process(value)
+            unique_valid[i] = result.is_valid
+            unique_processed[i] = result.processed_value
+        valid = unique_valid[codes]
+        processed = unique_processed[codes]
+        
+        nulls = np.flatnonzero(codes == -1)
+        if len(nulls):
+            valid[nulls], processed[nulls] = self._process_each(series.iloc[nulls])
+        return valid, processed
+    
+    def _process_each(self, values: Any) -> Tuple[np.ndarray, np.ndarray]:
+        """process_batch path for non-text columns (memoized per type and hashable value)"""
+        values = list(values)
+        valid = np.empty(len(values), dtype=bool)
+        processed = np.empty(len(values), dtype=object)
+        cache = {}
+        for i, value in enumerate(values):
+            try:
+                key = (type(value), value)
+                result = cache.get(key)
+                if result is None:
+                    result = cache[key] = self.process(value)
+            except TypeError:  # unhashable value
+                result = self.process(value)
+            valid[i] = result.is_valid
+            processed[i] = result.processed_value
+        return valid, processed
+    
+    @staticmethod
+    def is_null_or_empty(value: Any) -> bool:
+        """True for None, NaN/NaT/pd.NA and blank strings"""
+        if value is None:
+            return True
+        if isinstance(value, str):
+            return not value.strip()
+        if isinstance(value, float):
+            return math.isnan(value)
+        return type(value).__name__ in ('NAType', 'NaTType')
+    
+    def handle_null_value(self) -> Any:
+        """Value written for a null cell"""
+        return None
+    
+    @staticmethod
+    def create_success_result(processed_value: Any, original_value: Any = None,
+                              processing_notes: Optional[Iterable[str]] = None) -> ValidationResult:
+        """
+        Build a successful result
+        
+        original_value is accepted for call-site symmetry but not stored (the
+        caller already holds it). A null value with no notes returns the
+        shared VALID_NULL_RESULT instead of allocating.
+        """
+        notes = tuple(processing_notes) if processing_notes else ()
+        if processed_value is None and not notes:
+            return VALID_NULL_RESULT
+        return ValidationResult(True, processed_value, None, None, notes)
+    
+    @staticmethod
+    def create_failure_result(original_value: Any, errors: Iterable[str]) -> ValidationResult:
+        """Build a failed result; processed_value keeps the original value"""
+        return ValidationResult(False, original_value, '; '.join(errors) or None)
 
 
 class NumericBaseValidator(BaseValidator):
     """Base class for numeric validators"""
     
+    __slots__ = ('min_value', 'max_value', 'clamp_to_range', 'allow_null')
+    
     def __init__(self, min_value: Optional[float] = None, max_value: Optional[float] = None):
         self.min_value = min_value
         self.max_value = max_value
+        self.clamp_to_range = False
+        self.allow_null = True
+    
+    def check_numeric_range(self, value: float) -> Tuple[bool, Optional[str]]:
+        """
+        Check value against [min_value, max_value]
+        
+        Returns:
+            Tuple of (in_range, message); message is None when in range
+        """
+        if self.min_value is not None and value < self.min_value:
+            return False, f'Value {value} below minimum {self.min_value}'
+        if self.max_value is not None and value > self.max_value:
+            return False, f'Value {value} above maximum {self.max_value}'
+        return True, None
+    
+    def clamp_value(self, value: float) -> float:
+        """Clamp value into [min_value, max_value]"""
+        if self.min_value is not None and value < self.min_value:
+            return self.min_value
+        if self.max_value is not None and value > self.max_value:
+            return self.max_value
+        return value
     
-    @abstractmethod
     def process(self, value: Any) -> ValidationResult:
         """Process and validate numeric value"""
-        pass
\ No newline at end of file
+        raise NotImplementedError(f"{type(self).__name__} must implement process()")
+    
+    def process_batch(self, values: Any) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Validate a whole numeric column in one vectorized pass
+        
+        Numbers and clean numeric strings are converted by pd.to_numeric;
+        only cells it cannot parse (units, Thai number words, ...) go
+        through process() one by one.
+        
+        Args:
+            values: Array-like column (pandas Series, NumPy array, list)
+            
+        Returns:
+            Tuple of (valid_mask, processed) where processed is float64.
+            Out-of-range values are clamped when clamp_to_range is set,
+            otherwise marked invalid and replaced with NaN; infinities are
+            always invalid.
+        """
+        series = pd.Series(values, copy=False)
+        numbers = pd.to_numeric(series, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+        
+        # pd.to_numeric reads bools as 1/0, but process() rejects them: send them there
+        if series.dtype == object:
+            bools = np.fromiter((isinstance(v, (bool, np.bool_)) for v in series), dtype=bool, count=len(series))
+            numbers[bools] = np.nan
+        elif pd.api.types.is_bool_dtype(series.dtype):
+            numbers[:] = np.nan
+        missing = np.isnan(numbers)
+        
+        # Cells that are present but not plain numbers: fall back to process()
+        raw_null = series.isna().to_numpy(dtype=bool)
+        if series.dtype == object or pd.api.types.is_string_dtype(series.dtype):
+            raw_null = raw_null | series.astype('string').str.strip().eq('').fillna(False).to_numpy(dtype=bool)
+        unparsed = missing & ~raw_null
+        rejected = np.zeros(len(numbers), dtype=bool)
+        for i in np.flatnonzero(unparsed):
+            result = self.process(series.iat[i])
+            if not result.is_valid:
+                rejected[i] = True
+            elif result.processed_value not in (None, ''):
+                numbers[i] = float(result.processed_value)
+        
+        numbers = self._coerce_batch(numbers)
+        
+        # Infinities fail like in process() ('inf' parses but is not a valid number)
+        infinite = np.isinf(numbers)
+        if infinite.any():
+            rejected |= infinite
+            numbers[infinite] = np.nan
+        nulls = np.isnan(numbers) & ~rejected
+        
+        if self.clamp_to_range:
+            processed = clamp(numbers, self.min_value, self.max_value)
+            valid = ~nulls & ~rejected
+        else:
+            in_range = range_check_float(numbers, self.min_value, self.max_value)
+            processed = np.where(in_range, numbers, np.nan)
+            valid = in_range
+        if self.allow_null:
+            valid = valid | nulls
+        return valid, processed
+    
+    def _coerce_batch(self, numbers: np.ndarray) -> np.ndarray:
+        """Hook for subclasses to adjust parsed numbers before range checks"""
+        return numbers
+    
+    def process_series(self, values: pd.Series) -> pd.Series:
+        """
+        Convert a whole pandas Series to numbers
+        
+        Runs the vectorized process_batch and keeps only valid numbers, so
+        the column never goes through per-cell result objects.
+        
+        Args:
+            values: pandas Series of raw numeric cells
+            
+        Returns:
+            Series on the same index (nullable dtype, see _finish_series);
+            <NA> where the cell is null or invalid
+        """
+        valid, processed = self.process_batch(values)
+        numbers = pd.array(np.where(valid, processed, np.nan), dtype='Float64')
+        return pd.Series(self._finish_series(numbers), index=values.index, name=values.name)
+    
+    def _finish_series(self, numbers: pd.api.extensions.ExtensionArray) -> pd.api.extensions.ExtensionArray:
+        """Hook for subclasses to set the output dtype/precision of process_series"""
+        return numbers
@@ -5,10 +5,48 @@ This module implements BooleanMapper class for standardizing boolean values
 to 1/0/NULL format with support for Thai text variations and medical terminology.
 """
 
+import functools
 import re
-from typing import Any, Optional, Dict, List
+from typing import Any, Callable, Optional, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
 from .base_validator import BaseValidator, ValidationResult
 
+# pyahocorasick is optional - one-pass multi-term substring search for partial matching
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Distinct raw values remembered per BooleanMapper
+MAP_CACHE_SIZE = 4096
+
+
+def build_term_searcher(terms) -> Callable[[str], bool]:
+    """
+    Build a function telling whether a text contains any of the terms
+    
+    Uses an Aho-Corasick automaton (one linear scan of the text) when
+    pyahocorasick is installed, otherwise a single precompiled regex
+    alternation - either way no per-term Python loop.
+    """
+    terms = sorted(set(terms), key=len, reverse=True)
+    if not terms:
+        return lambda text: False
+    
+    if AHOCORASICK_AVAILABLE:
+        automaton = ahocorasick.Automaton()
+        for term in terms:
+            automaton.add_word(term, term)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text), None) is not None
+    
+    search = re.compile('|'.join(map(re.escape, terms))).search
+    return lambda text: search(text) is not None
+
 
 class BooleanMapper(BaseValidator):
     """
@@ -80,6 +118,39 @@ class BooleanMapper(BaseValidator):
         '', '-', '_', '?', '??', '...', 'xxx', 'n.a.'
     }
     
+    # Medical description patterns, compiled once (each is an alternation of the rules)
+    POSITIVE_PATTERN = re.compile('|'.join([
+        r'(?:ป่วย|เป็น|มี).*(?:' + '|'.join(['โรค', 'อาการ', 'ความดัน', 'เบาหวาน', 'หัวใจ']) + ')',
+        r'(?:ได้รับ|มี).*(?:การวินิจฉัย|การรักษา|การดูแล)',
+        r'(?:ระดับ|ค่า).*(?:สูง|ต่ำ|ผิดปกติ)',
+        r'(?:ประวัติ|ได้รับ).*(?:การรักษา|การผ่าตัด)'
+    ]))
+    NEGATIVE_PATTERN = re.compile('|'.join([
+        r'(?:ไม่|ไม่มี|ไม่เป็น|ไม่ป่วย).*(?:โรค|อาการ|ความดัน)',
+        r'(?:สุขภาพ|ร่างกาย).*(?:ดี|ปกติ|แข็งแรง)',
+        r'(?:ไม่ได้|ไม่มี).*(?:การรักษา|การดูแล|ประวัติ)'
+    ]))
+    NUMBER_PATTERN = re.compile(r'(\d+(?:\.\d+)?)')
+    
+    # Column-specific vocabulary: (column name keys, extra true values, extra false values)
+    _CONDITION_RULES = (
+        (('ความดันโลหิตสูง', 'hypertension'),
+         frozenset({'ความดันสูง', 'bp สูง', 'htn', 'hypertensive'}),
+         frozenset({'ความดันปกติ', 'bp ปกติ', 'normotensive'})),
+        (('เบาหวาน', 'diabetes'),
+         frozenset({'dm', 'diabetic', 'น้ำตาลในเลือดสูง', 'เบาหวานชนิดที่ 1', 'เบาหวานชนิดที่ 2'}),
+         frozenset({'ไม่เป็นเบาหวาน', 'น้ำตาลในเลือดปกติ', 'non-diabetic'})),
+        (('หัวใจ', 'cardiovascular', 'cardiac'),
+         frozenset({'โรคหัวใจ', 'cardiac', 'cvd', 'หัวใจล้มเหลว', 'heart failure'}),
+         frozenset({'หัวใจปกติ', 'cardiac normal', 'no cvd'})),
+        (('หอบหืด', 'asthma'),
+         frozenset({'asthmatic', 'มีอาการหอบหืด', 'ระบบทางเดินหายใจผิดปกติ'}),
+         frozenset({'ไม่หอบหืด', 'ระบบทางเดินหายใจปกติ', 'no asthma'})),
+        (('โรคตับ', 'liver'),
+         frozenset({'liver disease', 'ตับแข็ง', 'ตับอักเสบ', 'hepatitis'}),
+         frozenset({'ตับปกติ', 'liver normal', 'no liver disease'})),
+    )
+    
     def __init__(self, column_name: str, validation_config: Optional[Dict] = None):
         """
         Initialize boolean mapper
@@ -99,6 +170,8 @@ class BooleanMapper(BaseValidator):
         self.partial_matching = self.config.get('partial_matching', True)
         self.custom_true_values = set(self.config.get('custom_true_values', []))
         self.custom_false_values = set(self.config.get('custom_false_values', []))
+        # False: successes carry no per-value notes and are shared instances
+        self.track_original = self.config.get('track_original', True)
         
         # Combine default and custom values
         self.all_true_values = self.TRUE_VALUES | self.custom_true_values
@@ -106,6 +179,51 @@ class BooleanMapper(BaseValidator):
         
         # Medical condition specific mappings for this column
         self._setup_column_specific_mappings()
+        
+        # Normalized sets built once (previously rebuilt on every lookup)
+        self._null_set = self._normalize_set(self.NULL_VALUES)
+        self._true_set = self._normalize_set(self.all_true_values)
+        self._false_set = self._normalize_set(self.all_false_values)
+        
+        # Partial matching only ever uses terms longer than 2 chars - filter once
+        self._true_partial = tuple(v for v in self._true_set if len(v) > 2)
+        self._false_partial = tuple(v for v in self._false_set if len(v) > 2)
+        self._true_contains = build_term_searcher(self._true_partial)
+        self._false_contains = build_term_searcher(self._false_partial)
+        
+        # Null partial matching uses every non-empty term ('' is an exact-only
+        # null token - as a substring it would match every value)
+        self._null_partial = tuple(v for v in self._null_set if v)
+        self._null_contains = build_term_searcher(self._null_partial)
+        
+        # Shared results: one per outcome (True / False / None) when notes are not tracked
+        self._shared_results: Dict[Optional[bool], ValidationResult] = {
+            outcome: ValidationResult(True, self._output_value(outcome)) for outcome in (True, False, None)
+        }
+        self._null_cell_result = (
+            self.create_success_result(processed_value=self.null_representation,
+                                       processing_notes=['Null boolean value handled'])
+            if self.track_original else self._shared_results[None]
+        )
+        
+        # Bounded per-instance memo of _map_impl (wrapping the bound method keeps self out of the key)
+        self._map_cached = functools.lru_cache(maxsize=MAP_CACHE_SIZE)(self._map_impl)
+        
+        # Exact-match table: normalized value -> True / False / None (null)
+        self._exact_lookup: Dict[str, Optional[bool]] = {
+            **dict.fromkeys(self._false_set, False),
+            **dict.fromkeys(self._true_set, True),
+            **dict.fromkeys(self._null_set, None),
+        }
+        
+        # Prebuilt results for every vocabulary token (มี/ไม่มี/1/0/yes/no/...):
+        # one plain dict probe, no normalization and no cache bookkeeping
+        self._fast_results: Dict[str, ValidationResult] = {
+            token: self._map_impl(token) for token in self._exact_lookup
+        }
+        self._fast_values: Dict[str, str] = {
+            token: result.processed_value for token, result in self._fast_results.items()
+        }
     
     def process(self, value: Any) -> ValidationResult:
         """Process boolean value (required by abstract base class)"""
@@ -121,48 +239,23 @@ class BooleanMapper(BaseValidator):
         Returns:
             ValidationResult with processed 1/0/NULL or error information
         """
-        # Handle truly null/empty values first
+        # Handle truly null/empty values first (prebuilt - the result never varies)
         if self.is_null_or_empty(value):
-            return self.create_success_result(
-                processed_value=self.null_representation,
-                original_value=value,
-                processing_notes=['Null boolean value handled']
-            )
+            return self._null_cell_result
         
         try:
             # Convert to string and clean
             str_value = str(value).strip()
             
-            # Check for null/unknown patterns
-            if self._is_null_value(str_value):
-                return self.create_success_result(
-                    processed_value=self.null_representation,
-                    original_value=value,
-                    processing_notes=['Unknown/null value mapped to empty']
-                )
-            
-            # Try boolean value mapping
-            boolean_result = self._map_boolean_value(str_value)
-            
-            if boolean_result[0] is not None:  # Mapping successful
-                is_true, processing_note = boolean_result
-                
-                if self.output_format == 'numeric':
-                    processed_value = '1' if is_true else '0'
-                else:
-                    processed_value = 'True' if is_true else 'False'
-                
-                return self.create_success_result(
-                    processed_value=processed_value,
-                    original_value=value,
-                    processing_notes=[processing_note]
-                )
-            else:
-                # Could not determine boolean value
-                return self.create_failure_result(
-                    original_value=value,
-                    errors=[f'Cannot determine boolean value for: {str_value}']
-                )
+            # Canonical tokens hit the prebuilt table; other repeated cells reuse the cached result
+            result = self._fast_results.get(str_value)
+            if result is not None:
+                return result
+            result = self._map_cached(str_value)
+            if not result.is_valid:
+                # Failures carry the original (unstripped / non-string) value
+                return result._replace(processed_value=value)
+            return result
             
         except Exception as e:
             return self.create_failure_result(
@@ -170,51 +263,157 @@ class BooleanMapper(BaseValidator):
                 errors=[f'Boolean processing error: {str(e)}']
             )
     
-    def _is_null_value(self, str_value: str) -> bool:
+    def _map_impl(self, str_value: str) -> ValidationResult:
         """
-        Check if string represents a null/unknown value
+        Map a stripped, non-empty string to its result (pure - cached per instance)
         
         Args:
-            str_value: String value to check
+            str_value: Stripped string value
             
         Returns:
-            True if value represents null/unknown
+            ValidationResult with processed 1/0/NULL or error information
         """
-        normalized_value = str_value.lower().strip() if not self.case_sensitive else str_value.strip()
+        # Fast path: exact match is a single dict lookup
+        normalized_value = self._normalize(str_value)
+        if normalized_value in self._exact_lookup:
+            is_true = self._exact_lookup[normalized_value]
+            return self._mapped_result(is_true, f"Mapped '{str_value}' to {is_true}")
+        
+        # Check for null/unknown patterns (exact tokens were all in the table above,
+        # so without partial matching there is nothing left to find here)
+        if self.partial_matching and self._is_null_value(normalized_value):
+            return self._mapped_result(None, 'Unknown/null value mapped to empty')
+        
+        # Try boolean value mapping
+        boolean_result = self._map_boolean_value(str_value, normalized_value)
+        
+        if boolean_result[0] is not None:  # Mapping successful
+            return self._mapped_result(*boolean_result)
+        else:
+            # Could not determine boolean value
+            return self.create_failure_result(
+                original_value=str_value,
+                errors=[f'Cannot determine boolean value for: {str_value}']
+            )
+    
+    def _output_value(self, is_true: Optional[bool]) -> str:
+        """Output representation of a mapped outcome (None = null/unknown)"""
+        if is_true is None:
+            return self.null_representation
+        if self.output_format == 'numeric':
+            return '1' if is_true else '0'
+        return 'True' if is_true else 'False'
+    
+    def _mapped_result(self, is_true: Optional[bool], processing_note: str) -> ValidationResult:
+        """Success result for a mapped outcome - shared instance unless notes are tracked"""
+        if not self.track_original:
+            return self._shared_results[is_true]
+        return self.create_success_result(
+            processed_value=self._output_value(is_true),
+            processing_notes=[processing_note]
+        )
+    
+    def process_batch(self, values: Any) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Validate a whole boolean column to 1/0/NULL output values
         
-        # Check exact matches
-        comparison_set = {v.lower() for v in self.NULL_VALUES} if not self.case_sensitive else self.NULL_VALUES
+        Canonical tokens are mapped with one vectorized Series.map over the
+        prebuilt token table; only the remaining rows go through the
+        (memoized) scalar path.
         
-        if normalized_value in comparison_set:
-            return True
+        Returns:
+            Tuple of (valid_mask, processed values object array)
+        """
+        series = pd.Series(values, copy=False)
+        stripped = series.astype('string').str.strip()
+        nulls = stripped.fillna('').eq('').to_numpy(dtype=bool)
+        mapped = stripped.map(self._fast_values)
+        
+        processed = mapped.to_numpy(dtype=object, na_value=None)
+        valid = np.ones(len(series), dtype=bool)
+        processed[nulls] = self.null_representation
+        
+        rest = np.flatnonzero(mapped.isna().to_numpy(dtype=bool) & ~nulls)
+        if len(rest):
+            rest_valid, rest_processed = super().process_batch(series.iloc[rest])
+            valid[rest] = rest_valid
+            processed[rest] = rest_processed
+        return valid, processed
+    
+    def process_series(self, values):
+        """
+        Map a whole pandas Series to the nullable 'boolean' dtype
         
-        # Check partial matches if enabled
-        if self.partial_matching:
-            for null_val in comparison_set:
-                if null_val in normalized_value or normalized_value in null_val:
-                    return True
+        Each distinct value is resolved once (dict lookup, then the pattern
+        fallbacks for unseen values) and the column is mapped in one pass.
         
-        return False
+        Args:
+            values: pandas Series of raw boolean cells
+            
+        Returns:
+            Series of dtype 'boolean' (True/False/<NA>)
+        """
+        normalized = values.astype('string').str.strip()
+        if not self.case_sensitive:
+            normalized = normalized.str.lower()
+        
+        lookup = self._exact_lookup
+        unseen = [v for v in normalized.dropna().unique() if v not in lookup]
+        if unseen:
+            lookup = dict(lookup)
+            for v in unseen:
+                lookup[v] = None if self._is_null_value(v) else self._map_boolean_value(v, v)[0]
+        
+        return normalized.map(lookup).astype('boolean')
     
-    def _map_boolean_value(self, str_value: str) -> tuple[Optional[bool], str]:
+    def _normalize(self, str_value: str) -> str:
+        """Normalize a value for set/dict lookups (strip, lowercase unless case sensitive)"""
+        return str_value.strip() if self.case_sensitive else str_value.lower().strip()
+    
+    def _normalize_set(self, values: set) -> frozenset:
+        """Normalize a vocabulary set once for lookups"""
+        return frozenset(values) if self.case_sensitive else frozenset(v.lower() for v in values)
+    
+    def _is_null_value(self, normalized_value: str) -> bool:
         """
-        Map string value to boolean
+        Check if string represents a null/unknown value
         
         Args:
-            str_value: String value to map
+            normalized_value: Value already passed through _normalize
             
         Returns:
-            Tuple of (boolean_value_or_None, processing_note)
+            True if value represents null/unknown
         """
-        normalized_value = str_value.lower().strip() if not self.case_sensitive else str_value.strip()
+        # Exact match: one hash probe
+        if normalized_value in self._null_set:
+            return True
         
-        # Check true values
-        if self._matches_value_set(normalized_value, self.all_true_values):
-            return True, f"Mapped '{str_value}' to True"
+        # Partial match: value contains a null term, or is contained in one
+        return self.partial_matching and normalized_value != '' and (
+            self._null_contains(normalized_value)
+            or any(normalized_value in term for term in self._null_partial)
+        )
+    
+    def _map_boolean_value(self, str_value: str, normalized_value: str) -> tuple[Optional[bool], str]:
+        """
+        Map string value to boolean
         
-        # Check false values
-        if self._matches_value_set(normalized_value, self.all_false_values):
-            return False, f"Mapped '{str_value}' to False"
+        Args:
+            str_value: String value to map (used for notes and pattern matching)
+            normalized_value: The same value passed through _normalize (callers
+                have already missed _exact_lookup with it)
+            
+        Returns:
+            Tuple of (boolean_value_or_None, processing_note)
+        """
+        if self.partial_matching:
+            # Check true values
+            if self._matches_value_set(normalized_value, self._true_set, self._true_partial, self._true_contains):
+                return True, f"Mapped '{str_value}' to True"
+            
+            # Check false values
+            if self._matches_value_set(normalized_value, self._false_set, self._false_partial, self._false_contains):
+                return False, f"Mapped '{str_value}' to False"
         
         # Try pattern-based matching for complex medical descriptions
         pattern_result = self._match_medical_patterns(str_value)
@@ -228,31 +427,34 @@ class BooleanMapper(BaseValidator):
         
         return None, f"Could not map '{str_value}' to boolean value"
     
-    def _matches_value_set(self, normalized_value: str, value_set: set) -> bool:
+    def _matches_value_set(self, normalized_value: str, exact_values: frozenset,
+                           substring_terms: tuple,
+                           contains_term: Callable[[str], bool]) -> bool:
         """
-        Check if normalized value matches any value in the set
+        Check if normalized value matches a vocabulary (pre-partitioned at init)
         
         Args:
             normalized_value: Normalized string value
-            value_set: Set of values to check against
+            exact_values: Normalized vocabulary for exact matching
+            substring_terms: Vocabulary terms longer than 2 chars, for partial matching
+            contains_term: Searcher over substring_terms from build_term_searcher
             
         Returns:
             True if value matches
         """
-        comparison_set = {v.lower() for v in value_set} if not self.case_sensitive else value_set
-        
         # Exact match
-        if normalized_value in comparison_set:
+        if normalized_value in exact_values:
             return True
         
-        # Partial match if enabled
-        if self.partial_matching:
-            for val in comparison_set:
-                # Check if the value contains or is contained in any of the set values
-                if (len(val) > 2 and val in normalized_value) or (len(normalized_value) > 2 and normalized_value in val):
-                    return True
+        if not self.partial_matching:
+            return False
         
-        return False
+        # Partial match: value contains a term, or (if longer than 2 chars) is contained in one.
+        # A value longer than 2 chars can only sit inside a term longer than 2 chars,
+        # so both directions only need substring_terms.
+        if contains_term(normalized_value):
+            return True
+        return len(normalized_value) > 2 and any(normalized_value in term for term in substring_terms)
     
     def _match_medical_patterns(self, str_value: str) -> tuple[Optional[bool], str]:
         """
@@ -264,30 +466,13 @@ class BooleanMapper(BaseValidator):
         Returns:
             Tuple of (boolean_value_or_None, processing_note)
         """
-        str_lower = str_value.lower()
-        
         # Patterns indicating positive/true condition
-        positive_patterns = [
-            r'(ป่วย|เป็น|มี).*(?:' + '|'.join(['โรค', 'อาการ', 'ความดัน', 'เบาหวาน', 'หัวใจ']) + ')',
-            r'(?:ได้รับ|มี).*(?:การวินิจฉัย|การรักษา|การดูแล)',
-            r'(?:ระดับ|ค่า).*(?:สูง|ต่ำ|ผิดปกติ)',
-            r'(?:ประวัติ|ได้รับ).*(?:การรักษา|การผ่าตัด)'
-        ]
-        
-        for pattern in positive_patterns:
-            if re.search(pattern, str_value):
-                return True, f"Medical pattern matched: positive condition detected"
+        if self.POSITIVE_PATTERN.search(str_value):
+            return True, f"Medical pattern matched: positive condition detected"
         
         # Patterns indicating negative/false condition
-        negative_patterns = [
-            r'(?:ไม่|ไม่มี|ไม่เป็น|ไม่ป่วย).*(?:โรค|อาการ|ความดัน)',
-            r'(?:สุขภาพ|ร่างกาย).*(?:ดี|ปกติ|แข็งแรง)',
-            r'(?:ไม่ได้|ไม่มี).*(?:การรักษา|การดูแล|ประวัติ)'
-        ]
-        
-        for pattern in negative_patterns:
-            if re.search(pattern, str_value):
-                return False, f"Medical pattern matched: negative condition detected"
+        if self.NEGATIVE_PATTERN.search(str_value):
+            return False, f"Medical pattern matched: negative condition detected"
         
         return None, "No medical pattern matched"
     
@@ -302,10 +487,16 @@ class BooleanMapper(BaseValidator):
             Tuple of (boolean_value_or_None, processing_note)
         """
         try:
-            # Extract numeric value
-            numeric_match = re.search(r'(\d+(?:\.\d+)?)', str_value)
-            if numeric_match:
-                numeric_value = float(numeric_match.group(1))
+            text = str_value.strip()
+            if text.replace('.', '', 1).isdigit() and text.isascii():
+                # Plain number ("1", "0.0", "2") - parse directly, no regex
+                numeric_value = float(text)
+            else:
+                # Number embedded in text - extract the first one
+                numeric_match = self.NUMBER_PATTERN.search(text)
+                numeric_value = float(numeric_match.group(1)) if numeric_match else None
+            
+            if numeric_value is not None:
                 if numeric_value == 0:
                     return False, f"Numeric interpretation: {numeric_value} -> False"
                 elif numeric_value == 1:
@@ -321,25 +512,12 @@ class BooleanMapper(BaseValidator):
         """
         Setup column-specific boolean mappings based on column name
         """
+        # Thai keys are unaffected by lower(), so one lowered name serves both
         column_lower = self.column_name.lower()
         
-        # Medical condition specific mappings
-        if 'ความดันโลหิตสูง' in self.column_name or 'hypertension' in column_lower:
-            self.all_true_values.update(['ความดันสูง', 'bp สูง', 'htn', 'hypertensive'])
-            self.all_false_values.update(['ความดันปกติ', 'bp ปกติ', 'normotensive'])
-        
-        elif 'เบาหวาน' in self.column_name or 'diabetes' in column_lower:
-            self.all_true_values.update(['dm', 'diabetic', 'น้ำตาลในเลือดสูง', 'เบาหวานชนิดที่ 1', 'เบาหวานชนิดที่ 2'])
-            self.all_false_values.update(['ไม่เป็นเบาหวาน', 'น้ำตาลในเลือดปกติ', 'non-diabetic'])
-        
-        elif 'หัวใจ' in self.column_name or 'cardiovascular' in column_lower or 'cardiac' in column_lower:
-            self.all_true_values.update(['โรคหัวใจ', 'cardiac', 'cvd', 'หัวใจล้มเหลว', 'heart failure'])
-            self.all_false_values.update(['หัวใจปกติ', 'cardiac normal', 'no cvd'])
-        
-        elif 'หอบหืด' in self.column_name or 'asthma' in column_lower:
-            self.all_true_values.update(['asthmatic', 'มีอาการหอบหืด', 'ระบบทางเดินหายใจผิดปกติ'])
-            self.all_false_values.update(['ไม่หอบหืด', 'ระบบทางเดินหายใจปกติ', 'no asthma'])
-        
-        elif 'โรคตับ' in self.column_name or 'liver' in column_lower:
-            self.all_true_values.update(['liver disease', 'ตับแข็ง', 'ตับอักเสบ', 'hepatitis'])
-            self.all_false_values.update(['ตับปกติ', 'liver normal', 'no liver disease'])
\ No newline at end of file
+        # Medical condition specific mappings - first matching rule wins
+        for name_keys, true_terms, false_terms in self._CONDITION_RULES:
+            if any(key in column_lower for key in name_keys):
+                self.all_true_values |= true_terms
+                self.all_false_values |= false_terms
+                break
\ No newline at end of file
@@ -8,9 +8,89 @@ Includes month name extraction for derived fields.
 
 import re
 from datetime import datetime, date
-from typing import Any, Optional, Dict, Tuple
+from typing import Any, Callable, Optional, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
 from .base_validator import BaseValidator, ValidationResult
 
+# pyahocorasick is optional - one-pass month-name search in _parse_thai_month_format
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+# The dominant input shape in ว/ด/ป เสียชีวิต: M/D/YYYY (e.g. 3/20/2561).
+# ASCII digits only - Thai/other digits go through _parse_date_string
+MDY_PATTERN = r'^([0-9]{1,2})/([0-9]{1,2})/([0-9]{4})$'
+
+# พ.ศ. = ค.ศ. + 543
+BUDDHIST_ERA_OFFSET = 543
+
+
+def to_gregorian_year(year, buddhist_era_cutoff: int):
+    """
+    Convert a year above the cutoff from Buddhist Era to Gregorian
+    
+    Branchless, so the same expression works on ints and element-wise on
+    numpy arrays / pandas Series (NaN stays NaN).
+    """
+    return year - BUDDHIST_ERA_OFFSET * (year > buddhist_era_cutoff)
+
+
+def plausible_ymd(first: int, second: int, third: int, buddhist_era_cutoff: int):
+    """
+    Yield plausible (year, month, day) readings of three date numbers
+    
+    Readings are tried in order M/D/Y, D/M/Y, then year-first; Buddhist
+    years are shifted by 543 and two-digit years pivot at 50. Pure integer
+    arithmetic - the caller only builds a date() for readings that pass
+    the month/day range check.
+    """
+    for month, day, year in ((first, second, third), (second, first, third), (third, second, first)):
+        year = to_gregorian_year(year, buddhist_era_cutoff)
+        if year < 100:  # Two-digit year
+            year += 2000 if year < 50 else 1900
+        if 1 <= month <= 12 and 1 <= day <= 31:
+            yield year, month, day
+
+
+def build_month_scanner(month_tokens) -> Callable[[str], Optional[Tuple[int, str]]]:
+    """
+    Build a one-pass finder for month names
+    
+    Args:
+        month_tokens: Iterable of (lowercase token, month_num, month_name) in
+            priority order - the first listed token wins when several occur
+    
+    Returns:
+        Function mapping lowercased text to (month_num, month_name) of the
+        highest-priority token it contains, or None
+    """
+    priority = {}
+    for token, month_num, month_name in month_tokens:
+        priority.setdefault(token, (len(priority), month_num, month_name))
+    
+    if AHOCORASICK_AVAILABLE:
+        automaton = ahocorasick.Automaton()
+        for token, entry in priority.items():
+            automaton.add_word(token, entry)
+        automaton.make_automaton()
+        hits = lambda text: (entry for _, entry in automaton.iter(text))
+    else:
+        # Lookahead keeps overlapping hits (Mar / March); alternation follows
+        # priority order, so each position reports its best token
+        finditer = re.compile('(?=(' + '|'.join(map(re.escape, priority)) + '))').finditer
+        hits = lambda text: (priority[match.group(1)] for match in finditer(text))
+    
+    def find(text: str) -> Optional[Tuple[int, str]]:
+        best = min(hits(text), default=None)
+        return None if best is None else best[1:]
+    return find
+
 
 class DateProcessor(BaseValidator):
     """
@@ -33,6 +113,9 @@ class DateProcessor(BaseValidator):
     # Reverse mapping for parsing Thai month names
     THAI_MONTH_NAMES_TO_NUM = {v: k for k, v in THAI_MONTHS.items()}
     
+    # Month number -> Thai name as a plain tuple (index 0 unused) for direct indexing
+    _THAI_MONTH_BY_NUM = (None,) + tuple(name for _, name in sorted(THAI_MONTHS.items()))
+    
     # Additional Thai month abbreviations and variations
     THAI_MONTH_VARIATIONS = {
         'ม.ค.': 1, 'มค': 1, 'Jan': 1, 'January': 1,
@@ -49,6 +132,39 @@ class DateProcessor(BaseValidator):
         'ธ.ค.': 12, 'ธค': 12, 'Dec': 12, 'December': 12
     }
     
+    # Full names first, then variations (case-insensitive) - one scan per date string
+    _find_month_name = staticmethod(build_month_scanner(
+        [(name, month_num, name) for name, month_num in THAI_MONTH_NAMES_TO_NUM.items()]
+        + [(abbrev.lower(), month_num, abbrev) for abbrev, month_num in THAI_MONTH_VARIATIONS.items()]
+    ))
+    
+    # Cleaning / extraction patterns, compiled once
+    _RE_THAI_PREFIX = re.compile(r'(วันที่|ว/ด/ป|เมื่อ)')
+    _RE_SEP_DOTSPACE = re.compile(r'[.\s]+')
+    _RE_SEP_COMMA = re.compile(r'[,]+')
+    _RE_NUMBERS = re.compile(r'\d+')
+    _RE_ISO = re.compile(r'\d{4}-\d{2}-\d{2}')
+    _RE_NUMERIC_DATE = re.compile(r'(\d{1,4})([-/])(\d{1,2})\2(\d{1,4})')
+    
+    # input_formats the numeric matcher handles without strptime: format -> (separator, field order)
+    _NUMERIC_LAYOUTS = {
+        '%m/%d/%Y': ('/', 'mdY'),
+        '%d/%m/%Y': ('/', 'dmY'),
+        '%Y/%m/%d': ('/', 'Ymd'),
+        '%m-%d-%Y': ('-', 'mdY'),
+        '%d-%m-%Y': ('-', 'dmY'),
+        '%Y-%m-%d': ('-', 'Ymd'),
+        '%m/%d/%y': ('/', 'mdy'),
+        '%d/%m/%y': ('/', 'dmy'),
+    }
+    # Digit widths strptime accepts per directive
+    _FIELD_WIDTHS = {'m': (1, 2), 'd': (1, 2), 'Y': (4, 4), 'y': (2, 2)}
+    
+    # Strings made only of these cannot contain a month name
+    _NUMERIC_DATE_CHARS = frozenset('0123456789/-. ')
+    # Thai numerals -> Arabic numerals
+    _THAI_DIGIT_TRANS = str.maketrans('๐๑๒๓๔๕๖๗๘๙', '0123456789')
+    
     def __init__(self, column_name: str, validation_config: Optional[Dict] = None):
         """
         Initialize date processor
@@ -84,6 +200,81 @@ class DateProcessor(BaseValidator):
         """Process date value (required by abstract base class)"""
         return self.validate_and_process(value)
     
+    def parse_dates_batch(self, values: Any) -> np.ndarray:
+        """
+        Parse a whole date column to datetime64[D]
+        
+        M/D/YYYY cells are split and assembled with vectorized pandas ops;
+        only the remaining distinct values go through _parse_date_string.
+        
+        Args:
+            values: Array-like of raw date cells
+            
+        Returns:
+            datetime64[D] array, NaT where the value is null or unparseable
+        """
+        text = pd.Series(values, copy=False).astype('string').str.strip()
+        parts = text.str.extract(MDY_PATTERN).apply(pd.to_numeric, errors='coerce').astype('float64')
+        month, day, year = parts[0], parts[1], parts[2]
+        year = to_gregorian_year(year, self.buddhist_era_cutoff)
+        parsed = pd.to_datetime(
+            pd.DataFrame({'year': year, 'month': month, 'day': day}), errors='coerce'
+        ).to_numpy(dtype='datetime64[D]', copy=True)
+        
+        # Other layouts (D/M/Y, Thai month names, ...) - once per distinct value
+        leftover = np.isnat(parsed) & text.fillna('').ne('').to_numpy(dtype=bool)
+        if leftover.any():
+            lookup = {}
+            for raw in pd.unique(text[leftover]):
+                ok, parsed_date, _ = self._parse_date_string(raw)
+                lookup[raw] = np.datetime64(parsed_date, 'D') if ok else np.datetime64('NaT', 'D')
+            parsed[leftover] = text[leftover].map(lookup).to_numpy(dtype='datetime64[D]')
+        return parsed
+    
+    def process_batch(self, values: Any) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Validate a whole date column (vectorized version of validate_and_process)
+        
+        Returns:
+            Tuple of (valid_mask, processed) with ISO date strings for valid
+            dates, the null value for empty cells and the original value
+            for invalid ones
+        """
+        series = pd.Series(values, copy=False)
+        nulls = np.fromiter((self.is_null_or_empty(v) for v in series), dtype=bool, count=len(series))
+        dates = self.parse_dates_batch(series)
+        ok = self._accepted_dates(dates)
+        
+        processed = series.to_numpy(dtype=object, copy=True)
+        processed[ok] = np.datetime_as_string(dates[ok], unit='D').astype(object)
+        processed[nulls] = self.handle_null_value()
+        return ok | nulls, processed
+    
+    def process_series(self, values: pd.Series) -> pd.Series:
+        """
+        Convert a whole pandas Series to ISO date strings
+        
+        Args:
+            values: pandas Series of raw date cells
+            
+        Returns:
+            Series of dtype 'string' (YYYY-MM-DD) on the same index, <NA> where
+            the cell is null, unparseable, out of range or a disallowed future date
+        """
+        dates = self.parse_dates_batch(values)
+        ok = self._accepted_dates(dates)
+        iso = np.full(len(dates), None, dtype=object)
+        iso[ok] = np.datetime_as_string(dates[ok], unit='D')
+        return pd.Series(iso, index=values.index, dtype='string')
+    
+    def _accepted_dates(self, dates: np.ndarray) -> np.ndarray:
+        """Mask of parsed dates passing the year range and future-date checks"""
+        years = dates.astype('datetime64[Y]').astype(np.int64) + 1970
+        ok = ~np.isnat(dates) & (years >= self.min_year) & (years <= self.max_year)
+        if not self.allow_future_dates:
+            ok &= dates <= np.datetime64(date.today(), 'D')
+        return ok
+    
     def validate_and_process(self, value: Any) -> ValidationResult:
         """
         Validate and process a date value
@@ -162,7 +353,7 @@ class DateProcessor(BaseValidator):
         try:
             if isinstance(date_value, str):
                 # Try to parse ISO format first
-                if re.match(r'\d{4}-\d{2}-\d{2}', date_value):
+                if self._RE_ISO.match(date_value):
                     parsed_date = datetime.strptime(date_value, '%Y-%m-%d').date()
                 else:
                     parse_result = self._parse_date_string(date_value)
@@ -174,8 +365,7 @@ class DateProcessor(BaseValidator):
             else:
                 return None
             
-            month_num = parsed_date.month
-            return self.THAI_MONTHS.get(month_num)
+            return self._THAI_MONTH_BY_NUM[parsed_date.month]
             
         except Exception:
             return None
@@ -190,20 +380,36 @@ class DateProcessor(BaseValidator):
         Returns:
             Tuple of (success, parsed_date, processing_note)
         """
+        # Fast path for plain M/D/YYYY: split + int() instead of regex cleaning and strptime
+        fast_result = self._parse_mdy_fast(date_str)
+        if fast_result is not None:
+            return fast_result
+        
         # Clean the date string
         cleaned_date = self._clean_date_string(date_str)
         
-        # Try parsing with Thai month names first
-        thai_month_result = self._parse_thai_month_format(cleaned_date)
-        if thai_month_result[0]:
-            return thai_month_result
+        # Try parsing with Thai month names first (only if there are letters to match)
+        if not self._NUMERIC_DATE_CHARS.issuperset(cleaned_date):
+            thai_month_result = self._parse_thai_month_format(cleaned_date)
+            if thai_month_result[0]:
+                return thai_month_result
         
-        # Try parsing with standard date formats
+        # Try parsing with standard date formats - one regex match, then integer
+        # checks per layout instead of a strptime ValueError for every miss
+        numeric_match = self._RE_NUMERIC_DATE.fullmatch(cleaned_date)
         for fmt in self.input_formats:
+            layout = self._NUMERIC_LAYOUTS.get(fmt)
+            if layout is not None:
+                parsed_date = self._match_numeric_layout(numeric_match, *layout) if numeric_match else None
+                if parsed_date is None:
+                    continue
+            else:
+                try:
+                    parsed_date = datetime.strptime(cleaned_date, fmt).date()
+                except ValueError:
+                    continue
+            
             try:
-                parsed_datetime = datetime.strptime(cleaned_date, fmt)
-                parsed_date = parsed_datetime.date()
-                
                 # Convert Buddhist year to Gregorian if needed
                 if parsed_date.year > self.buddhist_era_cutoff:
                     gregorian_year = parsed_date.year - 543
@@ -224,6 +430,61 @@ class DateProcessor(BaseValidator):
         
         return False, None, f"No matching date format found for: {cleaned_date}"
     
+    def _match_numeric_layout(self, match: re.Match, separator: str, order: str) -> Optional[date]:
+        """
+        Read a _RE_NUMERIC_DATE match the way strptime would read one layout
+        
+        Args:
+            match: Match of _RE_NUMERIC_DATE against the cleaned string
+            separator: '/' or '-' the layout expects
+            order: Field order, e.g. 'mdY' for %m/%d/%Y
+            
+        Returns:
+            Date (year not yet Buddhist-converted), or None if the layout does not fit
+        """
+        first, found_separator, second, third = match.groups()
+        if found_separator != separator:
+            return None
+        
+        fields = {}
+        for code, text in zip(order, (first, second, third)):
+            min_width, max_width = self._FIELD_WIDTHS[code]
+            if not min_width <= len(text) <= max_width:
+                return None
+            fields[code] = int(text)
+        
+        year = fields.get('Y')
+        if year is None:  # %y pivots like strptime: 00-68 -> 20xx, 69-99 -> 19xx
+            year = fields['y'] + (2000 if fields['y'] <= 68 else 1900)
+        try:
+            return date(year, fields['m'], fields['d'])
+        except ValueError:
+            return None
+    
+    def _parse_mdy_fast(self, date_str: str) -> Optional[Tuple[bool, date, str]]:
+        """
+        Parse ASCII M/D/YYYY without regex or strptime
+        
+        Returns the same result _parse_date_string would (first format tried
+        is %m/%d/%Y), or None so the caller falls back to the general path.
+        """
+        parts = date_str.split('/')
+        if len(parts) != 3 or not date_str.isascii():
+            return None
+        month_str, day_str, year_str = parts
+        if not (len(month_str) <= 2 and len(day_str) <= 2 and len(year_str) == 4
+                and month_str.isdigit() and day_str.isdigit() and year_str.isdigit()):
+            return None
+        
+        month, day, year = int(month_str), int(day_str), int(year_str)
+        try:
+            if year > self.buddhist_era_cutoff:
+                parsed_date = date(year - 543, month, day)
+                return True, parsed_date, f"Parsed %m/%d/%Y, converted Buddhist year {year} to Gregorian {year - 543}"
+            return True, date(year, month, day), "Parsed with format %m/%d/%Y"
+        except ValueError:
+            return None
+    
     def _clean_date_string(self, date_str: str) -> str:
         """
         Clean and normalize date string for parsing
@@ -238,20 +499,14 @@ class DateProcessor(BaseValidator):
         cleaned = date_str.strip()
         
         # Remove Thai date indicators
-        cleaned = re.sub(r'(วันที่|ว/ด/ป|เมื่อ)', '', cleaned)
-        
-        # Replace Thai numerals with Arabic numerals (basic implementation)
-        thai_to_arabic = {
-            '๐': '0', '๑': '1', '๒': '2', '๓': '3', '๔': '4',
-            '๕': '5', '๖': '6', '๗': '7', '๘': '8', '๙': '9'
-        }
+        cleaned = self._RE_THAI_PREFIX.sub('', cleaned)
         
-        for thai_num, arabic_num in thai_to_arabic.items():
-            cleaned = cleaned.replace(thai_num, arabic_num)
+        # Replace Thai numerals with Arabic numerals (single translate pass)
+        cleaned = cleaned.translate(self._THAI_DIGIT_TRANS)
         
         # Normalize separators
-        cleaned = re.sub(r'[.\s]+', '/', cleaned)
-        cleaned = re.sub(r'[,]+', '/', cleaned)
+        cleaned = self._RE_SEP_DOTSPACE.sub('/', cleaned)
+        cleaned = self._RE_SEP_COMMA.sub('/', cleaned)
         
         # Clean extra whitespace
         cleaned = ' '.join(cleaned.split())
@@ -268,53 +523,47 @@ class DateProcessor(BaseValidator):
         Returns:
             Tuple of (success, parsed_date, processing_note)
         """
-        # Look for Thai month names in the string
-        month_found = None
-        month_name = None
-        
-        # Check full Thai month names
-        for thai_month, month_num in self.THAI_MONTH_NAMES_TO_NUM.items():
-            if thai_month in date_str:
-                month_found = month_num
-                month_name = thai_month
-                break
-        
-        # Check abbreviations and variations
-        if month_found is None:
-            for abbrev, month_num in self.THAI_MONTH_VARIATIONS.items():
-                if abbrev.lower() in date_str.lower():
-                    month_found = month_num
-                    month_name = abbrev
-                    break
-        
-        if month_found is None:
+        # Look for Thai month names (full names, then abbreviations and variations)
+        month_hit = self._find_month_name(date_str.lower())
+        if month_hit is None:
             return False, None, "No Thai month name found"
+        month_found, month_name = month_hit
         
         # Extract day and year from remaining text
         remaining_text = date_str.replace(month_name, '').strip()
         
         # Look for day and year patterns
-        numbers = re.findall(r'\d+', remaining_text)
+        numbers = self._extract_numbers(remaining_text)
         
         if len(numbers) < 2:
             return False, None, f"Insufficient date components with month {month_name}"
         
         try:
             # Assume first number is day, second is year
-            day = int(numbers[0])
-            year = int(numbers[1])
+            day, year = numbers[0], numbers[1]
             
             # Convert Buddhist year if needed
-            if year > self.buddhist_era_cutoff:
-                year = year - 543
-            
-            parsed_date = date(year, month_found, day)
+            parsed_date = date(to_gregorian_year(year, self.buddhist_era_cutoff), month_found, day)
             
             return True, parsed_date, f"Parsed Thai month format with {month_name}"
             
         except (ValueError, TypeError):
             return False, None, f"Invalid date components: day={numbers[0]}, month={month_name}, year={numbers[1]}"
     
+    @classmethod
+    def _extract_numbers(cls, text: str) -> List[int]:
+        """
+        Integers appearing in a cleaned date string, in order
+        
+        Cleaned strings are normally digit runs between '/' or '-', which
+        str.split handles; parts mixing digits with other characters fall
+        back to the regex so the result always equals _RE_NUMBERS.findall.
+        """
+        parts = text.replace('-', '/').replace(' ', '/').split('/')
+        if all(part.isdecimal() or not part for part in parts):
+            return [int(part) for part in parts if part]
+        return [int(number) for number in cls._RE_NUMBERS.findall(text)]
+    
     def _parse_alternative_formats(self, date_str: str) -> Tuple[bool, Optional[date], str]:
         """
         Try alternative parsing strategies for edge cases
@@ -326,29 +575,15 @@ class DateProcessor(BaseValidator):
             Tuple of (success, parsed_date, processing_note)
         """
         # Try to extract numbers and make reasonable assumptions
-        numbers = re.findall(r'\d+', date_str)
+        numbers = self._extract_numbers(date_str)
         
         if len(numbers) == 3:
-            # Three numbers: try different combinations
-            combinations = [
-                (int(numbers[0]), int(numbers[1]), int(numbers[2])),  # M/D/Y
-                (int(numbers[1]), int(numbers[0]), int(numbers[2])),  # D/M/Y
-                (int(numbers[2]), int(numbers[1]), int(numbers[0]))   # Y/M/D
-            ]
-            
-            for month, day, year in combinations:
+            # Three numbers: try the plausible combinations in order
+            for year, month, day in plausible_ymd(*numbers, self.buddhist_era_cutoff):
                 try:
-                    # Convert Buddhist year if needed
-                    if year > self.buddhist_era_cutoff:
-                        year = year - 543
-                    elif year < 100:  # Two-digit year
-                        year = year + 2000 if year < 50 else year + 1900
-                    
-                    if 1 <= month <= 12 and 1 <= day <= 31:
-                        parsed_date = date(year, month, day)
-                        return True, parsed_date, f"Alternative parsing: {month}/{day}/{year}"
-                        
-                except ValueError:
+                    parsed_date = date(year, month, day)
+                    return True, parsed_date, f"Alternative parsing: {month}/{day}/{year}"
+                except ValueError:  # e.g. 2/30 - try the next reading
                     continue
         
         return False, None, "All alternative parsing strategies failed"
@@ -5,11 +5,167 @@ This module implements MulticlassValidator class for handling categorical
 columns with controlled vocabulary, fuzzy matching, and normalization.
 """
 
+import functools
+import itertools
 import re
-from typing import Any, Optional, Dict, List, Set
+from bisect import bisect_left, bisect_right
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, Tuple
 from difflib import get_close_matches
+
+import numpy as np
+import pandas as pd
+
 from .base_validator import BaseValidator, ValidationResult
 
+# rapidfuzz is optional - C++ similarity scoring for fuzzy matching (difflib otherwise)
+try:
+    from rapidfuzz import fuzz, process as fuzz_process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# pyahocorasick is optional - one-pass search for vocabulary items inside a value
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Distinct raw values remembered per MulticlassValidator
+MATCH_CACHE_SIZE = 8192
+
+# Joins vocabulary items into one searchable string for partial matching
+_ITEM_SEPARATOR = '\x00'
+
+
+def build_contained_finder(terms) -> Callable[[str], Iterable[str]]:
+    """
+    Build a function listing the terms that occur inside a text
+    
+    With pyahocorasick every occurrence is reported in one scan; the regex
+    fallback reports the longest term starting at each position, which is
+    all partial matching needs since a longer contained term scores higher.
+    """
+    terms = sorted(set(filter(None, terms)), key=len, reverse=True)
+    if not terms:
+        return lambda text: ()
+    
+    if AHOCORASICK_AVAILABLE:
+        automaton = ahocorasick.Automaton()
+        for term in terms:
+            automaton.add_word(term, term)
+        automaton.make_automaton()
+        return lambda text: (term for _, term in automaton.iter(text))
+    
+    finditer = re.compile('(?=(' + '|'.join(map(re.escape, terms)) + '))').finditer
+    return lambda text: (match.group(1) for match in finditer(text))
+
+
+# Column vocabularies and normalization maps - built once, shared by every instance
+
+# Thai provinces
+_THAI_PROVINCES: FrozenSet[str] = frozenset({
+    'กรุงเทพฯ', 'กรุงเทพมหานคร', 'กระบี่', 'กาญจนบุรี', 'กาฬสินธุ์', 'กำแพงเพชร',
+    'ขอนแก่น', 'จันทบุรี', 'ฉะเชิงเทรา', 'ชลบุรี', 'ชัยนาท', 'ชัยภูมิ', 'ชุมพร',
+    'เชียงราย', 'เชียงใหม่', 'ตรัง', 'ตราด', 'ตาก', 'นครนายก', 'นครปฐม', 'นครพนม',
+    'นครราชสีมา', 'นครศรีธรรมราช', 'นครสวรรค์', 'นนทบุรี', 'นราธิวาส', 'น่าน',
+    'บึงกาฬ', 'บุรีรัมย์', 'ปทุมธานี', 'ประจวบคีรีขันธ์', 'ปราจีนบุรี', 'ปัตตานี',
+    'พระนครศรีอยุธยา', 'พะเยา', 'พังงา', 'พัทลุง', 'พิจิตร', 'พิษณุโลก', 'เพชรบุรี',
+    'เพชรบูรณ์', 'แพร่', 'ภูเก็ต', 'มหาสารคาม', 'มุกดาหาร', 'แม่ฮ่องสอน', 'ยะลา',
+    'ยโสธร', 'ร้อยเอ็ด', 'ระนอง', 'ระยอง', 'ราชบุรี', 'ลพบุรี', 'ลำปาง', 'ลำพูน',
+    'เลย', 'ศรีสะเกษ', 'สกลนคร', 'สงขลา', 'สตูล', 'สมุทรปราการ', 'สมุทรสงคราม',
+    'สมุทรสาคร', 'สระแก้ว', 'สระบุรี', 'สิงห์บุรี', 'สุโขทัย', 'สุพรรณบุรี', 'สุราษฎร์ธานี',
+    'สุรินทร์', 'หนองคาย', 'หนองบัวลำภู', 'อ่างทอง', 'อำนาจเจริญ', 'อุดรธานี',
+    'อุตรดิตถ์', 'อุทัยธานี', 'อุบลราชธานี'
+})
+
+# Thai regions
+_THAI_REGIONS: FrozenSet[str] = frozenset({
+    'ภาคเหนือ', 'ภาคกลางและตะวันตก', 'ภาคตะวันออกเฉียงเหนือ', 
+    'ภาคตะวันออก', 'ภาคใต้', 'ภาคกลาง', 'ภาคตะวันตก'
+})
+
+# Gender
+_GENDER_VOCAB: FrozenSet[str] = frozenset({'ชาย', 'หญิง', 'ไม่ระบุ'})
+
+# Status
+_STATUS_VOCAB: FrozenSet[str] = frozenset({'เสียชีวิต', 'รอดชีวิต', 'ไม่ระบุ', 'รักษาอยู่'})
+
+# Thai months
+_THAI_MONTHS: FrozenSet[str] = frozenset({
+    'มกราคม', 'กุมภาพันธ์', 'มีนาคม', 'เมษายน', 'พฤษภาคม', 'มิถุนายน',
+    'กรกฎาคม', 'สิงหาคม', 'กันยายน', 'ตุลาคม', 'พฤศจิกายน', 'ธันวาคม'
+})
+
+# Occupations (common Thai occupations)
+_OCCUPATIONS: FrozenSet[str] = frozenset({
+    'เกษตรกร', 'รับจ้าง', 'พนักงานบริษัท', 'ข้าราชการ', 'ค้าขาย', 'แม่บ้าน',
+    'นักเรียน', 'นักศึกษา', 'พนักงานร้านอาหาร', 'ช่างซ่อม', 'คนขับรถ',
+    'แรงงาน', 'ผู้ประกอบการ', 'วิศวกร', 'ครู', 'แพทย์', 'พยาบาล',
+    'ไม่ระบุ', 'เร่ร่อน', 'ว่างงาน', 'เกษียณอายุ'
+})
+
+# Province normalizations
+_PROVINCE_NORMALIZATION: Mapping[str, str] = MappingProxyType({
+    'กรุงเทพ': 'กรุงเทพฯ',
+    'กรุงเทพมหานคร': 'กรุงเทพฯ',
+    'bangkok': 'กรุงเทพฯ',
+    'bkk': 'กรุงเทพฯ',
+    'chonburi': 'ชลบุรี',
+    'chiangmai': 'เชียงใหม่',
+    'chiang mai': 'เชียงใหม่',
+    'phuket': 'ภูเก็ต',
+    'khon kaen': 'ขอนแก่น',
+    'korat': 'นครราชสีมา',
+    'nakhon ratchasima': 'นครราชสีมา',
+    'ubon ratchathani': 'อุบลราชธานี',
+    'ubon': 'อุบลราชธานี',
+    'udon thani': 'อุดรธานี',
+    'udon': 'อุดรธานี'
+})
+
+# Region normalizations
+_REGION_NORMALIZATION: Mapping[str, str] = MappingProxyType({
+    'เหนือ': 'ภาคเหนือ',
+    'ใต้': 'ภาคใต้',
+    'อีสาน': 'ภาคตะวันออกเฉียงเหนือ',
+    'ตะวันออกเฉียงเหนือ': 'ภาคตะวันออกเฉียงเหนือ',
+    'กลาง': 'ภาคกลางและตะวันตก',
+    'ตะวันตก': 'ภาคกลางและตะวันตก',
+    'ตะวันออก': 'ภาคตะวันออก'
+})
+
+# Gender normalizations
+_GENDER_NORMALIZATION: Mapping[str, str] = MappingProxyType({
+    'male': 'ชาย',
+    'female': 'หญิง',
+    'man': 'ชาย',
+    'woman': 'หญิง',
+    'm': 'ชาย',
+    'f': 'หญิง',
+    'ผู้ชาย': 'ชาย',
+    'ผู้หญิง': 'หญิง',
+    'unknown': 'ไม่ระบุ',
+    'n/a': 'ไม่ระบุ',
+    'not specified': 'ไม่ระบุ'
+})
+
+# Status normalizations
+_STATUS_NORMALIZATION: Mapping[str, str] = MappingProxyType({
+    'dead': 'เสียชีวิต',
+    'died': 'เสียชีวิต',
+    'deceased': 'เสียชีวิต',
+    'death': 'เสียชีวิต',
+    'alive': 'รอดชีวิต',
+    'survived': 'รอดชีวิต',
+    'living': 'รอดชีวิต',
+    'unknown': 'ไม่ระบุ'
+})
+
+# Columns without normalizations
+_EMPTY_NORMALIZATION: Mapping[str, str] = MappingProxyType({})
+
 
 class MulticlassValidator(BaseValidator):
     """
@@ -23,6 +179,31 @@ class MulticlassValidator(BaseValidator):
     - Occupation categorization
     """
     
+    # Column name keys -> vocabulary; first matching rule wins
+    _COLUMN_VOCABULARIES = (
+        (('จังหวัด',), _THAI_PROVINCES),
+        (('ภาค',), _THAI_REGIONS),
+        (('เพศ', 'gender'), _GENDER_VOCAB),
+        (('สถานะ', 'status'), _STATUS_VOCAB),
+        (('เดือน', 'month'), _THAI_MONTHS),
+        (('อาชีพ', 'occupation'), _OCCUPATIONS),
+    )
+    
+    # Column name keys -> normalization map; first matching rule wins
+    _COLUMN_NORMALIZATIONS = (
+        (('จังหวัด',), _PROVINCE_NORMALIZATION),
+        (('ภาค',), _REGION_NORMALIZATION),
+        (('เพศ',), _GENDER_NORMALIZATION),
+        (('สถานะ',), _STATUS_NORMALIZATION),
+    )
+    
+    # Administrative prefixes stripped before matching: (column name key, pattern)
+    _PREFIX_PATTERNS = (
+        ('จังหวัด', re.compile(r'^(จ\.|จังหวัด)\s*')),   # provinces
+        ('อำเภอ', re.compile(r'^(อ\.|อำเภอ)\s*')),       # districts
+        ('ตำบล', re.compile(r'^(ต\.|ตำบล)\s*')),         # subdistricts
+    )
+    
     def __init__(self, column_name: str, validation_config: Optional[Dict] = None):
         """
         Initialize multiclass validator
@@ -36,7 +217,7 @@ class MulticlassValidator(BaseValidator):
         self.config = validation_config or {}
         
         # Validation settings
-        self.vocabulary = set(self.config.get('vocabulary', []))
+        self.vocabulary: Set[str] = set(self.config.get('vocabulary', []))
         self.allow_fuzzy_matching = self.config.get('allow_fuzzy_matching', True)
         self.fuzzy_threshold = self.config.get('fuzzy_threshold', 0.6)
         self.case_sensitive = self.config.get('case_sensitive', False)
@@ -44,16 +225,151 @@ class MulticlassValidator(BaseValidator):
         self.default_value = self.config.get('default_value', 'ไม่ระบุ')
         self.strict_mode = self.config.get('strict_mode', False)
         
-        # Setup column-specific vocabularies
-        self._setup_column_vocabulary()
+        # Shared results for the two constant outcomes (null cell / no match -> default)
+        self._null_result = self.create_success_result(
+            processed_value=self.default_value,
+            processing_notes=['Null value mapped to default']
+        )
+        self._default_result = self.create_success_result(
+            processed_value=self.default_value,
+            processing_notes=[f'No match found, using default: {self.default_value}']
+        )
         
-        # Normalization mappings
+        # Prefix patterns that apply to this column, decided once
+        self._prefix_res = tuple(pattern for key, pattern in self._PREFIX_PATTERNS if key in column_name)
+        
+        # Normalization mappings (plus a lowercase-key copy for case-insensitive lookups)
         self.normalization_map = self._build_normalization_map()
+        self._normalization_lower: Dict[str, str] = {}
+        for norm_key, norm_value in self.normalization_map.items():
+            self._normalization_lower.setdefault(norm_key.lower(), norm_value)
+        
+        # Bounded per-instance memo of _resolve (cleared when the vocabulary changes)
+        self._resolve_cached = functools.lru_cache(maxsize=MATCH_CACHE_SIZE)(self._resolve)
+        
+        # Setup column-specific vocabularies (builds the vocabulary lookup caches)
+        self._setup_column_vocabulary()
     
     def process(self, value: Any) -> ValidationResult:
         """Process multiclass value (required by abstract base class)"""
         return self.validate_and_process(value)
     
+    def process_batch(self, values: Any):
+        """
+        Validate a whole column: values already in the vocabulary are accepted
+        with one vectorized isin(); only the rest go through process()
+        """
+        series = pd.Series(values, copy=False)
+        exact = series.isin(self.vocabulary).to_numpy(dtype=bool)
+        valid = np.ones(len(series), dtype=bool)
+        processed = series.to_numpy(dtype=object, copy=True)
+        
+        rest = np.flatnonzero(~exact)
+        if len(rest):
+            self._prefetch_fuzzy_matches(pd.unique(series.iloc[rest]))
+            rest_valid, rest_processed = super().process_batch(series.iloc[rest])
+            valid[rest] = rest_valid
+            processed[rest] = rest_processed
+        return valid, processed
+    
+    def process_series(self, values: pd.Series, return_codes: bool = False) -> pd.Series:
+        """
+        Map a whole pandas Series to a categorical of vocabulary values
+        
+        A text column is factorized once, each distinct value is resolved once
+        (through the cached matcher) and the results are gathered back by
+        code with Categorical.from_codes - no per-row Python work. Other
+        columns go through process_batch. Categories are the sorted
+        vocabulary plus the default value, so codes are stable across calls
+        (and across chunks of the same column).
+        
+        Args:
+            values: pandas Series of raw categorical cells
+            return_codes: Return the integer codes (self.codes_dtype, -1 for
+                rejected values and a None default) instead of the categorical
+            
+        Returns:
+            Series of dtype 'category' on the same index; nulls become the
+            default value, <NA> where strict mode rejects the value or the
+            default is None
+        """
+        if pd.api.types.infer_dtype(values, skipna=True) == 'string':
+            codes, uniques = pd.factorize(values)
+            self._prefetch_fuzzy_matches(uniques)
+            
+            # One slot per distinct value plus a trailing slot for nulls (code -1)
+            resolved = [self.validate_and_process(value) for value in uniques]
+            resolved.append(self.validate_and_process(None))
+            outputs = [result.processed_value if result.is_valid else None for result in resolved]
+            row_codes = self._output_codes(outputs)[codes]
+        else:
+            # factorize would merge hash-equal values of different types (1/True/1.0)
+            valid, processed = self.process_batch(values)
+            processed[~valid] = None
+            row_codes = self._output_codes(processed)
+        
+        if return_codes:
+            return pd.Series(row_codes, index=values.index, name=values.name)
+        categorical = pd.Categorical.from_codes(row_codes, categories=self._categories)
+        return pd.Series(categorical, index=values.index, name=values.name)
+    
+    def _output_codes(self, outputs: Iterable[Optional[str]]) -> np.ndarray:
+        """Category codes of process_series outputs (-1 for None: rejected, or a None default)"""
+        position = self._category_index
+        return np.array(
+            [-1 if output is None else position[output] for output in outputs], dtype=self.codes_dtype
+        )
+    
+    def _prefetch_fuzzy_matches(self, values: Iterable[Any]) -> None:
+        """
+        Fuzzy-match every distinct unresolved value in one rapidfuzz cdist call
+        
+        Values settled by exact or normalization matching are skipped; the
+        rest are scored against the whole vocabulary at once (multithreaded)
+        and the winners stored in _fuzzy_memo, which _find_fuzzy_match
+        consults first. No-op without rapidfuzz.
+        
+        Args:
+            values: Distinct raw values about to be processed
+        """
+        if not (RAPIDFUZZ_AVAILABLE and self.allow_fuzzy_matching and self._vocab_list):
+            return
+        
+        pending = {}
+        for value in values:
+            if self.is_null_or_empty(value):
+                continue
+            str_value = str(value).strip()
+            if self._find_exact_match(str_value):
+                continue
+            cleaned_value = self._clean_value(str_value)
+            normalized_value = self._apply_normalization(cleaned_value)
+            if normalized_value and normalized_value in self.vocabulary:
+                continue
+            if cleaned_value not in self._fuzzy_memo:
+                pending[cleaned_value] = None
+        if not pending:
+            return
+        
+        if len(self._fuzzy_memo) + len(pending) > MATCH_CACHE_SIZE:
+            self._fuzzy_memo.clear()
+        
+        queries = list(pending)
+        score_cutoff = self.fuzzy_threshold * 100
+        scores = fuzz_process.cdist(
+            queries,
+            self._fuzzy_items,
+            scorer=fuzz.ratio,
+            processor=None if self.case_sensitive else str.lower,
+            score_cutoff=score_cutoff,
+            workers=-1
+        )
+        # Scores below the cutoff come back as 0; argmax keeps the first best item like extractOne
+        best_columns = scores.argmax(axis=1)
+        for query, row, column in zip(queries, scores, best_columns):
+            matched = row[column] > 0 or score_cutoff <= 0
+            self._fuzzy_memo[query] = self._fuzzy_items[column] if matched else None
+    
     def validate_and_process(self, value: Any) -> ValidationResult:
         """
         Validate and process a multiclass value
@@ -64,128 +380,146 @@ class MulticlassValidator(BaseValidator):
         Returns:
             ValidationResult with processed categorical value or error information
         """
+        # Values already in canonical form
+        if type(value) is str:
+            result = self._canonical_results.get(value)
+            if result is not None:
+                return result
+        
         # Handle null/empty values
         if self.is_null_or_empty(value):
-            return self.create_success_result(
-                processed_value=self.default_value,
-                original_value=value,
-                processing_notes=['Null value mapped to default']
-            )
+            return self._null_result
         
+        # Only the conversion of arbitrary input can fail; matching works on a known str
         try:
-            # Convert to string and clean
             str_value = str(value).strip()
+        except Exception as e:
+            return self.create_failure_result(
+                original_value=value,
+                errors=[f'Multiclass processing error: {str(e)}']
+            )
+        
+        # Repeated values reuse the cached result
+        result = self._resolve_cached(str_value)
+        if not result.is_valid:
+            # Failures carry the original (unstripped / non-string) value
+            return result._replace(processed_value=value)
+        return result
+    
+    def _resolve(self, str_value: str) -> ValidationResult:
+        """
+        Match a stripped, non-empty string against the vocabulary (pure - cached per instance)
+        
+        Args:
+            str_value: Stripped string value
             
-            # Try exact vocabulary matching first
-            exact_match = self._find_exact_match(str_value)
-            if exact_match:
-                return self.create_success_result(
-                    processed_value=exact_match,
-                    original_value=value,
-                    processing_notes=[f'Exact match found: {exact_match}']
-                )
-            
-            # Try normalization mapping
-            normalized_value = self._apply_normalization(str_value)
-            if normalized_value and normalized_value in self.vocabulary:
+        Returns:
+            ValidationResult with processed categorical value or error information
+        """
+        # Try exact vocabulary matching first
+        exact_match = self._find_exact_match(str_value)
+        if exact_match:
+            return self.create_success_result(
+                processed_value=exact_match,
+                original_value=str_value,
+                processing_notes=[f'Exact match found: {exact_match}']
+            )
+        
+        # Remaining strategies all work on the cleaned value - clean once
+        cleaned_value = self._clean_value(str_value)
+        
+        # Try normalization mapping
+        normalized_value = self._apply_normalization(cleaned_value)
+        if normalized_value and normalized_value in self.vocabulary:
+            return self.create_success_result(
+                processed_value=normalized_value,
+                original_value=str_value,
+                processing_notes=[f'Normalized: {str_value} -> {normalized_value}']
+            )
+        
+        # Try fuzzy matching if enabled
+        if self.allow_fuzzy_matching:
+            fuzzy_match = self._find_fuzzy_match(cleaned_value)
+            if fuzzy_match:
                 return self.create_success_result(
-                    processed_value=normalized_value,
-                    original_value=value,
-                    processing_notes=[f'Normalized: {str_value} -> {normalized_value}']
+                    processed_value=fuzzy_match,
+                    original_value=str_value,
+                    processing_notes=[f'Fuzzy match found: {str_value} -> {fuzzy_match}']
                 )
-            
-            # Try fuzzy matching if enabled
-            if self.allow_fuzzy_matching:
-                fuzzy_match = self._find_fuzzy_match(str_value)
-                if fuzzy_match:
-                    return self.create_success_result(
-                        processed_value=fuzzy_match,
-                        original_value=value,
-                        processing_notes=[f'Fuzzy match found: {str_value} -> {fuzzy_match}']
-                    )
-            
-            # Try partial matching if enabled
-            if self.allow_partial_matches:
-                partial_match = self._find_partial_match(str_value)
-                if partial_match:
-                    return self.create_success_result(
-                        processed_value=partial_match,
-                        original_value=value,
-                        processing_notes=[f'Partial match found: {str_value} -> {partial_match}']
-                    )
-            
-            # If strict mode, return error; otherwise use default
-            if self.strict_mode:
-                return self.create_failure_result(
-                    original_value=value,
-                    errors=[f'Value "{str_value}" not in controlled vocabulary']
-                )
-            else:
+        
+        # Try partial matching if enabled
+        if self.allow_partial_matches:
+            partial_match = self._find_partial_match(cleaned_value)
+            if partial_match:
                 return self.create_success_result(
-                    processed_value=self.default_value,
-                    original_value=value,
-                    processing_notes=[f'No match found, using default: {self.default_value}']
+                    processed_value=partial_match,
+                    original_value=str_value,
+                    processing_notes=[f'Partial match found: {str_value} -> {partial_match}']
                 )
-            
-        except Exception as e:
+        
+        # If strict mode, return error; otherwise use default
+        if self.strict_mode:
             return self.create_failure_result(
-                original_value=value,
-                errors=[f'Multiclass processing error: {str(e)}']
+                original_value=str_value,
+                errors=[f'Value "{str_value}" not in controlled vocabulary']
             )
+        else:
+            return self._default_result
     
     def _setup_column_vocabulary(self) -> None:
         """
         Setup vocabulary specific to the column type
         """
         column_lower = self.column_name.lower()
-        
-        # Thai provinces
-        if 'จังหวัด' in self.column_name:
-            self.vocabulary.update([
-                'กรุงเทพฯ', 'กรุงเทพมหานคร', 'กระบี่', 'กาญจนบุรี', 'กาฬสินธุ์', 'กำแพงเพชร',
-                'ขอนแก่น', 'จันทบุรี', 'ฉะเชิงเทรา', 'ชลบุรี', 'ชัยนาท', 'ชัยภูมิ', 'ชุมพร',
-                'เชียงราย', 'เชียงใหม่', 'ตรัง', 'ตราด', 'ตาก', 'นครนายก', 'นครปฐม', 'นครพนม',
-                'นครราชสีมา', 'นครศรีธรรมราช', 'นครสวรรค์', 'นนทบุรี', 'นราธิวาส', 'น่าน',
-                'บึงกาฬ', 'บุรีรัมย์', 'ปทุมธานี', 'ประจวบคีรีขันธ์', 'ปราจีนบุรี', 'ปัตตานี',
-                'พระนครศรีอยุธยา', 'พะเยา', 'พังงา', 'พัทลุง', 'พิจิตร', 'พิษณุโลก', 'เพชรบุรี',
-                'เพชรบูรณ์', 'แพร่', 'ภูเก็ต', 'มหาสารคาม', 'มุกดาหาร', 'แม่ฮ่องสอน', 'ยะลา',
-                'ยโสธร', 'ร้อยเอ็ด', 'ระนอง', 'ระยอง', 'ราชบุรี', 'ลพบุรี', 'ลำปาง', 'ลำพูน',
-                'เลย', 'ศรีสะเกษ', 'สกลนคร', 'สงขลา', 'สตูล', 'สมุทรปราการ', 'สมุทรสงคราม',
-                'สมุทรสาคร', 'สระแก้ว', 'สระบุรี', 'สิงห์บุรี', 'สุโขทัย', 'สุพรรณบุรี', 'สุราษฎร์ธานี',
-                'สุรินทร์', 'หนองคาย', 'หนองบัวลำภู', 'อ่างทอง', 'อำนาจเจริญ', 'อุดรธานี',
-                'อุตรดิตถ์', 'อุทัยธานี', 'อุบลราชธานี'
-            ])
-        
-        # Thai regions
-        elif 'ภาค' in self.column_name:
-            self.vocabulary.update([
-                'ภาคเหนือ', 'ภาคกลางและตะวันตก', 'ภาคตะวันออกเฉียงเหนือ', 
-                'ภาคตะวันออก', 'ภาคใต้', 'ภาคกลาง', 'ภาคตะวันตก'
-            ])
-        
-        # Gender
-        elif 'เพศ' in self.column_name or 'gender' in column_lower:
-            self.vocabulary.update(['ชาย', 'หญิง', 'ไม่ระบุ'])
-        
-        # Status
-        elif 'สถานะ' in self.column_name or 'status' in column_lower:
-            self.vocabulary.update(['เสียชีวิต', 'รอดชีวิต', 'ไม่ระบุ', 'รักษาอยู่'])
-        
-        # Thai months
-        elif 'เดือน' in self.column_name or 'month' in column_lower:
-            self.vocabulary.update([
-                'มกราคม', 'กุมภาพันธ์', 'มีนาคม', 'เมษายน', 'พฤษภาคม', 'มิถุนายน',
-                'กรกฎาคม', 'สิงหาคม', 'กันยายน', 'ตุลาคม', 'พฤศจิกายน', 'ธันวาคม'
-            ])
-        
-        # Occupations (common Thai occupations)
-        elif 'อาชีพ' in self.column_name or 'occupation' in column_lower:
-            self.vocabulary.update([
-                'เกษตรกร', 'รับจ้าง', 'พนักงานบริษัท', 'ข้าราชการ', 'ค้าขาย', 'แม่บ้าน',
-                'นักเรียน', 'นักศึกษา', 'พนักงานร้านอาหาร', 'ช่างซ่อม', 'คนขับรถ',
-                'แรงงาน', 'ผู้ประกอบการ', 'วิศวกร', 'ครู', 'แพทย์', 'พยาบาล',
-                'ไม่ระบุ', 'เร่ร่อน', 'ว่างงาน', 'เกษียณอายุ'
-            ])
+        column_vocabulary = next(
+            (vocab for name_keys, vocab in self._COLUMN_VOCABULARIES
+             if any(key in column_lower for key in name_keys)),
+            ()
+        )
+        self._add_vocab(column_vocabulary, force_refresh=True)
+    
+    def _refresh_vocabulary_caches(self) -> None:
+        """Rebuild lookup structures derived from self.vocabulary (call after any change)"""
+        self._vocab_list: List[str] = list(self.vocabulary)
+        self._sorted_vocabulary: Tuple[str, ...] = tuple(sorted(self.vocabulary))
+        self._fuzzy_memo: Dict[str, Optional[str]] = {}  # filled by _prefetch_fuzzy_matches
+        
+        # Every possible output (vocabulary items + default) with a stable integer code;
+        # a None default is not a category (process_series gives it code -1)
+        self._categories: List[str] = sorted(self.vocabulary | ({self.default_value} - {None}))
+        self._category_index: Dict[str, int] = {category: i for i, category in enumerate(self._categories)}
+        self.codes_dtype = np.min_scalar_type(-len(self._categories))
+        self._vocab_list_lower: List[str] = [item.lower() for item in self._vocab_list]
+        self._vocab_lower_to_canonical: Dict[str, str] = {}
+        for item, item_lower in zip(self._vocab_list, self._vocab_list_lower):
+            self._vocab_lower_to_canonical.setdefault(item_lower, item)
+        
+        # Partial matching over the comparison form of each item: all items joined into
+        # one string (value inside item -> str.find) and a finder for items inside a value
+        comparison_list = self._vocab_list if self.case_sensitive else self._vocab_list_lower
+        self._partial_items = comparison_list
+        self._partial_haystack = _ITEM_SEPARATOR.join(comparison_list)
+        self._partial_offsets = list(itertools.accumulate(
+            (len(item) + 1 for item in comparison_list[:-1]), initial=0
+        ))
+        self._partial_first_index: Dict[str, int] = {}
+        for i, item in enumerate(comparison_list):
+            self._partial_first_index.setdefault(item, i)
+        self._find_contained_items = build_contained_finder(comparison_list)
+        
+        # Fuzzy candidates ordered by comparison length, so the items able to reach
+        # the threshold for a given value length form one contiguous slice
+        fuzzy_order = sorted(range(len(comparison_list)), key=lambda i: len(comparison_list[i]))
+        self._fuzzy_items: List[str] = [self._vocab_list[i] for i in fuzzy_order]
+        self._fuzzy_items_lower: List[str] = [self._vocab_list_lower[i] for i in fuzzy_order]
+        self._fuzzy_lengths: List[int] = [len(comparison_list[i]) for i in fuzzy_order]
+        
+        # Prebuilt results for cells already in canonical form (the common case):
+        # one dict probe, no str()/strip()/lower() and no cache bookkeeping
+        self._canonical_results: Dict[str, ValidationResult] = {
+            item: self._resolve(item) for item in self._vocab_list
+            if item and item == item.strip()
+        }
     
     def _find_exact_match(self, value: str) -> Optional[str]:
         """
@@ -198,11 +532,8 @@ class MulticlassValidator(BaseValidator):
             Exact match or None
         """
         if not self.case_sensitive:
-            # Case-insensitive exact matching
-            value_lower = value.lower()
-            for vocab_item in self.vocabulary:
-                if vocab_item.lower() == value_lower:
-                    return vocab_item
+            # Case-insensitive exact matching: one probe of the case-folded index
+            return self._vocab_lower_to_canonical.get(value.lower())
         else:
             # Case-sensitive exact matching
             if value in self.vocabulary:
@@ -210,18 +541,16 @@ class MulticlassValidator(BaseValidator):
         
         return None
     
-    def _apply_normalization(self, value: str) -> Optional[str]:
+    def _apply_normalization(self, cleaned_value: str) -> Optional[str]:
         """
         Apply normalization mappings to the value
         
         Args:
-            value: Value to normalize
+            cleaned_value: Value already passed through _clean_value
             
         Returns:
             Normalized value or None
         """
-        # Clean the value first
-        cleaned_value = self._clean_value(value)
         
         # Check normalization map
         if cleaned_value in self.normalization_map:
@@ -229,104 +558,123 @@ class MulticlassValidator(BaseValidator):
         
         # Check case-insensitive normalization
         if not self.case_sensitive:
-            cleaned_lower = cleaned_value.lower()
-            for norm_key, norm_value in self.normalization_map.items():
-                if norm_key.lower() == cleaned_lower:
-                    return norm_value
+            return self._normalization_lower.get(cleaned_value.lower())
         
         return None
     
-    def _find_fuzzy_match(self, value: str) -> Optional[str]:
+    def _find_fuzzy_match(self, cleaned_value: str) -> Optional[str]:
         """
-        Find fuzzy match using string similarity
+        Find fuzzy match using string similarity (caller checks allow_fuzzy_matching)
         
         Args:
-            value: Value to match
+            cleaned_value: Value already passed through _clean_value
             
         Returns:
             Best fuzzy match or None
         """
-        if not self.allow_fuzzy_matching or not self.vocabulary:
+        if not self.vocabulary:
             return None
         
-        # Clean the value
-        cleaned_value = self._clean_value(value)
+        if RAPIDFUZZ_AVAILABLE and cleaned_value in self._fuzzy_memo:
+            return self._fuzzy_memo[cleaned_value]
         
-        # Get close matches
-        vocab_list = list(self.vocabulary)
-        close_matches = get_close_matches(
-            cleaned_value, 
-            vocab_list, 
-            n=1, 
+        start, stop = self._fuzzy_length_window(
+            len(cleaned_value if self.case_sensitive else cleaned_value.lower())
+        )
+        if start >= stop:
+            return None
+        vocab_list = self._fuzzy_items[start:stop]
+        
+        if RAPIDFUZZ_AVAILABLE:
+            # One C++ pass; the processor handles case folding, so no second pass is needed
+            best = fuzz_process.extractOne(
+                cleaned_value,
+                vocab_list,
+                scorer=fuzz.ratio,
+                processor=None if self.case_sensitive else str.lower,
+                score_cutoff=self.fuzzy_threshold * 100
+            )
+            return best[0] if best else None
+        
+        if self.case_sensitive:
+            close_matches = get_close_matches(cleaned_value, vocab_list, n=1, cutoff=self.fuzzy_threshold)
+            return close_matches[0] if close_matches else None
+        
+        # Case-insensitive: a single pass over the case-folded vocabulary
+        # (a mixed-case pass first would only repeat the same comparisons)
+        close_matches_lower = get_close_matches(
+            cleaned_value.lower(),
+            self._fuzzy_items_lower[start:stop],
+            n=1,
             cutoff=self.fuzzy_threshold
         )
         
-        if close_matches:
-            return close_matches[0]
-        
-        # Try case-insensitive fuzzy matching
-        if not self.case_sensitive:
-            cleaned_lower = cleaned_value.lower()
-            vocab_lower = [item.lower() for item in vocab_list]
-            close_matches_lower = get_close_matches(
-                cleaned_lower,
-                vocab_lower,
-                n=1,
-                cutoff=self.fuzzy_threshold
-            )
-            
-            if close_matches_lower:
-                # Find the original case version
-                matched_lower = close_matches_lower[0]
-                for i, vocab_lower_item in enumerate(vocab_lower):
-                    if vocab_lower_item == matched_lower:
-                        return vocab_list[i]
+        if close_matches_lower:
+            # Find the original case version
+            return self._vocab_lower_to_canonical[close_matches_lower[0]]
         
         return None
     
-    def _find_partial_match(self, value: str) -> Optional[str]:
+    def _fuzzy_length_window(self, length: int) -> Tuple[int, int]:
+        """
+        Slice of _fuzzy_items whose length allows a ratio >= fuzzy_threshold
+        
+        ratio = 2*M / (len(a) + len(b)) and M <= min(len(a), len(b)), so an item
+        of length L can only qualify when length*t/(2-t) <= L <= length*(2-t)/t.
+        
+        Args:
+            length: Length of the (case-folded if needed) value being matched
+            
+        Returns:
+            (start, stop) indices into _fuzzy_items
+        """
+        threshold = self.fuzzy_threshold
+        if threshold <= 0:
+            return 0, len(self._fuzzy_items)
+        # Small tolerance so float rounding never drops a borderline candidate
+        shortest = length * threshold / (2 - threshold) - 1e-9
+        longest = length * (2 - threshold) / threshold + 1e-9
+        lengths = self._fuzzy_lengths
+        return bisect_left(lengths, shortest), bisect_right(lengths, longest)
+    
+    def _find_partial_match(self, cleaned_value: str) -> Optional[str]:
         """
         Find partial match where value is contained in vocabulary item or vice versa
+        (caller checks allow_partial_matches)
         
         Args:
-            value: Value to match
+            cleaned_value: Value already passed through _clean_value
             
         Returns:
             Best partial match or None
         """
-        if not self.allow_partial_matches:
-            return None
-        
-        cleaned_value = self._clean_value(value)
-        
         # Skip very short values for partial matching
         if len(cleaned_value) < 3:
             return None
         
         comparison_value = cleaned_value.lower() if not self.case_sensitive else cleaned_value
         
-        # Look for vocabulary items that contain the value or are contained by the value
-        best_match = None
-        best_score = 0
+        if _ITEM_SEPARATOR in comparison_value:
+            return None
         
-        for vocab_item in self.vocabulary:
-            comparison_vocab = vocab_item.lower() if not self.case_sensitive else vocab_item
-            
-            # Check containment in both directions
-            if comparison_value in comparison_vocab:
-                # Value is contained in vocab item
-                score = len(comparison_value) / len(comparison_vocab)
-                if score > best_score and score > 0.3:  # At least 30% match
-                    best_match = vocab_item
-                    best_score = score
-            elif comparison_vocab in comparison_value:
-                # Vocab item is contained in value
-                score = len(comparison_vocab) / len(comparison_value)
-                if score > best_score and score > 0.3:
-                    best_match = vocab_item
-                    best_score = score
-        
-        return best_match
+        # Candidate items by index -> score (share of the longer string that matches)
+        candidates: Dict[int, float] = {}
+        
+        # Value is contained in vocab item: C-level find over all items at once
+        haystack, offsets, items = self._partial_haystack, self._partial_offsets, self._partial_items
+        position = haystack.find(comparison_value)
+        while position != -1:
+            i = bisect_right(offsets, position) - 1
+            candidates[i] = len(comparison_value) / len(items[i])
+            position = haystack.find(comparison_value, position + 1)
+        
+        # Vocab item is contained in value
+        for item in self._find_contained_items(comparison_value):
+            candidates.setdefault(self._partial_first_index[item], len(item) / len(comparison_value))
+        
+        # Highest score wins (at least 30% match), earliest item on ties
+        best = max(((score, -i) for i, score in candidates.items() if score > 0.3), default=None)
+        return None if best is None else self._vocab_list[-best[1]]
     
     def _clean_value(self, value: str) -> str:
         """
@@ -341,94 +689,25 @@ class MulticlassValidator(BaseValidator):
         # Remove common prefixes and suffixes
         cleaned = value.strip()
         
-        # Remove prefixes for provinces
-        if 'จังหวัด' in self.column_name:
-            cleaned = re.sub(r'^(จ\.|จังหวัด)\s*', '', cleaned)
+        # Remove province / district / subdistrict prefixes for this column
+        for prefix_re in self._prefix_res:
+            cleaned = prefix_re.sub('', cleaned)
         
-        # Remove prefixes for districts
-        if 'อำเภอ' in self.column_name:
-            cleaned = re.sub(r'^(อ\.|อำเภอ)\s*', '', cleaned)
-        
-        # Remove prefixes for subdistricts
-        if 'ตำบล' in self.column_name:
-            cleaned = re.sub(r'^(ต\.|ตำบล)\s*', '', cleaned)
-        
-        # Clean extra whitespace
-        cleaned = ' '.join(cleaned.split())
-        
-        return cleaned.strip()
+        # Clean extra whitespace (split/join also trims both ends)
+        return ' '.join(cleaned.split())
     
-    def _build_normalization_map(self) -> Dict[str, str]:
+    def _build_normalization_map(self) -> Mapping[str, str]:
         """
         Build normalization mapping for common variations
         
         Returns:
-            Dictionary mapping variations to canonical forms
-        """
-        normalization_map = {}
-        
-        # Province normalizations
-        if 'จังหวัด' in self.column_name:
-            normalization_map.update({
-                'กรุงเทพ': 'กรุงเทพฯ',
-                'กรุงเทพมหานคร': 'กรุงเทพฯ',
-                'bangkok': 'กรุงเทพฯ',
-                'bkk': 'กรุงเทพฯ',
-                'chonburi': 'ชลบุรี',
-                'chiangmai': 'เชียงใหม่',
-                'chiang mai': 'เชียงใหม่',
-                'phuket': 'ภูเก็ต',
-                'khon kaen': 'ขอนแก่น',
-                'korat': 'นครราชสีมา',
-                'nakhon ratchasima': 'นครราชสีมา',
-                'ubon ratchathani': 'อุบลราชธานี',
-                'ubon': 'อุบลราชธานี',
-                'udon thani': 'อุดรธานี',
-                'udon': 'อุดรธานี'
-            })
-        
-        # Region normalizations
-        elif 'ภาค' in self.column_name:
-            normalization_map.update({
-                'เหนือ': 'ภาคเหนือ',
-                'ใต้': 'ภาคใต้',
-                'อีสาน': 'ภาคตะวันออกเฉียงเหนือ',
-                'ตะวันออกเฉียงเหนือ': 'ภาคตะวันออกเฉียงเหนือ',
-                'กลาง': 'ภาคกลางและตะวันตก',
-                'ตะวันตก': 'ภาคกลางและตะวันตก',
-                'ตะวันออก': 'ภาคตะวันออก'
-            })
-        
-        # Gender normalizations
-        elif 'เพศ' in self.column_name:
-            normalization_map.update({
-                'male': 'ชาย',
-                'female': 'หญิง',
-                'man': 'ชาย',
-                'woman': 'หญิง',
-                'm': 'ชาย',
-                'f': 'หญิง',
-                'ผู้ชาย': 'ชาย',
-                'ผู้หญิง': 'หญิง',
-                'unknown': 'ไม่ระบุ',
-                'n/a': 'ไม่ระบุ',
-                'not specified': 'ไม่ระบุ'
-            })
-        
-        # Status normalizations
-        elif 'สถานะ' in self.column_name:
-            normalization_map.update({
-                'dead': 'เสียชีวิต',
-                'died': 'เสียชีวิต',
-                'deceased': 'เสียชีวิต',
-                'death': 'เสียชีวิต',
-                'alive': 'รอดชีวิต',
-                'survived': 'รอดชีวิต',
-                'living': 'รอดชีวิต',
-                'unknown': 'ไม่ระบุ'
-            })
-        
-        return normalization_map
+            Read-only mapping of variations to canonical forms (shared between instances)
+        """
+        column_lower = self.column_name.lower()
+        for name_keys, normalization_map in self._COLUMN_NORMALIZATIONS:
+            if any(key in column_lower for key in name_keys):
+                return normalization_map
+        return _EMPTY_NORMALIZATION
     
     def add_to_vocabulary(self, values: List[str]) -> None:
         """
@@ -437,7 +716,18 @@ class MulticlassValidator(BaseValidator):
         Args:
             values: List of values to add
         """
+        self._add_vocab(values)
+    
+    def _add_vocab(self, values: Iterable[str], force_refresh: bool = False) -> None:
+        """
+        Single entry point for vocabulary changes: update the set, then rebuild
+        the derived lookups and drop memoized results - only if something changed
+        """
+        size_before = len(self.vocabulary)
         self.vocabulary.update(values)
+        if force_refresh or len(self.vocabulary) != size_before:
+            self._refresh_vocabulary_caches()
+            self._resolve_cached.cache_clear()
     
     def get_vocabulary_list(self) -> List[str]:
         """
@@ -446,4 +736,4 @@ class MulticlassValidator(BaseValidator):
         Returns:
             Sorted list of vocabulary items
         """
-        return sorted(list(self.vocabulary))
\ No newline at end of file
+        return list(self._sorted_vocabulary)
\ No newline at end of file
@@ -6,11 +6,46 @@ for processing numeric columns with range validation, clamping,
 and outlier filtering according to business rules.
 """
 
+import functools
+import math
 import re
-from typing import Any, Optional, Union, List, Dict
+from typing import Any, Optional, Tuple, Union, List, Dict
+
+import numpy as np
 from .base_validator import NumericBaseValidator, ValidationResult
 
 
+# Max distinct raw strings whose results are memoized per validator instance
+RESULT_CACHE_SIZE = 4096
+
+_DIGITS_RE = re.compile(r'\d+')
+
+# Thai number words -> digits; on extraction the earliest entry present wins
+_THAI_NUMBER_WORDS = {
+    'หนึ่ง': '1', 'สอง': '2', 'สาม': '3', 'สี่': '4', 'ห้า': '5',
+    'หก': '6', 'เจ็ด': '7', 'แปด': '8', 'เก้า': '9', 'สิบ': '10'
+}
+_THAI_NUMBER_RANK = {word: rank for rank, word in enumerate(_THAI_NUMBER_WORDS)}
+_THAI_NUMBER_RE = re.compile('|'.join(_THAI_NUMBER_WORDS))
+
+# Any Thai number word, or an English one in any case, in one scan
+_NUMBER_WORD_RE = re.compile(_THAI_NUMBER_RE.pattern + '|(?i:one|two|three|four|five)')
+
+# Shared output strings for the common integers (ages, counts, CE and BE years),
+# so repeated values don't each allocate their own copy
+_INT_STRINGS = tuple(str(i) for i in range(3000))
+
+# Python ints below this magnitude survive the int(float(...)) round trip unchanged
+_EXACT_FLOAT_INT = 2 ** 53
+
+# Already-numeric cells from typed columns (np.float64 is a float subclass)
+_INTEGER_TYPES = (int, np.integer)
+
+# Temperature unit indicators removed in one scan, and comma decimal separators
+_TEMPERATURE_UNIT_RE = re.compile('°C|°F|C°|F°|องศา|เซลเซียส|ฟาเรนไฮต์|度')
+_DECIMAL_COMMA_TABLE = str.maketrans(',', '.')
+
+
 class IntegerValidator(NumericBaseValidator):
     """
     Validator for integer columns with range validation and clamping
@@ -36,11 +71,21 @@ class IntegerValidator(NumericBaseValidator):
             self.min_value = self.min_value or 0
             self.max_value = self.max_value or 120
             self.clamp_to_range = True
+        
+        self._validate_cached = functools.lru_cache(maxsize=RESULT_CACHE_SIZE)(self._validate_impl)
     
     def process(self, value: Any) -> ValidationResult:
         """Process integer value (required by abstract base class)"""
         return self.validate_and_process(value)
     
+    def _coerce_batch(self, numbers: np.ndarray) -> np.ndarray:
+        """Truncate like int(float(x)) in validate_and_process"""
+        return np.trunc(numbers)
+    
+    def _finish_series(self, numbers):
+        """process_series output as nullable integers (already truncated)"""
+        return numbers.astype('Int64')
+    
     def validate_and_process(self, value: Any) -> ValidationResult:
         """
         Validate and process an integer value
@@ -51,13 +96,28 @@ class IntegerValidator(NumericBaseValidator):
         Returns:
             ValidationResult with processed integer or error information
         """
+        # Repeated raw strings (the common case in CSV columns) reuse their result
+        if type(value) is str:
+            return self._validate_cached(value)
+        
+        # Fast path: Python/NumPy ints and finite floats need no string parsing
+        # (bool stays on the parsed path); range handling is shared with it
+        if isinstance(value, _INTEGER_TYPES):
+            if type(value) is not bool and -_EXACT_FLOAT_INT < value < _EXACT_FLOAT_INT:
+                return self._range_checked_result(int(value), value)
+        elif isinstance(value, float) and math.isfinite(value):
+            return self._range_checked_result(int(value), value)
+        return self._validate_impl(value)
+    
+    def _validate_impl(self, value: Any) -> ValidationResult:
+        """Validate a value past the fast path (pure - string results are cached per instance)"""
         # Handle null/empty values
         if self.is_null_or_empty(value):
             if self.allow_null:
                 return self.create_success_result(
                     processed_value=self.handle_null_value(),
                     original_value=value,
-                    processing_notes=['Null value handled']
+                    processing_notes=('Null value handled',)
                 )
             else:
                 return self.create_failure_result(
@@ -82,39 +142,51 @@ class IntegerValidator(NumericBaseValidator):
                     errors=[f'Cannot convert to integer: {str_value}']
                 )
             
-            # Check and apply range validation
-            is_valid, range_message = self.check_numeric_range(int_value)
-            
-            processing_notes = []
-            if range_message:
-                processing_notes.append(range_message)
-            
-            # Apply clamping if enabled
-            if self.clamp_to_range:
-                clamped_value = int(self.clamp_value(int_value))
-                if clamped_value != int_value:
-                    processing_notes.append(f'Value clamped from {int_value} to {clamped_value}')
-                    int_value = clamped_value
-            elif not is_valid:
-                return self.create_failure_result(
-                    original_value=value,
-                    errors=[range_message]
-                )
+            return self._range_checked_result(int_value, value)
             
-            # Format as string for CSV output
-            processed_value = str(int_value)
-            
-            return self.create_success_result(
-                processed_value=processed_value,
+        except Exception as e:
+            return self.create_failure_result(
                 original_value=value,
-                processing_notes=processing_notes
+                errors=[f'Integer processing error: {str(e)}']
             )
+    
+    def _range_checked_result(self, int_value: int, value: Any) -> ValidationResult:
+        """
+        Range-check, clamp and format a parsed integer
+        
+        Args:
+            int_value: Parsed integer
+            value: Original raw value
             
-        except Exception as e:
+        Returns:
+            ValidationResult with the integer as a string or the range error
+        """
+        # Check and apply range validation
+        is_valid, range_message = self.check_numeric_range(int_value)
+        
+        # Notes stay the shared empty tuple unless one is added (the common case)
+        processing_notes = (range_message,) if range_message else ()
+        
+        # Apply clamping if enabled
+        if self.clamp_to_range:
+            clamped_value = int(self.clamp_value(int_value))
+            if clamped_value != int_value:
+                processing_notes += (f'Value clamped from {int_value} to {clamped_value}',)
+                int_value = clamped_value
+        elif not is_valid:
             return self.create_failure_result(
                 original_value=value,
-                errors=[f'Integer processing error: {str(e)}']
+                errors=[range_message]
             )
+        
+        # Format as string for CSV output
+        processed_value = _INT_STRINGS[int_value] if 0 <= int_value < len(_INT_STRINGS) else str(int_value)
+        
+        return self.create_success_result(
+            processed_value=processed_value,
+            original_value=value,
+            processing_notes=processing_notes
+        )
     
     def _contains_numeric_text(self, text: str) -> bool:
         """
@@ -126,12 +198,7 @@ class IntegerValidator(NumericBaseValidator):
         Returns:
             True if text contains numeric indicators
         """
-        # Thai number words
-        thai_numbers = ['หนึ่ง', 'สอง', 'สาม', 'สี่', 'ห้า', 'หก', 'เจ็ด', 'แปด', 'เก้า', 'สิบ']
-        text_lower = text.lower()
-        
-        return any(thai_num in text for thai_num in thai_numbers) or \
-               any(eng_num in text_lower for eng_num in ['one', 'two', 'three', 'four', 'five'])
+        return _NUMBER_WORD_RE.search(text) is not None
     
     def _extract_number_from_text(self, text: str) -> str:
         """
@@ -144,19 +211,14 @@ class IntegerValidator(NumericBaseValidator):
             Extracted numeric string or original text if no extraction possible
         """
         # Look for digits in the text first
-        digits = re.findall(r'\d+', text)
+        digits = _DIGITS_RE.search(text)
         if digits:
-            return digits[0]  # Return first found digit sequence
+            return digits.group()  # Return first found digit sequence
         
-        # Thai number mapping (basic implementation)
-        thai_to_int = {
-            'หนึ่ง': '1', 'สอง': '2', 'สาม': '3', 'สี่': '4', 'ห้า': '5',
-            'หก': '6', 'เจ็ด': '7', 'แปด': '8', 'เก้า': '9', 'สิบ': '10'
-        }
-        
-        for thai, digit in thai_to_int.items():
-            if thai in text:
-                return digit
+        # Thai number words: all occurrences in one scan, mapping priority decides
+        thai_words = _THAI_NUMBER_RE.findall(text)
+        if thai_words:
+            return _THAI_NUMBER_WORDS[min(thai_words, key=_THAI_NUMBER_RANK.__getitem__)]
         
         return text  # Return original if no extraction possible
 
@@ -196,6 +258,11 @@ class FloatValidator(NumericBaseValidator):
         self.decimal_places = self.config.get('decimal_places', 1)
         self.outlier_detection = self.config.get('outlier_detection', True)
         self.outlier_threshold_std = self.config.get('outlier_threshold_std', 3.0)
+        
+        # Outlier limits depend only on the column name and range, fixed from here on
+        self._outlier_limits = self._get_outlier_limits()
+        
+        self._validate_cached = functools.lru_cache(maxsize=RESULT_CACHE_SIZE)(self._validate_impl)
     
     def process(self, value: Any) -> ValidationResult:
         """Process float value (required by abstract base class)"""
@@ -211,13 +278,30 @@ class FloatValidator(NumericBaseValidator):
         Returns:
             ValidationResult with processed float or error information
         """
+        # Repeated raw strings (the common case in CSV columns) reuse their result
+        if type(value) is str:
+            return self._validate_cached(value)
+        
+        # Fast path: finite floats (incl. np.float64) and Python/NumPy ints are
+        # already parsed (NaN goes on to the null handling, infinities to the
+        # error path, bool and narrower NumPy floats to the string parsing)
+        if isinstance(value, float):
+            if math.isfinite(value):
+                return self._range_checked_result(float(value), value)
+        elif (isinstance(value, _INTEGER_TYPES) and type(value) is not bool
+                and -_EXACT_FLOAT_INT < value < _EXACT_FLOAT_INT):
+            return self._range_checked_result(float(value), value)
+        return self._validate_impl(value)
+    
+    def _validate_impl(self, value: Any) -> ValidationResult:
+        """Validate a value past the fast path (pure - string results are cached per instance)"""
         # Handle null/empty values
         if self.is_null_or_empty(value):
             if self.allow_null:
                 return self.create_success_result(
                     processed_value=self.handle_null_value(),
                     original_value=value,
-                    processing_notes=['Null value handled']
+                    processing_notes=('Null value handled',)
                 )
             else:
                 return self.create_failure_result(
@@ -248,40 +332,7 @@ class FloatValidator(NumericBaseValidator):
                     errors=['Invalid float value (NaN or infinite)']
                 )
             
-            # Check and apply range validation
-            is_valid, range_message = self.check_numeric_range(float_value)
-            
-            processing_notes = []
-            if range_message:
-                processing_notes.append(range_message)
-            
-            # Apply clamping if enabled
-            if self.clamp_to_range:
-                clamped_value = self.clamp_value(float_value)
-                if clamped_value != float_value:
-                    processing_notes.append(f'Value clamped from {float_value} to {clamped_value}')
-                    float_value = clamped_value
-            elif not is_valid:
-                return self.create_failure_result(
-                    original_value=value,
-                    errors=[range_message]
-                )
-            
-            # Check for outliers (if enabled)
-            if self.outlier_detection and self._is_outlier(float_value):
-                processing_notes.append(f'Potential outlier detected: {float_value}')
-            
-            # Format with appropriate precision
-            if self.decimal_places == 0:
-                processed_value = str(int(round(float_value)))
-            else:
-                processed_value = f"{float_value:.{self.decimal_places}f}"
-            
-            return self.create_success_result(
-                processed_value=processed_value,
-                original_value=value,
-                processing_notes=processing_notes
-            )
+            return self._range_checked_result(float_value, value)
             
         except Exception as e:
             return self.create_failure_result(
@@ -289,6 +340,55 @@ class FloatValidator(NumericBaseValidator):
                 errors=[f'Float processing error: {str(e)}']
             )
     
+    def _finish_series(self, numbers):
+        """process_series output rounded to decimal_places"""
+        return numbers.round(self.decimal_places)
+    
+    def _range_checked_result(self, float_value: float, value: Any) -> ValidationResult:
+        """
+        Range-check, clamp, flag outliers and format a finite parsed float
+        
+        Args:
+            float_value: Parsed finite float
+            value: Original raw value
+        
+        Returns:
+            ValidationResult with the formatted float or the range error
+        """
+        # Check and apply range validation
+        is_valid, range_message = self.check_numeric_range(float_value)
+        
+        # Notes stay the shared empty tuple unless one is added (the common case)
+        processing_notes = (range_message,) if range_message else ()
+        
+        # Apply clamping if enabled
+        if self.clamp_to_range:
+            clamped_value = self.clamp_value(float_value)
+            if clamped_value != float_value:
+                processing_notes += (f'Value clamped from {float_value} to {clamped_value}',)
+                float_value = clamped_value
+        elif not is_valid:
+            return self.create_failure_result(
+                original_value=value,
+                errors=[range_message]
+            )
+        
+        # Check for outliers (if enabled)
+        if self.outlier_detection and self._is_outlier(float_value):
+            processing_notes += (f'Potential outlier detected: {float_value}',)
+        
+        # Format with appropriate precision
+        if self.decimal_places == 0:
+            processed_value = str(int(round(float_value)))
+        else:
+            processed_value = f"{float_value:.{self.decimal_places}f}"
+        
+        return self.create_success_result(
+            processed_value=processed_value,
+            original_value=value,
+            processing_notes=processing_notes
+        )
+    
     def _clean_temperature_value(self, value_str: str) -> str:
         """
         Clean temperature value by removing unit indicators
@@ -299,20 +399,9 @@ class FloatValidator(NumericBaseValidator):
         Returns:
             Cleaned numeric string
         """
-        # Remove common temperature unit indicators
-        units_to_remove = ['°C', '°F', 'C°', 'F°', 'องศา', 'เซลเซียส', 'ฟาเรนไฮต์', '度']
-        
-        cleaned = value_str
-        for unit in units_to_remove:
-            cleaned = cleaned.replace(unit, '')
-        
-        # Remove extra whitespace
-        cleaned = cleaned.strip()
-        
-        # Handle decimal separators
-        cleaned = cleaned.replace(',', '.')  # Handle comma as decimal separator
-        
-        return cleaned
+        # Remove common temperature unit indicators, handle comma as decimal
+        # separator, then remove extra whitespace
+        return _TEMPERATURE_UNIT_RE.sub('', value_str).translate(_DECIMAL_COMMA_TABLE).strip()
     
     def _is_valid_float(self, float_value: float) -> bool:
         """
@@ -324,8 +413,7 @@ class FloatValidator(NumericBaseValidator):
         Returns:
             True if valid float
         """
-        import math
-        return not (math.isnan(float_value) or math.isinf(float_value))
+        return math.isfinite(float_value)
     
     def _is_outlier(self, float_value: float) -> bool:
         """
@@ -337,20 +425,29 @@ class FloatValidator(NumericBaseValidator):
         Returns:
             True if value appears to be an outlier
         """
+        limits = self._outlier_limits
+        return limits is not None and (float_value < limits[0] or float_value > limits[1])
+    
+    def _get_outlier_limits(self) -> Optional[Tuple[float, float]]:
+        """
+        Resolve the (low, high) outlier limits for this column once
+        
+        Returns:
+            Limits outside which a value is an outlier, or None for no detection
+        """
         # For temperature columns, use domain-specific outlier detection
         if 'อุณหภูมิ' in self.column_name:
             if 'สวล' in self.column_name or 'สิ่งแวดล้อม' in self.column_name:
                 # Environmental temperature outliers
-                return float_value < -20 or float_value > 70
+                return (-20, 70)
             elif 'ร่างกาย' in self.column_name:
-                # Body temperature outliers  
-                return float_value < 25 or float_value > 50
+                # Body temperature outliers
+                return (25, 50)
         
         # Generic outlier detection
         if self.min_value is not None and self.max_value is not None:
             range_size = self.max_value - self.min_value
             outlier_threshold = range_size * 0.1  # 10% beyond range
-            return (float_value < self.min_value - outlier_threshold or 
-                   float_value > self.max_value + outlier_threshold)
+            return (self.min_value - outlier_threshold, self.max_value + outlier_threshold)
         
-        return False
\ No newline at end of file
+        return None
\ No newline at end of file
@@ -5,11 +5,70 @@ This module implements TextProcessor class for handling free-form text columns
 with UTF-8 encoding, normalization, cleaning, and length validation.
 """
 
+import functools
 import re
 import unicodedata
-from typing import Any, Optional, Dict, List
+from typing import Any, Callable, Optional, Dict, List, Tuple
+
+import pandas as pd
 from .base_validator import BaseValidator, ValidationResult
 
+# pyarrow is optional - whole-column cleaning with Arrow compute kernels in process_series
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+# Patterns compiled once at import instead of on every cell
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_URL_RE = re.compile(
+    r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
+)
+_WWW_RE = re.compile(r'www\.(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+
+# Common HTML entities decoded after tag removal
+_HTML_ENTITIES = {
+    '&amp;': '&',
+    '&lt;': '<',
+    '&gt;': '>',
+    '&quot;': '"',
+    '&#39;': "'",
+    '&nbsp;': ' '
+}
+
+# Every character str.isspace() accepts (what str.split()/strip() use); Arrow's
+# RE2 \s is ASCII-only, so the Arrow path spells the class out
+_UNICODE_WHITESPACE = (
+    '\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680'
+    '\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a'
+    '\u2028\u2029\u202f\u205f\u3000'
+)
+_ARROW_WHITESPACE_RUN = '[' + ''.join(f'\\x{{{ord(c):x}}}' for c in _UNICODE_WHITESPACE) + ']+'
+
+# Max distinct raw strings whose results are memoized per processor instance
+RESULT_CACHE_SIZE = 4096
+
+
+class _CharFilterTable(dict):
+    """
+    str.translate table for character filtering, filled on first sight
+    
+    Each code point is classified once by the predicate (kept as itself or
+    replaced with a space) and cached; later lookups stay in C.
+    """
+    
+    def __init__(self, should_preserve: Callable[[str], bool]):
+        super().__init__()
+        self._should_preserve = should_preserve
+    
+    def __missing__(self, codepoint: int) -> int:
+        mapped = codepoint if self._should_preserve(chr(codepoint)) else ord(' ')
+        self[codepoint] = mapped
+        return mapped
+
 
 class TextProcessor(BaseValidator):
     """
@@ -61,11 +120,102 @@ class TextProcessor(BaseValidator):
         
         # Setup column-specific cleaning rules
         self._setup_column_specific_rules()
+        
+        # Cleaning pipeline fixed for this column's settings: the enabled steps only,
+        # custom patterns compiled once (column rules above may have added some)
+        self._cleaning_steps = self._build_cleaning_steps()
+        
+        self._validate_cached = functools.lru_cache(maxsize=RESULT_CACHE_SIZE)(self._validate_impl)
+        
+        # Arrow kernels cover the built-in steps; custom regexes (Python syntax)
+        # and the per-character filter stay on the Python path
+        self._arrow_cleanable = (
+            PYARROW_AVAILABLE
+            and not self.custom_clean_patterns
+            and self.allow_special_chars
+            and self.encoding.lower() == 'utf-8'
+        )
     
     def process(self, value: Any) -> ValidationResult:
         """Process text value (required by abstract base class)"""
         return self.validate_and_process(value)
     
+    def process_series(self, values: pd.Series) -> pd.Series:
+        """
+        Clean a whole pandas Series of text
+        
+        With pyarrow and only built-in cleaning steps configured, the column
+        is cleaned by Arrow compute kernels in a few native passes. Otherwise
+        it goes through process_batch, so each distinct text is cleaned once
+        (location-like columns repeat heavily) and scattered back by code.
+        
+        Args:
+            values: pandas Series of raw text cells
+            
+        Returns:
+            Series of dtype 'string' on the same index; <NA> where the cell
+            is null or fails validation
+        """
+        if self._arrow_cleanable:
+            try:
+                texts = pa.array(values.astype('string'), type=pa.string())
+            except (pa.ArrowException, UnicodeError):
+                pass  # e.g. lone surrogates: the Python path drops them per cell
+            else:
+                cleaned = self._clean_arrow(texts)
+                return pd.Series(
+                    pd.array(cleaned, dtype=pd.StringDtype('pyarrow')),
+                    index=values.index, name=values.name
+                )
+        
+        valid, processed = self.process_batch(values)
+        processed[~valid] = None
+        return pd.Series(processed, index=values.index, name=values.name, dtype='string')
+    
+    def _clean_arrow(self, texts: 'pa.Array') -> 'pa.Array':
+        """
+        Arrow version of the validate_and_process pipeline for one column
+        
+        Same steps in the same order (NFKC, tags, entities, URLs, whitespace,
+        length); only over-length cells are truncated back in Python.
+        
+        Args:
+            texts: Arrow string array of raw cells
+            
+        Returns:
+            Arrow string array, null where the cell is null or fails validation
+        """
+        blank = pc.equal(pc.utf8_trim(texts, _UNICODE_WHITESPACE), '')
+        
+        if self.normalize_unicode:
+            texts = pc.utf8_normalize(texts, 'NFKC')
+        if self.remove_html:
+            texts = pc.replace_substring_regex(texts, _HTML_TAG_RE.pattern, '')
+            for entity, char in _HTML_ENTITIES.items():
+                texts = pc.replace_substring(texts, entity, char)
+        if self.remove_urls:
+            texts = pc.replace_substring_regex(texts, _URL_RE.pattern, '')
+            texts = pc.replace_substring_regex(texts, _WWW_RE.pattern, '')
+        if self.normalize_whitespace:
+            texts = pc.replace_substring_regex(texts, _ARROW_WHITESPACE_RUN, ' ')
+            texts = pc.utf8_trim(texts, _UNICODE_WHITESPACE)
+        
+        # Length rules: too short fails; too long fails or is truncated like _validate_and_handle_length
+        lengths = pc.utf8_length(texts)
+        failed = pc.or_(blank, pc.less(lengths, self.min_length))
+        too_long = pc.greater(lengths, self.max_length)
+        if self.truncate_on_length_exceed:
+            if pc.any(too_long).as_py():
+                truncated = [
+                    self._validate_and_handle_length(text)[1]
+                    for text in pc.filter(texts, too_long).to_pylist()
+                ]
+                texts = pc.replace_with_mask(texts, too_long, pa.array(truncated, type=pa.string()))
+        else:
+            failed = pc.or_(failed, too_long)
+        
+        return pc.if_else(failed, pa.scalar(None, pa.string()), texts)
+    
     def validate_and_process(self, value: Any) -> ValidationResult:
         """
         Validate and process a text value
@@ -76,18 +226,25 @@ class TextProcessor(BaseValidator):
         Returns:
             ValidationResult with processed text or error information
         """
+        # Repeated raw strings (the common case in CSV columns) reuse their result
+        if type(value) is str:
+            return self._validate_cached(value)
+        return self._validate_impl(value)
+    
+    def _validate_impl(self, value: Any) -> ValidationResult:
+        """Validate and process a text value (pure - string results are cached per instance)"""
         # Handle null/empty values
         if self.is_null_or_empty(value):
             return self.create_success_result(
                 processed_value=self.handle_null_value(),
                 original_value=value,
-                processing_notes=['Null text value handled']
+                processing_notes=('Null text value handled',)
             )
         
         try:
             # Convert to string
             str_value = str(value)
-            processing_notes = []
+            processing_notes = ()  # shared empty tuple until a note is added
             
             # Step 1: Encoding validation and normalization
             encoding_result = self._validate_and_normalize_encoding(str_value)
@@ -99,19 +256,19 @@ class TextProcessor(BaseValidator):
             
             processed_text = encoding_result[1]
             if encoding_result[2]:
-                processing_notes.extend(encoding_result[2])
+                processing_notes += tuple(encoding_result[2])
             
             # Step 2: Unicode normalization
             if self.normalize_unicode:
                 normalized_text = self._normalize_unicode(processed_text)
                 if normalized_text != processed_text:
-                    processing_notes.append('Unicode normalization applied')
+                    processing_notes += ('Unicode normalization applied',)
                     processed_text = normalized_text
             
             # Step 3: Content cleaning
             cleaned_text = self._clean_text_content(processed_text)
             if cleaned_text != processed_text:
-                processing_notes.append('Text cleaning applied')
+                processing_notes += ('Text cleaning applied',)
                 processed_text = cleaned_text
             
             # Step 4: Length validation
@@ -124,7 +281,7 @@ class TextProcessor(BaseValidator):
             
             processed_text = length_result[1]
             if length_result[2]:
-                processing_notes.append(length_result[2])
+                processing_notes += (length_result[2],)
             
             # Step 5: Final validation
             final_validation = self._final_text_validation(processed_text)
@@ -186,6 +343,10 @@ class TextProcessor(BaseValidator):
         Returns:
             Unicode-normalized text
         """
+        # ASCII text is already in NFKC form: skip the Unicode table walk
+        if text.isascii():
+            return text
+        
         # Use NFKC normalization (canonical decomposition, then canonical composition)
         # This handles things like combining characters and ligatures
         normalized = unicodedata.normalize('NFKC', text)
@@ -203,28 +364,41 @@ class TextProcessor(BaseValidator):
             Cleaned text
         """
         cleaned = text
+        for step in self._cleaning_steps:
+            cleaned = step(cleaned)
+        return cleaned
+    
+    def _build_cleaning_steps(self) -> Tuple[Callable[[str], str], ...]:
+        """
+        Resolve the cleaning settings once into the ordered steps to run
+        
+        Returns:
+            Tuple of str -> str callables applied in order by _clean_text_content
+        """
+        steps = []
         
         # Remove HTML tags if configured
         if self.remove_html:
-            cleaned = self._remove_html_tags(cleaned)
+            steps.append(self._remove_html_tags)
         
         # Remove URLs if configured
         if self.remove_urls:
-            cleaned = self._remove_urls(cleaned)
+            steps.append(self._remove_urls)
         
         # Apply custom cleaning patterns
         for pattern, replacement in self.custom_clean_patterns.items():
-            cleaned = re.sub(pattern, replacement, cleaned)
+            steps.append(functools.partial(re.compile(pattern).sub, replacement))
         
         # Character filtering based on preservation settings
         if not self.allow_special_chars:
-            cleaned = self._filter_characters(cleaned)
+            self._char_filter_table = _CharFilterTable(self._should_preserve_character)
+            steps.append(self._filter_characters)
         
         # Normalize whitespace if configured
         if self.normalize_whitespace:
-            cleaned = self._normalize_whitespace(cleaned)
+            steps.append(self._normalize_whitespace)
         
-        return cleaned
+        return tuple(steps)
     
     def _remove_html_tags(self, text: str) -> str:
         """
@@ -236,22 +410,18 @@ class TextProcessor(BaseValidator):
         Returns:
             Text with HTML tags removed
         """
+        # Each pass runs only when its marker character is present - most cells
+        # have no markup, so a C-level substring check replaces the whole scan
+        text_no_html = text
+        
         # Remove HTML tags
-        html_pattern = re.compile(r'<[^>]+>')
-        text_no_html = html_pattern.sub('', text)
+        if '<' in text_no_html:
+            text_no_html = _HTML_TAG_RE.sub('', text_no_html)
         
         # Decode common HTML entities
-        html_entities = {
-            '&amp;': '&',
-            '&lt;': '<',
-            '&gt;': '>',
-            '&quot;': '"',
-            '&#39;': "'",
-            '&nbsp;': ' '
-        }
-        
-        for entity, char in html_entities.items():
-            text_no_html = text_no_html.replace(entity, char)
+        if '&' in text_no_html:
+            for entity, char in _HTML_ENTITIES.items():
+                text_no_html = text_no_html.replace(entity, char)
         
         return text_no_html
     
@@ -265,16 +435,12 @@ class TextProcessor(BaseValidator):
         Returns:
             Text with URLs removed
         """
-        # Pattern to match various URL formats
-        url_pattern = re.compile(
-            r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
-        )
-        
-        # Also match www. patterns
-        www_pattern = re.compile(r'www\.(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
-        
-        text_no_urls = url_pattern.sub('', text)
-        text_no_urls = www_pattern.sub('', text_no_urls)
+        # Full URLs first, then bare www. addresses (skipped when absent)
+        text_no_urls = text
+        if '://' in text_no_urls:
+            text_no_urls = _URL_RE.sub('', text_no_urls)
+        if 'www.' in text_no_urls:
+            text_no_urls = _WWW_RE.sub('', text_no_urls)
         
         return text_no_urls
     
@@ -288,17 +454,8 @@ class TextProcessor(BaseValidator):
         Returns:
             Filtered text
         """
-        allowed_chars = []
-        
-        for char in text:
-            # Check if character should be preserved
-            if self._should_preserve_character(char):
-                allowed_chars.append(char)
-            else:
-                # Replace with space to avoid concatenation
-                allowed_chars.append(' ')
-        
-        return ''.join(allowed_chars)
+        # Disallowed characters become spaces to avoid concatenation
+        return text.translate(self._char_filter_table)
     
     def _should_preserve_character(self, char: str) -> bool:
         """
@@ -343,13 +500,9 @@ class TextProcessor(BaseValidator):
         Returns:
             Text with normalized whitespace
         """
-        # Replace multiple whitespace with single space
-        normalized = re.sub(r'\s+', ' ', text)
-        
-        # Strip leading and trailing whitespace
-        normalized = normalized.strip()
-        
-        return normalized
+        # Collapse whitespace runs to single spaces and trim both ends in one
+        # pass (str.split() uses the same whitespace definition as regex \s)
+        return ' '.join(text.split())
     
     def _validate_and_handle_length(self, text: str) -> tuple[bool, str, Optional[str]]:
         """
@@ -370,12 +523,10 @@ class TextProcessor(BaseValidator):
         # Check maximum length
         if text_length > self.max_length:
             if self.truncate_on_length_exceed:
-                truncated = text[:self.max_length]
-                # Try to truncate at word boundary if possible
-                if ' ' in truncated:
-                    last_space = truncated.rfind(' ')
-                    if last_space > self.max_length * 0.8:  # Only if we don't lose too much
-                        truncated = truncated[:last_space]
+                # Try to truncate at word boundary if possible - only a space past
+                # 80% of max_length counts, so search just that window in place
+                cut = text.rfind(' ', int(self.max_length * 0.8) + 1, self.max_length)
+                truncated = text[:cut if cut != -1 else self.max_length]
                 
                 return True, truncated, f'Text truncated from {text_length} to {len(truncated)} characters'
             else:
@@ -4,47 +4,125 @@ Time Processor for validating and processing time-related columns
 
 from typing import Any, Optional
 from datetime import time, datetime
+import functools
 import re
-from .base_validator import ValidationResult
 
+import pandas as pd
 
-class TimeProcessor:
+from .base_validator import BaseValidator, ValidationResult, VALID_NULL_RESULT
+
+# A cell must be exactly one time (like the schema pattern): HH:MM or
+# HH:MM:SS (groups 1-3), or HH.MM (groups 1 and 4), used with fullmatch()
+_TIME_RE = re.compile(r'(\d{1,2})(?::(\d{2})(?::(\d{2}))?|\.(\d{2}))')
+
+# Valid two-digit ASCII fields of a fixed-width time: one set lookup per field
+# replaces the digit check, int() and range check (and the text is already
+# in output form)
+_HOURS = frozenset(f'{i:02d}' for i in range(24))
+_MINUTES = frozenset(f'{i:02d}' for i in range(60))
+
+RESULT_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=RESULT_CACHE_SIZE)
+def _parse_time_text(value: str) -> ValidationResult:
+    """
+    Parse a raw time string (pure and config-independent, so one cache is
+    shared by all TimeProcessor instances)
+    
+    Args:
+        value: Raw cell text
+        
+    Returns:
+        ValidationResult with 'HH:MM:SS', the null result for blank text, or
+        the format error
+    """
+    value = value.strip()
+    if not value:
+        return VALID_NULL_RESULT
+    
+    # Fast path: valid fixed-width HH:MM:SS / HH:MM (the usual shape) needs no
+    # regex or int parsing; anything else (incl. non-ASCII digits) goes on
+    length = len(value)
+    if length == 8:
+        if (value[2] == ':' and value[5] == ':' and value[:2] in _HOURS
+                and value[3:5] in _MINUTES and value[6:] in _MINUTES):
+            return ValidationResult(True, value)
+    elif length == 5:
+        if value[2] == ':' and value[:2] in _HOURS and value[3:] in _MINUTES:
+            return ValidationResult(True, value + ':00')
+    
+    # Prose, 'N/A', '-' etc. cannot be a time: reject on the first character
+    # (isdecimal() is exactly \d) without entering the regex engine
+    match = _TIME_RE.fullmatch(value) if value[0].isdecimal() else None
+    if match:
+        hour, minute, second, dotted_minute = match.groups()
+        hour = int(hour)
+        minute = int(minute or dotted_minute)
+        second = int(second) if second else 0
+        
+        # Fields are unsigned digit runs, so only the upper bounds can fail
+        if hour < 24 and minute < 60 and second < 60:
+            return ValidationResult(True, f"{hour:02d}:{minute:02d}:{second:02d}")
+    
+    return ValidationResult(False, value, f"Invalid time format: {value}")
+
+
+def _format_time_of_day(value: time) -> ValidationResult:
+    """Format a datetime.time as 'HH:MM:SS'"""
+    return ValidationResult(True, f"{value.hour:02d}:{value.minute:02d}:{value.second:02d}")
+
+
+# Handlers for the exact input types a time column normally holds; anything
+# else (NaN/NA nulls, subclasses, unsupported types) takes the generic path
+_TYPE_HANDLERS = {
+    str: _parse_time_text,  # Repeated raw strings reuse their cached result
+    time: _format_time_of_day,
+    type(None): lambda value: VALID_NULL_RESULT,
+}
+
+
+class TimeProcessor(BaseValidator):
     """Process and validate time columns"""
     
+    __slots__ = ('column_name', 'config')
+    
     def __init__(self, column_name: str = None, validation_config: dict = None):
         self.column_name = column_name
         self.config = validation_config or {}
-        self.time_patterns = [
-            r'(\d{1,2}):(\d{2})(?::(\d{2}))?',  # HH:MM or HH:MM:SS
-            r'(\d{1,2})\.(\d{2})',  # HH.MM format
-        ]
     
     def process(self, value: Any) -> ValidationResult:
         """Process time value"""
-        if value is None or (isinstance(value, str) and value.strip() == ''):
-            return ValidationResult(True, None)
+        handler = _TYPE_HANDLERS.get(type(value))
+        if handler is not None:
+            return handler(value)
         
-        try:
-            if isinstance(value, time):
-                return ValidationResult(True, value.strftime('%H:%M:%S'))
-            
-            if isinstance(value, str):
-                value = value.strip()
-                
-                for pattern in self.time_patterns:
-                    match = re.search(pattern, value)
-                    if match:
-                        hour = int(match.group(1))
-                        minute = int(match.group(2))
-                        second = int(match.group(3)) if match.group(3) else 0
-                        
-                        if 0 <= hour <= 23 and 0 <= minute <= 59 and 0 <= second <= 59:
-                            time_obj = time(hour, minute, second)
-                            return ValidationResult(True, time_obj.strftime('%H:%M:%S'))
-                
-                return ValidationResult(False, value, f"Invalid time format: {value}")
-            
-            return ValidationResult(False, value, f"Unsupported time type: {type(value)}")
+        if self.is_null_or_empty(value):
+            return VALID_NULL_RESULT
+        
+        if isinstance(value, time):
+            return _format_time_of_day(value)
+        
+        if isinstance(value, str):
+            return _parse_time_text(value)
+        
+        return ValidationResult(False, value, f"Unsupported time type: {type(value)}")
+    
+    def process_series(self, values: pd.Series) -> pd.Series:
+        """
+        Normalize a whole pandas Series of times to 'HH:MM:SS' strings
+        
+        Goes through the inherited process_batch: the column is factorized
+        and each distinct cell parsed once (times of day repeat heavily, so
+        this beats vectorized string parsing of every row).
+        
+        Args:
+            values: pandas Series of raw time cells
             
-        except Exception as e:
-            return ValidationResult(False, value, f"Time processing error: {str(e)}")
\ No newline at end of file
+        Returns:
+            Series of dtype 'string' on the same index; <NA> where the cell
+            is null or invalid
+        """
+        valid, processed = self.process_batch(values)
+        processed[~valid] = None
+        return pd.Series(processed, index=values.index, name=values.name, dtype='string')
\ No newline at end of file